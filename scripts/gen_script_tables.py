@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""Generate turkicnlp/scripts/_script_tables.py from SCRIPT_RANGES.
+
+The script detector's codepoint lookup table only counts letters: every
+codepoint inside SCRIPT_RANGES whose Unicode general category is a number,
+punctuation, separator, symbol or control is neutral. Computing that needs
+a ``unicodedata.category`` call per codepoint, so the result is stored as a
+short list of ``(start, end, script)`` runs that the detector expands with
+slice assignments at import time.
+
+Usage:
+    python scripts/gen_script_tables.py          # rewrite the table module
+    python scripts/gen_script_tables.py --check  # exit 1 if it is stale
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import unicodedata
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from turkicnlp.scripts.detector import _LUT_SIZE, SCRIPT_RANGES  # noqa: E402
+
+OUTPUT = ROOT / "turkicnlp" / "scripts" / "_script_tables.py"
+NEUTRAL_CATEGORIES = ("N", "P", "Z", "S", "C")
+
+
+def compute_runs() -> list[tuple[int, int, str]]:
+    """Return sorted, maximal ``(start, end, script_code)`` letter runs."""
+    runs: list[tuple[int, int, str]] = []
+    for script, ranges in SCRIPT_RANGES.items():
+        for start, end in ranges:
+            run_start = None
+            for cp in range(start, min(end + 1, _LUT_SIZE)):
+                is_letter = not unicodedata.category(chr(cp)).startswith(NEUTRAL_CATEGORIES)
+                if is_letter and run_start is None:
+                    run_start = cp
+                elif not is_letter and run_start is not None:
+                    runs.append((run_start, cp - 1, script.value))
+                    run_start = None
+            if run_start is not None:
+                runs.append((run_start, min(end, _LUT_SIZE - 1), script.value))
+    runs.sort()
+
+    merged: list[tuple[int, int, str]] = []
+    for start, end, code in runs:
+        if merged and merged[-1][2] == code and merged[-1][1] + 1 == start:
+            merged[-1] = (merged[-1][0], end, code)
+        else:
+            merged.append((start, end, code))
+    return merged
+
+
+def render(runs: list[tuple[int, int, str]]) -> str:
+    lines = [
+        '"""Generated by scripts/gen_script_tables.py -- do not edit by hand."""',
+        "",
+        "from __future__ import annotations",
+        "",
+        f'UNICODE_VERSION = "{unicodedata.unidata_version}"',
+        "",
+        "# (first codepoint, last codepoint, ISO 15924 code) letter runs.",
+        "SCRIPT_LUT_RUNS: tuple[tuple[int, int, str], ...] = (",
+    ]
+    lines += [f'    (0x{start:05X}, 0x{end:05X}, "{code}"),' for start, end, code in runs]
+    lines += [")", ""]
+    return "\n".join(lines)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--check", action="store_true", help="Fail if the table is stale.")
+    args = parser.parse_args()
+
+    content = render(compute_runs())
+    if args.check:
+        if OUTPUT.read_text(encoding="utf-8") != content:
+            print(f"{OUTPUT} is out of date; rerun scripts/gen_script_tables.py")
+            return 1
+        return 0
+    OUTPUT.write_text(content, encoding="utf-8")
+    print(f"Wrote {OUTPUT}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
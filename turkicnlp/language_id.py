@@ -94,7 +94,7 @@ class LanguageDetection:
 
         labels: list[str] = []
         for lang, config in LANGUAGE_SCRIPTS.items():
-            for script in config.available:
+            for script in config.available_ordered:
                 labels.append(glotlid_label_for(lang, script.value))
         return labels
 
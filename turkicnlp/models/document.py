@@ -9,7 +9,7 @@ and write to this structure.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Iterator, Optional
 
 
 @dataclass
@@ -202,15 +202,26 @@ class Document:
 
     def to_conllu(self) -> str:
         """Export entire document as CoNLL-U."""
+        return "".join(self.iter_conllu_blocks())
+
+    def iter_conllu_blocks(self) -> Iterator[str]:
+        """Yield the CoNLL-U export piece by piece, one sentence block at a time.
+
+        Concatenated, the pieces equal :meth:`to_conllu`; writing them out
+        as they come avoids holding the whole export in memory.
+        """
         header: list[str] = []
         if self.lang:
             header.append(f"# lang = {self.lang}")
         if self.script:
             header.append(f"# script = {self.script}")
-        body = "\n\n".join(s.to_conllu() for s in self.sentences)
         if header:
-            return "\n".join(header) + "\n\n" + body + "\n\n"
-        return body + "\n\n"
+            yield "\n".join(header) + "\n\n"
+        for i, sentence in enumerate(self.sentences):
+            if i:
+                yield "\n\n"
+            yield sentence.to_conllu()
+        yield "\n\n"
 
     def to_dict(self) -> list[list[dict]]:
         """Export as nested dicts for JSON serialization."""
@@ -34,6 +34,9 @@ PROCESSOR_ORDER: list[str] = [
     "transliterate_back",
 ]
 
+# Position of each processor in PROCESSOR_ORDER, for O(1) ordering checks.
+PROCESSOR_ORDER_INDEX: dict[str, int] = {name: i for i, name in enumerate(PROCESSOR_ORDER)}
+
 
 class Pipeline:
     """Main entry point. Constructs a chain of Processors for a language
@@ -73,19 +76,11 @@ class Pipeline:
         self._processor_configs = processor_configs
         self._autoload = processors is not None
 
-        if script is None or script == "auto":
-            self._script: Optional[Script] = None
-            self._explicit_script = False
-        else:
-            self._script = Script(script)
-            self._explicit_script = True
-            if self._script not in self._script_config.available:
-                raise ValueError(
-                    f"Script '{script}' not available for {lang}. "
-                    f"Available: {[str(s) for s in self._script_config.available]}"
-                )
+        self._script: Optional[Script] = self._validate_script(lang, script)
+        self._explicit_script = self._script is not None
 
         self._transliterator: Optional[Transliterator] = None
+        self._reverse_transliterator: Optional[Transliterator] = None
         self._transliterate_back_enabled = False
 
         if transliterate_to:
@@ -94,7 +89,9 @@ class Pipeline:
             if target_script != source_script:
                 self._transliterator = Transliterator(lang, source_script, target_script)
                 try:
-                    Transliterator(lang, target_script, source_script)
+                    self._reverse_transliterator = Transliterator(
+                        lang, target_script, source_script
+                    )
                     self._transliterate_back_enabled = True
                 except ValueError:
                     self._transliterate_back_enabled = False
@@ -107,6 +104,26 @@ class Pipeline:
         if self._autoload:
             self._build_processors()
 
+    @staticmethod
+    def _validate_script(lang: str, script: Optional[str]) -> Optional[Script]:
+        """Check an explicit *script* against the language's script config.
+
+        Returns ``None`` for automatic detection (``None`` or ``"auto"``).
+
+        Raises:
+            ValueError: If *script* is not available for *lang*.
+        """
+        if script is None or script == "auto":
+            return None
+        resolved = Script(script)
+        script_config = get_script_config(lang)
+        if resolved not in script_config.available:
+            raise ValueError(
+                f"Script '{script}' not available for {lang}. "
+                f"Available: {[str(s) for s in script_config.available_ordered]}"
+            )
+        return resolved
+
     def _build_processors(self) -> None:
         """Resolve, download, and load processors."""
         if self._processors:
@@ -256,6 +273,36 @@ class Pipeline:
         if not self._processors:
             self._build_processors()
 
+        doc = self._new_document(text)
+        for processor in self._processors:
+            doc = processor.process(doc)
+        return self._finish_document(doc, text)
+
+    def batch(self, texts: list[str], batch_size: int = 32) -> list[Document]:
+        """Process multiple texts.
+
+        Each processor runs once over the whole batch through
+        :meth:`~turkicnlp.processors.base.Processor.bulk_process`, so
+        backends that batch across documents (Stanza, NLLB, the regex
+        tokenizer's process pool) see every text at once.
+
+        Args:
+            texts: List of input strings.
+            batch_size: Batch size for neural processors.
+
+        Returns:
+            List of annotated documents.
+        """
+        if not self._processors:
+            self._build_processors()
+
+        docs = [self._new_document(text) for text in texts]
+        for processor in self._processors:
+            docs = processor.bulk_process(docs)
+        return [self._finish_document(doc, text) for doc, text in zip(docs, texts)]
+
+    def _new_document(self, text: str) -> Document:
+        """Create a document for *text*, set its script and transliterate it."""
         doc = Document(text=text, lang=self.lang)
 
         if self._explicit_script:
@@ -267,40 +314,26 @@ class Pipeline:
             except ValueError:
                 doc.script = str(self._script_config.primary)
 
-        original_text = text
         if self._transliterator:
-            transliterated = self._transliterator.transliterate(text)
-            doc._original_text = original_text
-            doc.text = transliterated
-
-        for processor in self._processors:
-            doc = processor.process(doc)
+            doc._original_text = text
+            doc.text = self._transliterator.transliterate(text)
+        return doc
 
-        if self._transliterate_back_enabled and self._transliterator:
-            reverse_translit = Transliterator(
-                self.lang, self._transliterator.target, self._transliterator.source
-            )
-            for sentence in doc.sentences:
-                for word in sentence.words:
-                    if word.lemma:
-                        word.lemma = reverse_translit.transliterate(word.lemma)
+    def _finish_document(self, doc: Document, original_text: str) -> Document:
+        """Transliterate lemmas back to the input script if enabled."""
+        if self._transliterate_back_enabled and self._reverse_transliterator:
+            reverse_translit = self._reverse_transliterator
+            lemma_words = [
+                word for sentence in doc.sentences for word in sentence.words if word.lemma
+            ]
+            lemmas = reverse_translit.transliterate_batch([word.lemma for word in lemma_words])
+            for word, lemma in zip(lemma_words, lemmas):
+                word.lemma = lemma
             doc.text = original_text
             doc.script = str(self._script or detect_script(original_text))
 
         return doc
 
-    def batch(self, texts: list[str], batch_size: int = 32) -> list[Document]:
-        """Process multiple texts.
-
-        Args:
-            texts: List of input strings.
-            batch_size: Batch size for neural processors.
-
-        Returns:
-            List of annotated documents.
-        """
-        return [self(text) for text in texts]
-
     def process_file(
         self,
         input_path: str,
@@ -80,6 +80,20 @@ class Processor(ABC):
         """
         ...
 
+    def bulk_process(self, docs: list[Document]) -> list[Document]:
+        """Annotate several documents in place and return them.
+
+        The default runs :meth:`process` on each document in turn; backends
+        that can batch inference override it.
+
+        Args:
+            docs: The documents to annotate.
+
+        Returns:
+            The same documents, annotated in place.
+        """
+        return [self.process(doc) for doc in docs]
+
     def check_requirements(self, doc: Document) -> None:
         """Verify that required annotations and script compatibility are present.
 
@@ -115,7 +115,9 @@ class NLLBEmbeddingsProcessor(Processor):
             )
             hidden = out.last_hidden_state
             mask = encoded["attention_mask"].unsqueeze(-1)
-            pooled = (hidden * mask).sum(dim=1) / mask.sum(dim=1).clamp(min=1)
+            # No autograd graph under no_grad, so mask the encoder output in place.
+            hidden *= mask
+            pooled = hidden.sum(dim=1) / mask.sum(dim=1).clamp(min=1)
             if self._normalize:
                 pooled = self._torch.nn.functional.normalize(pooled, p=2, dim=1)
         return [[float(x) for x in row] for row in pooled.tolist()]
@@ -8,14 +8,16 @@ neural analyzer).
 
 from __future__ import annotations
 
+import functools
 import json
 import re
 import subprocess
+import sys
 import unicodedata
 from pathlib import Path
 from typing import Optional
 
-from turkicnlp.models.document import Document
+from turkicnlp.models.document import Document, Word
 from turkicnlp.processors.base import Processor
 from turkicnlp.scripts import Script, get_script_config
 from turkicnlp.scripts.transliterator import Transliterator
@@ -170,8 +172,12 @@ class ApertiumMorphProcessor(Processor):
             )
 
         for sentence in doc.sentences:
+            surfaces = [word.text for word in sentence.words]
+            if self._needs_translit and self._to_fst_translit:
+                surfaces = self._to_fst_translit.transliterate_batch(surfaces)
+
             readings_by_word: list[Optional[list[dict]]] = []
-            for idx, word in enumerate(sentence.words):
+            for word, surface in zip(sentence.words, surfaces):
                 if word.upos == "PUNCT" or self._is_punctuation_token(word.text):
                     word.lemma = word.text
                     word.upos = "PUNCT"
@@ -179,13 +185,10 @@ class ApertiumMorphProcessor(Processor):
                     readings_by_word.append(None)
                     continue
 
-                surface = word.text
-                if self._needs_translit and self._to_fst_translit:
-                    surface = self._to_fst_translit.transliterate(surface)
-
                 readings_by_word.append(self._analyze_with_fallback(surface))
 
             tagged_readings = self._tagger_disambiguate(sentence.words, readings_by_word)
+            fst_lemma_words: list[Word] = []
 
             for idx, word in enumerate(sentence.words):
                 readings = readings_by_word[idx]
@@ -221,15 +224,19 @@ class ApertiumMorphProcessor(Processor):
                         word_index=idx,
                         surface_text=word.text,
                     )
-                lemma = best["lemma"]
-                if self._needs_translit and self._from_fst_translit:
-                    lemma = self._from_fst_translit.transliterate(lemma)
-
-                word.lemma = lemma
+                word.lemma = best["lemma"]
+                fst_lemma_words.append(word)
                 word.upos = self._tag_mapper.to_ud_pos(best["pos"])
                 raw_feats = self._tag_mapper.to_ud_feats(best["feats"])
                 word.feats = self._normalize_ud_feats_for_upos(word.upos, raw_feats)
 
+            if fst_lemma_words and self._needs_translit and self._from_fst_translit:
+                lemmas = self._from_fst_translit.transliterate_batch(
+                    [word.lemma for word in fst_lemma_words]
+                )
+                for word, lemma in zip(fst_lemma_words, lemmas):
+                    word.lemma = lemma
+
         log_extra = ""
         if self._needs_translit and self.script and self._apertium_script:
             log_extra = f"(translit:{self.script}->{self._apertium_script})"
@@ -291,7 +298,9 @@ class ApertiumMorphProcessor(Processor):
         return "".join("-" if ch in self._HYPHEN_CHARS else ch for ch in text)
 
     @staticmethod
+    @functools.lru_cache(maxsize=1 << 16)
     def _strip_diacritics(text: str) -> str:
+        # Called for every word's lookup variants; word forms repeat heavily.
         decomposed = unicodedata.normalize("NFD", text)
         stripped = "".join(ch for ch in decomposed if unicodedata.category(ch) != "Mn")
         return unicodedata.normalize("NFC", stripped)
@@ -511,7 +520,7 @@ class ApertiumMorphProcessor(Processor):
         if not lemma_match:
             return None
         lemma = lemma_match.group(1)
-        tags = [t for t in re.findall(r"<([^>]+)>", analysis) if t]
+        tags = [sys.intern(t) for t in re.findall(r"<([^>]+)>", analysis) if t]
         if not tags:
             return None
         return lemma, tags[0], tags[1:]
@@ -656,7 +665,7 @@ class ApertiumMorphProcessor(Processor):
                 continue
             lemma = lemma_match.group(1)
 
-            tags = [t for t in re.findall(r"<([^>]+)>", clean) if t]
+            tags = [sys.intern(t) for t in re.findall(r"<([^>]+)>", clean) if t]
             if not tags:
                 continue
 
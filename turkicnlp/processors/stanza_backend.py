@@ -399,6 +399,26 @@ class _StanzaManager:
         doc._stanza_full_cache = result  # type: ignore[attr-defined]
         return result
 
+    @classmethod
+    def run_full_batch(cls, docs: list[Document], use_gpu: bool = False) -> list[Any]:
+        """Run the full Stanza pipeline over several documents, with caching.
+
+        Uncached documents are grouped by language and sent to Stanza as one
+        bulk call per language, so its internal batching spans documents.
+        """
+        pending: dict[str, list[Document]] = {}
+        for doc in docs:
+            if getattr(doc, "_stanza_full_cache", None) is None:
+                pending.setdefault(doc.lang, []).append(doc)
+        if pending:
+            stanza = _require_stanza()
+            for lang, lang_docs in pending.items():
+                pipeline = cls.get_full_pipeline(lang, use_gpu)
+                results = pipeline([stanza.Document([], text=doc.text) for doc in lang_docs])
+                for doc, result in zip(lang_docs, results):
+                    doc._stanza_full_cache = result  # type: ignore[attr-defined]
+        return [doc._stanza_full_cache for doc in docs]  # type: ignore[attr-defined]
+
     @classmethod
     def run_pretokenized(cls, doc: Document, use_gpu: bool = False) -> Any:
         """Run Stanza on pre-tokenized input, with caching."""
@@ -490,7 +510,6 @@ def _bio_to_spans(words: list[Word], tags: list[str]) -> list[Span]:
             continue
 
         if tag.startswith("I-") and current is not None:
-            current.text += f" {word.text}"
             current.end_char = word.end_char or current.end_char
             current.words.append(word)
             continue
@@ -501,6 +520,10 @@ def _bio_to_spans(words: list[Word], tags: list[str]) -> list[Span]:
 
     if current is not None:
         spans.append(current)
+    # Span text is joined once per entity rather than grown word by word.
+    for span in spans:
+        if len(span.words) > 1:
+            span.text = " ".join(w.text for w in span.words)
     return spans
 
 
@@ -529,6 +552,11 @@ class StanzaTokenizer(Processor):
         _StanzaManager.get_full_pipeline(self.lang, self._use_gpu)
         self._loaded = True
 
+    def bulk_process(self, docs: list[Document]) -> list[Document]:
+        """Tokenize several documents with one Stanza call per language."""
+        _StanzaManager.run_full_batch(docs, self._use_gpu)
+        return [self.process(doc) for doc in docs]
+
     def process(self, doc: Document) -> Document:
         """Tokenize text using Stanza, creating sentences, tokens, and words."""
         stanza_doc = _StanzaManager.run_full(doc, self._use_gpu)
@@ -8,11 +8,29 @@ and :class:`NeuralTokenizer` (BiLSTM character-level, for edge cases).
 from __future__ import annotations
 
 import re
-from typing import Optional
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional, Sequence
+
+import numpy as np
 
 from turkicnlp.models.document import Document, Sentence, Token, Word
 from turkicnlp.processors.base import Processor
 
+_WORKER_TOKENIZER: Optional[Processor] = None
+
+
+def _init_worker(cls: type[Processor], lang: str, script: object, config: dict) -> None:
+    """Build one tokenizer per worker process, reused for every text it gets."""
+    global _WORKER_TOKENIZER
+    _WORKER_TOKENIZER = cls(lang, script, config)
+    _WORKER_TOKENIZER.load(None)
+
+
+def _tokenize_in_worker(text: str) -> list[Sentence]:
+    assert _WORKER_TOKENIZER is not None
+    return _WORKER_TOKENIZER.process(Document(text=text)).sentences
+
 
 class RegexTokenizer(Processor):
     """Rule-based tokenizer for Latin/Cyrillic Turkic languages.
@@ -27,7 +45,10 @@ class RegexTokenizer(Processor):
 
     SENT_SPLIT = re.compile(r"(?<=[.!?])\s+")
     TOKEN_SPLIT = re.compile(r"(\S+)")
-    PUNCT_DETACH = re.compile(r'^(.*?)([.,:;!?"\'\)\]\}]+)$')
+    # Trailing punctuation detached from a token. Stripped with str.rstrip,
+    # which stays linear where a lazy ``^(.*?)([...]+)$`` regex goes
+    # quadratic on long punctuation runs.
+    TRAILING_PUNCT = ".,:;!?\"')]}"
 
     def __init__(
         self,
@@ -59,9 +80,8 @@ class RegexTokenizer(Processor):
                 raw_token = match.group()
                 token_start = char_offset + match.start()
 
-                punct_match = self.PUNCT_DETACH.match(raw_token)
-                if punct_match and punct_match.group(1):
-                    word_text = punct_match.group(1)
+                word_text = raw_token.rstrip(self.TRAILING_PUNCT)
+                if word_text and len(word_text) < len(raw_token):
                     word = Word(
                         id=word_id,
                         text=word_text,
@@ -79,7 +99,7 @@ class RegexTokenizer(Processor):
                     sentence.words.append(word)
                     word_id += 1
 
-                    punct_text = punct_match.group(2)
+                    punct_text = raw_token[len(word_text) :]
                     punct_start = token_start + len(word_text)
                     for ch in punct_text:
                         pw = Word(
@@ -125,6 +145,74 @@ class RegexTokenizer(Processor):
         doc._processor_log.append("tokenize:regex")
         return doc
 
+    def bulk_process(self, docs: list[Document]) -> list[Document]:
+        """Tokenize several documents, across processes if configured.
+
+        With ``num_workers`` > 1 in the config (``tokenize_num_workers`` on
+        the pipeline, used by :meth:`Pipeline.batch`), texts are sent to a
+        process pool whose workers each build their own tokenizer once; only
+        the texts and the resulting sentences cross process boundaries.
+        Worth it for large corpora only.
+        """
+        workers = int(self.config.get("num_workers", 1))
+        if workers <= 1 or len(docs) < 2:
+            return super().bulk_process(docs)
+        chunksize = max(1, len(docs) // (4 * workers))
+        initargs = (type(self), self.lang, self.script, self.config)
+        with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=initargs) as pool:
+            results = pool.map(_tokenize_in_worker, [doc.text for doc in docs], chunksize=chunksize)
+            for doc, sentences in zip(docs, results):
+                doc.sentences.extend(sentences)
+                doc._processor_log.append("tokenize:regex")
+        return docs
+
+    def tokenize_batch(self, texts: Sequence[str]) -> dict[str, np.ndarray]:
+        """Tokenize many texts into flat offset arrays instead of Word objects.
+
+        Segmentation follows :meth:`process`, but nothing is allocated per
+        word, which suits corpus-scale preprocessing. Offsets are exact
+        character positions in the input text.
+
+        Args:
+            texts: Raw texts to tokenize.
+
+        Returns:
+            Dict of equal-length integer arrays, one entry per word:
+            ``doc_id`` (index into *texts*), ``sent_id`` (sentence index,
+            running across the batch), ``starts`` and ``ends``.
+        """
+        doc_ids, sent_ids, starts, ends = array("i"), array("i"), array("i"), array("i")
+        sent_id = -1
+        for doc_id, text in enumerate(texts):
+            bounds = [0]
+            for sep in self.SENT_SPLIT.finditer(text):
+                bounds.extend(sep.span())
+            bounds.append(len(text))
+            for sent_start, sent_end in zip(bounds[::2], bounds[1::2]):
+                new_sentence = True
+                for match in self.TOKEN_SPLIT.finditer(text, sent_start, sent_end):
+                    if new_sentence:
+                        sent_id += 1
+                        new_sentence = False
+                    start, end = match.span()
+                    word_end = start + len(match.group().rstrip(self.TRAILING_PUNCT))
+                    if start < word_end < end:
+                        # The word, then each detached punctuation character.
+                        word_starts = [start, *range(word_end, end)]
+                        word_ends = [word_end, *range(word_end + 1, end + 1)]
+                    else:
+                        word_starts, word_ends = [start], [end]
+                    starts.extend(word_starts)
+                    ends.extend(word_ends)
+                    doc_ids.extend([doc_id] * len(word_starts))
+                    sent_ids.extend([sent_id] * len(word_starts))
+        return {
+            "doc_id": np.frombuffer(doc_ids, dtype=np.intc),
+            "sent_id": np.frombuffer(sent_ids, dtype=np.intc),
+            "starts": np.frombuffer(starts, dtype=np.intc),
+            "ends": np.frombuffer(ends, dtype=np.intc),
+        }
+
 
 class NeuralTokenizer(Processor):
     """Neural tokenizer based on a character-level BiLSTM.
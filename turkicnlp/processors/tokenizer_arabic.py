@@ -10,6 +10,8 @@ from __future__ import annotations
 import re
 from typing import Optional
 
+import regex
+
 from turkicnlp.models.document import Document, Sentence, Token, Word
 from turkicnlp.processors.base import Processor
 from turkicnlp.scripts import Script
@@ -34,7 +36,13 @@ class ArabicScriptTokenizer(Processor):
     SENT_SPLIT = re.compile(r"(?<=[.!?؟۔])\s+")
     ZWNJ = "\u200c"
     KASHIDA = "\u0640"
-    ARABIC_PUNCT = re.compile(r"([،؛؟!.\(\)\[\]«»\u201c\u201d'\"]+)")
+    # Unicode punctuation, except dashes, connectors (``_``) and the Arabic
+    # decimal/thousands separators, which stay inside words and numbers.
+    _PUNCT = r"\p{P}--[\p{Pd}\p{Pc}\u066b\u066c]"
+    TOKEN_SPLIT = re.compile(rf"[^\s{ZWNJ}]+")
+    # Group 1 is set only when the run is punctuation.
+    PUNCT_OR_TEXT = regex.compile(rf"([{_PUNCT}]+)|[^{_PUNCT}]+", regex.V1)
+    ALEF_VARIANTS = re.compile(r"[أإآٱ]")
 
     def __init__(
         self,
@@ -62,18 +70,15 @@ class ArabicScriptTokenizer(Processor):
             sentence = Sentence(text=sent_text)
 
             word_id = 1
-            token_pattern = re.compile(rf"[^\s{self.ZWNJ}]+")
-            parts_pattern = re.compile(r"[،؛؟!.\(\)\[\]«»\u201c\u201d'\"]+|[^،؛؟!.\(\)\[\]«»\u201c\u201d'\"]+")
-
-            for match in token_pattern.finditer(sent_text):
+            for match in self.TOKEN_SPLIT.finditer(sent_text):
                 raw_token = match.group()
                 raw_start = match.start()
 
-                for part_match in parts_pattern.finditer(raw_token):
+                for part_match in self.PUNCT_OR_TEXT.finditer(raw_token):
                     part_text = part_match.group()
                     part_start = char_offset + raw_start + part_match.start()
                     part_end = part_start + len(part_text)
-                    is_punct = bool(self.ARABIC_PUNCT.fullmatch(part_text))
+                    is_punct = part_match.group(1) is not None
 
                     word = Word(
                         id=word_id,
@@ -103,7 +108,7 @@ class ArabicScriptTokenizer(Processor):
     def _normalize(self, text: str) -> str:
         """Normalize Arabic script text (kashida removal, alef variants, etc.)."""
         text = text.replace(self.KASHIDA, "")
-        text = re.sub(r"[أإآٱ]", "ا", text)
+        text = self.ALEF_VARIANTS.sub("ا", text)
         for old, new in self._normalize_map.items():
             text = text.replace(old, new)
         return text
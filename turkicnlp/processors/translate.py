@@ -57,7 +57,7 @@ class NLLBTranslateProcessor(Processor):
         """Load NLLB tokenizer + seq2seq model for generation."""
         try:
             import torch
-            from transformers import AutoModelForSeq2SeqLM
+            from transformers import AutoModelForSeq2SeqLM  # noqa: F401
             try:
                 from transformers import NllbTokenizer as _NLLBTokenizer
             except ImportError:
@@ -71,6 +71,7 @@ class NLLBTranslateProcessor(Processor):
         self._torch = torch
         self._max_new_tokens = int(self.config.get("max_new_tokens", 256))
         self._num_beams = int(self.config.get("num_beams", 4))
+        self._batch_size = max(1, int(self.config.get("batch_size", 16)))
 
         model_name = self.config.get("model_name", _DEFAULT_MODEL)
         src_lang_raw = str(self.config.get("src_lang", self.lang))
@@ -84,8 +85,9 @@ class NLLBTranslateProcessor(Processor):
         print(
             f"  → Loading NLLB model '{model_name}' for translation from {load_from}"
         )
+        self._tgt_lang = tgt_lang
         self._tokenizer = _NLLBTokenizer.from_pretrained(load_from, src_lang=src_lang)
-        self._model = AutoModelForSeq2SeqLM.from_pretrained(load_from)
+        self._load_model(load_from, model_name)
         self._forced_bos_token_id = self._tokenizer.convert_tokens_to_ids(str(tgt_lang))
         if self._forced_bos_token_id is None or self._forced_bos_token_id < 0:
             raise ValueError(
@@ -95,6 +97,16 @@ class NLLBTranslateProcessor(Processor):
             )
         self._loaded = True
 
+    def _load_model(self, load_from: str, model_name: str) -> None:
+        from transformers import AutoModelForSeq2SeqLM
+
+        model_kwargs = {}
+        dtype = self.config.get("dtype")
+        if dtype:
+            # e.g. translate_dtype="float16" on GPU or "bfloat16" on recent CPUs.
+            model_kwargs["torch_dtype"] = getattr(self._torch, str(dtype))
+        self._model = AutoModelForSeq2SeqLM.from_pretrained(load_from, **model_kwargs)
+
     def _resolve_local_model_dir(self, model_name: str, model_path: Path) -> Path | None:
         try:
             from turkicnlp.resources.registry import ModelRegistry
@@ -122,13 +134,32 @@ class NLLBTranslateProcessor(Processor):
         return None
 
     def _translate_texts(self, texts: list[str]) -> list[str]:
+        """Translate *texts* in batches of at most ``batch_size`` sentences.
+
+        When more than one batch is needed, sentences are grouped by length
+        so each batch pads to a similar size; outputs keep the input order.
+        """
+        size = self._batch_size
+        if len(texts) <= size:
+            return self._generate(texts)
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+        translated: list[str] = [""] * len(texts)
+        for start in range(0, len(order), size):
+            batch = order[start : start + size]
+            for i, output in zip(batch, self._generate([texts[i] for i in batch])):
+                translated[i] = output
+        return translated
+
+    def _generate(self, texts: list[str]) -> list[str]:
         encoded = self._tokenizer(
             texts,
             return_tensors="pt",
             padding=True,
             truncation=True,
         )
-        with self._torch.no_grad():
+        # inference_mode (torch >= 1.9) also skips autograd version tracking.
+        no_grad = getattr(self._torch, "inference_mode", self._torch.no_grad)
+        with no_grad():
             generated = self._model.generate(
                 input_ids=encoded["input_ids"],
                 attention_mask=encoded["attention_mask"],
@@ -140,19 +171,88 @@ class NLLBTranslateProcessor(Processor):
 
     def process(self, doc: Document) -> Document:
         """Attach sentence and document translation output."""
+        return self.bulk_process([doc])[0]
+
+    def bulk_process(self, docs: list[Document]) -> list[Document]:
+        """Translate the sentences of several documents in shared batches."""
         if not self._loaded:
             raise RuntimeError("NLLBTranslateProcessor must be loaded before use.")
 
-        if doc.sentences:
-            texts = [s.text for s in doc.sentences]
+        texts: list[str] = []
+        for doc in docs:
+            if not doc.sentences:
+                doc.sentences = [Sentence(text=doc.text)]
+            texts.extend(s.text for s in doc.sentences)
+        if not texts:
+            return docs
+
+        translated = iter(self._translate_texts(texts))
+        for doc in docs:
+            outputs = []
+            for sentence in doc.sentences:
+                sentence.translation = next(translated)
+                outputs.append(sentence.translation)
+            doc.translation = "\n".join(outputs)
+            doc._processor_log.append("translate:nllb")
+        return docs
+
+
+class NLLBCTranslate2Processor(NLLBTranslateProcessor):
+    """Run NLLB through CTranslate2 with int8 (or other quantized) weights.
+
+    The HuggingFace checkpoint is converted once with the requested
+    ``compute_type`` and cached under ``<models>/ctranslate2/``; the
+    tokenizer and language handling are shared with
+    :class:`NLLBTranslateProcessor`.
+    """
+
+    def _load_model(self, load_from: str, model_name: str) -> None:
+        try:
+            import ctranslate2
+        except ImportError as exc:
+            raise ImportError(
+                "The CTranslate2 NLLB backend requires `ctranslate2`. "
+                "Install with: pip install turkicnlp[translation] ctranslate2"
+            ) from exc
+        from turkicnlp.resources.registry import ModelRegistry
+
+        compute_type = str(self.config.get("compute_type", "int8"))
+        converted = self.config.get("ct2_model_dir")
+        if converted:
+            model_dir = Path(converted)
         else:
-            texts = [doc.text]
-            doc.sentences = [Sentence(text=doc.text)]
+            model_dir = (
+                ModelRegistry.default_dir()
+                / "ctranslate2"
+                / f"{str(model_name).replace('/', '--')}-{compute_type}"
+            )
+        if not (model_dir / "model.bin").exists():
+            print(f"  → Converting '{model_name}' to CTranslate2 ({compute_type}) at {model_dir}")
+            converter = ctranslate2.converters.TransformersConverter(load_from)
+            converter.convert(str(model_dir), quantization=compute_type)
 
-        translated = self._translate_texts(texts)
-        for sentence, text in zip(doc.sentences, translated):
-            sentence.translation = text
+        use_gpu = self.config.get("use_gpu") and ctranslate2.get_cuda_device_count() > 0
+        self._translator = ctranslate2.Translator(
+            str(model_dir), device="cuda" if use_gpu else "cpu", compute_type=compute_type
+        )
 
-        doc.translation = "\n".join(translated)
-        doc._processor_log.append("translate:nllb")
-        return doc
+    def _generate(self, texts: list[str]) -> list[str]:
+        tokenizer = self._tokenizer
+        source = [
+            tokenizer.convert_ids_to_tokens(tokenizer.encode(text, truncation=True))
+            for text in texts
+        ]
+        results = self._translator.translate_batch(
+            source,
+            target_prefix=[[self._tgt_lang]] * len(texts),
+            beam_size=self._num_beams,
+            max_decoding_length=self._max_new_tokens,
+        )
+        # Each hypothesis starts with the forced target-language token.
+        return [
+            tokenizer.decode(
+                tokenizer.convert_tokens_to_ids(result.hypotheses[0][1:]),
+                skip_special_tokens=True,
+            )
+            for result in results
+        ]
@@ -3,12 +3,15 @@ Model and FST data download manager for TurkicNLP.
 
 Downloads neural model archives and Apertium FST transducers on demand.
 Apertium data (GPL-3.0) is stored separately with license files alongside.
+Extracted FST and neural model files are deduplicated by content into a
+shared ``_blobs`` store, with the per-language copies hardlinked to it.
 """
 
 from __future__ import annotations
 
 import hashlib
 import json
+import os
 import urllib.request
 import zipfile
 from pathlib import Path
@@ -60,6 +63,7 @@ def download(
 
     base_dir = Path(model_dir) if model_dir else ModelRegistry.default_dir()
     base_dir.mkdir(parents=True, exist_ok=True)
+    blob_dir = base_dir / "_blobs"
     stanza_checked: set[str] = set()
     stanza_custom_checked: set[str] = set()
     hf_checked: set[str] = set()
@@ -93,7 +97,7 @@ def download(
                         continue
                     dest.mkdir(parents=True, exist_ok=True)
                     print(f"  ↓ Downloading Apertium FST for {lang}/{scr}/{proc_name} (apertium)")
-                    _download_apertium_fst(lang, scr, proc_name, backend_info, dest)
+                    _download_apertium_fst(lang, scr, proc_name, backend_info, dest, blob_dir)
                 elif backend_type == "neural_model":
                     if (dest / "metadata.json").exists() and not force:
                         continue
@@ -102,7 +106,7 @@ def download(
                         f"  ↓ Downloading neural model for {lang}/{scr}/{proc_name} "
                         f"(backend={backend_name})"
                     )
-                    _download_neural_model(lang, scr, proc_name, backend_info, dest)
+                    _download_neural_model(lang, scr, proc_name, backend_info, dest, blob_dir)
                 elif backend_type == "stanza_custom":
                     if lang not in stanza_custom_checked:
                         dest_dir = base_dir / "stanza_custom" / lang
@@ -233,7 +237,12 @@ def list_scripts(lang: str) -> dict:
 
 
 def _download_apertium_fst(
-    lang: str, script: str, proc_name: str, backend_info: dict, dest: Path
+    lang: str,
+    script: str,
+    proc_name: str,
+    backend_info: dict,
+    dest: Path,
+    blob_dir: Path | None = None,
 ) -> None:
     """Download Apertium FST files (GPL-3.0) with license isolation."""
     url = backend_info.get("url")
@@ -254,8 +263,7 @@ def _download_apertium_fst(
                 f"SHA-256 mismatch for {archive_path}: expected {expected_sha}, got {actual_sha}"
             )
 
-    with zipfile.ZipFile(archive_path, "r") as zf:
-        zf.extractall(dest)
+    _extract_zip(archive_path, dest)
 
     try:
         archive_path.unlink()
@@ -280,6 +288,9 @@ def _download_apertium_fst(
         except OSError:
             pass
 
+    if blob_dir is not None:
+        _dedup_into_blobs(dest, blob_dir)
+
     metadata = {
         "lang": lang,
         "script": backend_info.get("script", script),
@@ -290,8 +301,14 @@ def _download_apertium_fst(
     }
     (dest / "metadata.json").write_text(json.dumps(metadata, indent=2) + "\n")
 
+
 def _download_neural_model(
-    lang: str, script: str, proc_name: str, backend_info: dict, dest: Path
+    lang: str,
+    script: str,
+    proc_name: str,
+    backend_info: dict,
+    dest: Path,
+    blob_dir: Path | None = None,
 ) -> None:
     """Download a neural model archive."""
     url = backend_info.get("url")
@@ -312,14 +329,16 @@ def _download_neural_model(
                 f"SHA-256 mismatch for {archive_path}: expected {expected_sha}, got {actual_sha}"
             )
 
-    with zipfile.ZipFile(archive_path, "r") as zf:
-        zf.extractall(dest)
+    _extract_zip(archive_path, dest)
 
     try:
         archive_path.unlink()
     except FileNotFoundError:
         pass
 
+    if blob_dir is not None:
+        _dedup_into_blobs(dest, blob_dir)
+
     metadata = {
         "lang": lang,
         "script": script,
@@ -524,6 +543,57 @@ def _sha256(path: Path) -> str:
     return h.hexdigest()
 
 
+def _extract_zip(archive_path: Path, dest: Path) -> None:
+    """Extract *archive_path* into *dest* without writing through hardlinks.
+
+    Files under *dest* may be hardlinks into the shared blob store (see
+    :func:`_dedup_into_blobs`). ``ZipFile.extractall`` opens existing paths
+    for writing in place, which would change every language sharing the
+    blob, so existing target files are unlinked before extraction.
+    """
+    with zipfile.ZipFile(archive_path, "r") as zf:
+        for name in zf.namelist():
+            if name.startswith("/") or ".." in name.split("/"):
+                continue  # extractall sanitizes these; never unlink outside dest
+            target = dest / name
+            if target.is_file() or target.is_symlink():
+                target.unlink()
+        zf.extractall(dest)
+
+
+def _dedup_into_blobs(dest: Path, blob_dir: Path) -> None:
+    """Hardlink every file under *dest* to a content-addressed blob.
+
+    Blobs live at ``{blob_dir}/{sha[:2]}/{sha}``. The first copy of a file
+    becomes the blob; later identical files (e.g. FSTs shared between
+    related languages) are replaced by hardlinks to it. ``metadata.json``
+    is left alone. On filesystems
+    without hardlink support the extracted copy is simply kept.
+    """
+    files = (p for p in dest.rglob("*") if p.is_file() and not p.is_symlink())
+    # metadata.json is rewritten in place after every download; as a blob link
+    # that write would change the shared blob under its content hash.
+    for path in sorted(p for p in files if p.name != "metadata.json"):
+        digest = _sha256(path)
+        blob = blob_dir / digest[:2] / digest
+        try:
+            blob.parent.mkdir(parents=True, exist_ok=True)
+            if not blob.exists():
+                os.link(path, blob)
+                continue
+            if os.path.samefile(path, blob):
+                continue
+            tmp_link = path.with_name(f"{path.name}.blobtmp")
+            os.link(blob, tmp_link)
+            try:
+                tmp_link.replace(path)
+            except OSError:
+                tmp_link.unlink(missing_ok=True)
+                raise
+        except OSError:
+            continue
+
+
 def _merge_files(parts: list[Path], output_path: Path) -> None:
     """Merge binary file parts into a single output file."""
     tmp_path = output_path.with_name(f"{output_path.name}.tmp")
@@ -8,10 +8,11 @@ download, and path resolution with script-aware directory layout.
 
 from __future__ import annotations
 
+import importlib
 import json
 import os
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Union
 
 DEFAULT_MODEL_DIR = Path.home() / ".turkicnlp" / "models"
 
@@ -120,27 +121,44 @@ class ProcessorRegistry:
     New processors self-register via :meth:`register`.
     """
 
-    _registry: dict[str, dict[str, type]] = {}
+    _registry: dict[str, dict[str, Union[type, str]]] = {}
 
     @classmethod
-    def register(cls, name: str, backend: str, proc_class: type) -> None:
+    def register(cls, name: str, backend: str, proc_class: Union[type, str]) -> None:
         """Register a processor implementation.
 
         Args:
             name: Processor name (e.g. ``tokenize``, ``pos``).
             backend: Backend identifier (e.g. ``rule``, ``neural``, ``apertium``).
-            proc_class: The processor class.
+            proc_class: The processor class, or its ``"module:Class"`` import
+                path. A path defers importing the module (and its heavy
+                dependencies) until the backend is first requested.
         """
         if name not in cls._registry:
             cls._registry[name] = {}
         cls._registry[name][backend] = proc_class
 
+    @classmethod
+    def _resolve(cls, name: str, backend: str) -> type:
+        entry = cls._registry[name][backend]
+        if isinstance(entry, str):
+            module_name, _, class_name = entry.partition(":")
+            try:
+                entry = getattr(importlib.import_module(module_name), class_name)
+            except ImportError as exc:
+                raise ImportError(
+                    f"Backend '{backend}' for processor '{name}' could not be imported: {exc}"
+                ) from exc
+            cls._registry[name][backend] = entry
+        return entry
+
     @classmethod
     def get(cls, name: str, backend: str) -> type:
         """Get a specific processor class by name and backend.
 
         Raises:
             ValueError: If processor or backend is not registered.
+            ImportError: If a lazily registered backend's dependencies are missing.
         """
         if name not in cls._registry:
             raise ValueError(f"Unknown processor: {name}")
@@ -149,14 +167,19 @@ class ProcessorRegistry:
                 f"Backend '{backend}' not available for processor '{name}'. "
                 f"Available: {list(cls._registry[name].keys())}"
             )
-        return cls._registry[name][backend]
+        return cls._resolve(name, backend)
 
     @classmethod
     def get_any(cls, name: str) -> type:
-        """Get any implementation of a processor (for dependency checking)."""
+        """Get any importable implementation of a processor (for dependency checking)."""
         if name not in cls._registry:
             raise ValueError(f"Unknown processor: {name}")
-        return next(iter(cls._registry[name].values()))
+        for backend in cls._registry[name]:
+            try:
+                return cls._resolve(name, backend)
+            except ImportError:
+                continue
+        raise ValueError(f"No importable backend for processor: {name}")
 
     @classmethod
     def available_for(
@@ -207,7 +230,7 @@ def _register_builtins() -> None:
     from turkicnlp.processors.ner import NERProcessor
     from turkicnlp.processors.sentiment import SentimentProcessor
     from turkicnlp.processors.embeddings import NLLBEmbeddingsProcessor
-    from turkicnlp.processors.translate import NLLBTranslateProcessor
+    from turkicnlp.processors.translate import NLLBCTranslate2Processor, NLLBTranslateProcessor
     from turkicnlp.processors.stanza_backend import (
         StanzaTokenizer,
         StanzaMWTExpander,
@@ -235,31 +258,28 @@ def _register_builtins() -> None:
     ProcessorRegistry.register("ner", "neural", NERProcessor)
     ProcessorRegistry.register("sentiment", "neural", SentimentProcessor)
 
-    # Multilingual Glot500 backend (requires torch + transformers)
-    try:
-        from turkicnlp.processors.multilingual_backend import (
-            MultilingualPOSTagger,
-            MultilingualDepParser,
-        )
-        ProcessorRegistry.register("pos", "multilingual_glot500_model", MultilingualPOSTagger)
-        ProcessorRegistry.register("depparse", "multilingual_glot500_model", MultilingualDepParser)
-    except ImportError:
-        pass  # torch/transformers not installed; multilingual backend unavailable
-
-    # Multilingual Glot500 morph analyzer backend (requires torch + transformers)
-    try:
-        from turkicnlp.processors.multilingual_morph_backend import (
-            MultilingualMorphAnalyzer,
-            MultilingualMorphFeats,
-            MultilingualMorphLemmatizer,
-        )
-        ProcessorRegistry.register("morph_neural", "multilingual_glot500_morph", MultilingualMorphAnalyzer)
-        ProcessorRegistry.register("feats", "multilingual_glot500_morph", MultilingualMorphFeats)
-        ProcessorRegistry.register("lemma", "multilingual_glot500_morph", MultilingualMorphLemmatizer)
-    except ImportError:
-        pass  # torch/transformers not installed; multilingual morph backend unavailable
+    # Multilingual Glot500 backends import torch + transformers at module
+    # level, so they are registered by path and imported on first use.
+    glot500 = "turkicnlp.processors.multilingual_backend"
+    glot500_morph = "turkicnlp.processors.multilingual_morph_backend"
+    ProcessorRegistry.register(
+        "pos", "multilingual_glot500_model", f"{glot500}:MultilingualPOSTagger"
+    )
+    ProcessorRegistry.register(
+        "depparse", "multilingual_glot500_model", f"{glot500}:MultilingualDepParser"
+    )
+    ProcessorRegistry.register(
+        "morph_neural", "multilingual_glot500_morph", f"{glot500_morph}:MultilingualMorphAnalyzer"
+    )
+    ProcessorRegistry.register(
+        "feats", "multilingual_glot500_morph", f"{glot500_morph}:MultilingualMorphFeats"
+    )
+    ProcessorRegistry.register(
+        "lemma", "multilingual_glot500_morph", f"{glot500_morph}:MultilingualMorphLemmatizer"
+    )
     ProcessorRegistry.register("embeddings", "nllb", NLLBEmbeddingsProcessor)
     ProcessorRegistry.register("translate", "nllb", NLLBTranslateProcessor)
+    ProcessorRegistry.register("translate", "nllb_ct2", NLLBCTranslate2Processor)
 
 
 _register_builtins()
@@ -1,89 +1,53 @@
 """
 Apertium → Universal Dependencies tag mapping system.
 
-Each language has its own mapping module that translates Apertium
-morphological tags to UD UPOS and feature strings.
+All Apertium languages share :class:`CommonTurkicTagMapper`; the small
+per-language feature overrides live in a single ``feats.json`` resource
+that is parsed once on first use.
 """
 
 from __future__ import annotations
 
-from turkicnlp.resources.tag_mappings.base import TagMapper
+import functools
+import json
+from importlib import resources
+from types import MappingProxyType
 
+from turkicnlp.resources.tag_mappings.base import TagMapper, intern_feat_map
+from turkicnlp.resources.tag_mappings.turkic_common import CommonTurkicTagMapper
 
+_FEATS_CACHE: dict[str, dict[str, str]] | None = None
+
+
+def _load_feat_overrides() -> dict[str, dict[str, str]]:
+    global _FEATS_CACHE
+    if _FEATS_CACHE is None:
+        path = resources.files("turkicnlp.resources.tag_mappings").joinpath("feats.json")
+        languages = json.loads(path.read_text(encoding="utf-8"))["languages"]
+        _FEATS_CACHE = {lang: intern_feat_map(feats) for lang, feats in languages.items()}
+    return _FEATS_CACHE
+
+
+@functools.lru_cache(maxsize=None)
 def load_tag_map(lang: str) -> TagMapper:
     """Load the tag mapper for a given language.
 
+    Languages listed in ``feats.json`` get a :class:`CommonTurkicTagMapper`
+    whose feature map layers the language-specific overrides over the
+    shared common table.
+    Any other language falls back to a bare :class:`TagMapper`.
+    Mappers are stateless and their feature maps read-only, so one
+    instance per language is cached and shared by every caller.
+
     Args:
         lang: ISO 639-3 language code.
 
     Returns:
         A :class:`TagMapper` instance for the language.
-
-    Raises:
-        ValueError: If no tag mapping exists for the language.
     """
-    if lang == "kaz":
-        from turkicnlp.resources.tag_mappings.kaz import KazakhTagMapper
-        return KazakhTagMapper()
-    elif lang == "tat":
-        from turkicnlp.resources.tag_mappings.tat import TatarTagMapper
-        return TatarTagMapper()
-    elif lang == "tur":
-        from turkicnlp.resources.tag_mappings.tur import TurkishTagMapper
-        return TurkishTagMapper()
-    elif lang == "tuk":
-        from turkicnlp.resources.tag_mappings.tuk import TurkmenTagMapper
-        return TurkmenTagMapper()
-    elif lang == "alt":
-        from turkicnlp.resources.tag_mappings.alt import AltaiTagMapper
-        return AltaiTagMapper()
-    elif lang == "aze":
-        from turkicnlp.resources.tag_mappings.aze import AzerbaijaniTagMapper
-        return AzerbaijaniTagMapper()
-    elif lang == "azb":
-        from turkicnlp.resources.tag_mappings.azb import SouthAzerbaijaniTagMapper
-        return SouthAzerbaijaniTagMapper()
-    elif lang == "bak":
-        from turkicnlp.resources.tag_mappings.bak import BashkirTagMapper
-        return BashkirTagMapper()
-    elif lang == "chv":
-        from turkicnlp.resources.tag_mappings.chv import ChuvashTagMapper
-        return ChuvashTagMapper()
-    elif lang == "crh":
-        from turkicnlp.resources.tag_mappings.crh import CrimeanTatarTagMapper
-        return CrimeanTatarTagMapper()
-    elif lang == "gag":
-        from turkicnlp.resources.tag_mappings.gag import GagauzTagMapper
-        return GagauzTagMapper()
-    elif lang == "kaa":
-        from turkicnlp.resources.tag_mappings.kaa import KarakalpakTagMapper
-        return KarakalpakTagMapper()
-    elif lang == "kir":
-        from turkicnlp.resources.tag_mappings.kir import KyrgyzTagMapper
-        return KyrgyzTagMapper()
-    elif lang == "kjh":
-        from turkicnlp.resources.tag_mappings.kjh import KhakasTagMapper
-        return KhakasTagMapper()
-    elif lang == "krc":
-        from turkicnlp.resources.tag_mappings.krc import KarachayBalkarTagMapper
-        return KarachayBalkarTagMapper()
-    elif lang == "kum":
-        from turkicnlp.resources.tag_mappings.kum import KumykTagMapper
-        return KumykTagMapper()
-    elif lang == "nog":
-        from turkicnlp.resources.tag_mappings.nog import NogaiTagMapper
-        return NogaiTagMapper()
-    elif lang == "sah":
-        from turkicnlp.resources.tag_mappings.sah import SakhaTagMapper
-        return SakhaTagMapper()
-    elif lang == "tyv":
-        from turkicnlp.resources.tag_mappings.tyv import TuvanTagMapper
-        return TuvanTagMapper()
-    elif lang == "uig":
-        from turkicnlp.resources.tag_mappings.uig import UyghurTagMapper
-        return UyghurTagMapper()
-    elif lang == "uzb":
-        from turkicnlp.resources.tag_mappings.uzb import UzbekTagMapper
-        return UzbekTagMapper()
-    else:
+    overrides = _load_feat_overrides().get(lang)
+    if overrides is None:
         return TagMapper()
+    mapper = CommonTurkicTagMapper()
+    mapper.FEAT_MAP = MappingProxyType({**CommonTurkicTagMapper.FEAT_MAP, **overrides})
+    return mapper
@@ -1,15 +0,0 @@
-"""Altai Apertium -> UD tag mapping."""
-
-from __future__ import annotations
-
-from turkicnlp.resources.tag_mappings.turkic_common import CommonTurkicTagMapper
-
-
-class AltaiTagMapper(CommonTurkicTagMapper):
-    """Tag mapper for Altai (apertium-alt)."""
-
-    FEAT_MAP: dict[str, str] = {
-        **CommonTurkicTagMapper.FEAT_MAP,
-        "evid": "Evident=Nfh",
-        "cvb": "VerbForm=Conv",
-    }
@@ -1,10 +0,0 @@
-"""Apertium → UD tag mapping for South Azerbaijani (azb)."""
-
-from __future__ import annotations
-
-from turkicnlp.resources.tag_mappings.aze import AzerbaijaniTagMapper
-
-
-class SouthAzerbaijaniTagMapper(AzerbaijaniTagMapper):
-    """Reuse Azerbaijani mapping for azb."""
-
@@ -4,6 +4,9 @@ Base class for Apertium → UD tag mapping.
 
 from __future__ import annotations
 
+import sys
+from collections.abc import Mapping
+
 
 # Default Apertium POS → UD UPOS mapping (shared across languages)
 DEFAULT_POS_MAP: dict[str, str] = {
@@ -37,7 +40,12 @@ class TagMapper:
     """
 
     POS_MAP: dict[str, str] = DEFAULT_POS_MAP
-    FEAT_MAP: dict[str, str] = {}
+    FEAT_MAP: Mapping[str, str] = {}
+
+    def __init_subclass__(cls, **kwargs: object) -> None:
+        super().__init_subclass__(**kwargs)
+        if "FEAT_MAP" in cls.__dict__:
+            cls.FEAT_MAP = intern_feat_map(cls.FEAT_MAP)
 
     def to_ud_pos(self, apertium_pos: str) -> str:
         """Convert an Apertium POS tag to UD UPOS.
@@ -73,10 +81,20 @@ class TagMapper:
         """
         ud_feats: list[str] = []
         unknown: list[str] = []
+        feat_get = self.FEAT_MAP.get
         for feat in apertium_feats:
-            mapped = self.FEAT_MAP.get(feat)
+            mapped = feat_get(feat)
             if mapped is None:
                 unknown.append(feat)
             else:
                 ud_feats.append(mapped)
         return ud_feats, unknown
+
+
+def intern_feat_map(feat_map: Mapping[str, str]) -> dict[str, str]:
+    """Return a copy of *feat_map* with all keys and values interned.
+
+    Interned tag keys let lookups with interned Apertium tags short-circuit
+    on identity, and interned UD values are shared across all output words.
+    """
+    return {sys.intern(k): sys.intern(v) for k, v in feat_map.items()}
@@ -1,15 +0,0 @@
-"""Khakas Apertium -> UD tag mapping."""
-
-from __future__ import annotations
-
-from turkicnlp.resources.tag_mappings.turkic_common import CommonTurkicTagMapper
-
-
-class KhakasTagMapper(CommonTurkicTagMapper):
-    """Tag mapper for Khakas (apertium-kjh)."""
-
-    FEAT_MAP: dict[str, str] = {
-        **CommonTurkicTagMapper.FEAT_MAP,
-        "evid": "Evident=Nfh",
-        "cvb": "VerbForm=Conv",
-    }
@@ -1,19 +1,21 @@
 """Shared Apertium -> UD tag mapping for Turkic languages.
 
-This mapper is used for languages that currently do not have a dedicated
-language-specific mapping module yet. It captures common Turkic morphology
-tags used across Apertium analyzers.
+This mapper captures common Turkic morphology tags used across Apertium
+analyzers. Language-specific additions are layered on top of it from
+``feats.json`` by :func:`~turkicnlp.resources.tag_mappings.load_tag_map`.
 """
 
 from __future__ import annotations
 
+from collections.abc import Mapping
+
 from turkicnlp.resources.tag_mappings.base import TagMapper
 
 
 class CommonTurkicTagMapper(TagMapper):
     """Common Turkic mapper used as a strong default for multiple languages."""
 
-    FEAT_MAP: dict[str, str] = {
+    FEAT_MAP: Mapping[str, str] = {
         # Case
         "nom": "Case=Nom",
         "gen": "Case=Gen",
@@ -51,7 +53,6 @@ class CommonTurkicTagMapper(TagMapper):
         "prog": "Aspect=Prog",
         "perf": "Aspect=Perf",
         # Mood
-        "ind": "Mood=Ind",
         "imp": "Mood=Imp",
         "opt": "Mood=Opt",
         "cond": "Mood=Cnd",
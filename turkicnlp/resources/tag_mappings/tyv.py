@@ -1,15 +0,0 @@
-"""Tuvan Apertium -> UD tag mapping."""
-
-from __future__ import annotations
-
-from turkicnlp.resources.tag_mappings.turkic_common import CommonTurkicTagMapper
-
-
-class TuvanTagMapper(CommonTurkicTagMapper):
-    """Tag mapper for Tuvan (apertium-tyv)."""
-
-    FEAT_MAP: dict[str, str] = {
-        **CommonTurkicTagMapper.FEAT_MAP,
-        "evid": "Evident=Nfh",
-        "cvb": "VerbForm=Conv",
-    }
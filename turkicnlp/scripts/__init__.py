@@ -11,9 +11,11 @@ or accepts it explicitly.
 
 from __future__ import annotations
 
+import functools
+import sys
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Optional
+from typing import AbstractSet, Collection, Optional
 
 
 class Script(str, Enum):
@@ -41,30 +43,43 @@ SCRIPT_NAMES: dict[Script, str] = {
 }
 
 
-@dataclass
+# ``slots`` is only accepted by ``dataclass`` from Python 3.10 onwards.
+_SLOTS: dict[str, bool] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_SLOTS)
 class ScriptConfig:
     """Per-language script configuration.
 
+    Instances are immutable so they can be shared and cached safely.
+
     Attributes:
-        available: All scripts this language uses.
+        available: All scripts this language uses, stored as a frozenset for
+            fast membership checks. Accepts any collection on construction;
+            its order becomes :attr:`available_ordered`.
+        available_ordered: The same scripts in declaration order, for
+            display and iteration.
         primary: Default script if not specified by the user.
         direction: Text direction for the primary script (``ltr`` or ``rtl``).
         can_transliterate: Set of (source, target) script pairs that have
-            transliteration support.
+            transliteration support, stored as a frozenset.
         apertium_script: Which script the Apertium FST expects as input.
     """
 
-    available: list[Script]
+    available: Collection[Script]
     primary: Script
     direction: str = "ltr"
-    can_transliterate: Optional[set[tuple[Script, Script]]] = None
+    can_transliterate: AbstractSet[tuple[Script, Script]] = frozenset()
     apertium_script: Optional[Script] = None
+    available_ordered: tuple[Script, ...] = field(init=False, repr=False)
 
     def __post_init__(self) -> None:
-        if self.can_transliterate is None:
-            self.can_transliterate = set()
+        ordered = tuple(dict.fromkeys(self.available))
+        object.__setattr__(self, "available_ordered", ordered)
+        object.__setattr__(self, "available", frozenset(ordered))
+        object.__setattr__(self, "can_transliterate", frozenset(self.can_transliterate))
         if self.apertium_script is None:
-            self.apertium_script = self.primary
+            object.__setattr__(self, "apertium_script", self.primary)
 
 
 # ---------------------------------------------------------------------------
@@ -285,7 +300,10 @@ LANGUAGE_SCRIPTS: dict[str, ScriptConfig] = {
     ),
 }
 
+_KNOWN_LANGS_SORTED: tuple[str, ...] = tuple(sorted(LANGUAGE_SCRIPTS))
+
 
+@functools.lru_cache(maxsize=None)
 def get_script_config(lang: str) -> ScriptConfig:
     """Get script configuration for a language.
 
@@ -301,6 +319,6 @@ def get_script_config(lang: str) -> ScriptConfig:
     if lang not in LANGUAGE_SCRIPTS:
         raise ValueError(
             f"No script configuration for language '{lang}'. "
-            f"Known languages: {sorted(LANGUAGE_SCRIPTS.keys())}"
+            f"Known languages: {list(_KNOWN_LANGS_SORTED)}"
         )
     return LANGUAGE_SCRIPTS[lang]
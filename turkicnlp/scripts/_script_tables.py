@@ -0,0 +1,43 @@
+"""Generated by scripts/gen_script_tables.py -- do not edit by hand."""
+
+from __future__ import annotations
+
+UNICODE_VERSION = "14.0.0"
+
+# (first codepoint, last codepoint, ISO 15924 code) letter runs.
+SCRIPT_LUT_RUNS: tuple[tuple[int, int, str], ...] = (
+    (0x00041, 0x0005A, "Latn"),
+    (0x00061, 0x0007A, "Latn"),
+    (0x000AA, 0x000AA, "Latn"),
+    (0x000B5, 0x000B5, "Latn"),
+    (0x000BA, 0x000BA, "Latn"),
+    (0x000C0, 0x000D6, "Latn"),
+    (0x000D8, 0x000F6, "Latn"),
+    (0x000F8, 0x0024F, "Latn"),
+    (0x00400, 0x00481, "Cyrl"),
+    (0x00483, 0x0052F, "Cyrl"),
+    (0x00610, 0x0061A, "Arab"),
+    (0x00620, 0x0065F, "Arab"),
+    (0x0066E, 0x006D3, "Arab"),
+    (0x006D5, 0x006DC, "Arab"),
+    (0x006DF, 0x006E8, "Arab"),
+    (0x006EA, 0x006EF, "Arab"),
+    (0x006FA, 0x006FC, "Arab"),
+    (0x006FF, 0x006FF, "Arab"),
+    (0x00750, 0x0077F, "Arab"),
+    (0x008A0, 0x008E1, "Arab"),
+    (0x008E3, 0x008FF, "Arab"),
+    (0x01E00, 0x01EFF, "Latn"),
+    (0x02DE0, 0x02DFF, "Cyrl"),
+    (0x0A640, 0x0A672, "Cyrl"),
+    (0x0A674, 0x0A67D, "Cyrl"),
+    (0x0A67F, 0x0A69F, "Cyrl"),
+    (0x0FB50, 0x0FBB1, "Arab"),
+    (0x0FBD3, 0x0FD3D, "Arab"),
+    (0x0FD50, 0x0FD8F, "Arab"),
+    (0x0FD92, 0x0FDC7, "Arab"),
+    (0x0FDF0, 0x0FDFB, "Arab"),
+    (0x0FE70, 0x0FE74, "Arab"),
+    (0x0FE76, 0x0FEFC, "Arab"),
+    (0x10C00, 0x10C48, "Orkh"),
+)
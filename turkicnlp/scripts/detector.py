@@ -1,17 +1,23 @@
 """
 Automatic script detection for Turkic text.
 
-Provides :func:`detect_script` for determining the dominant writing script,
-and :func:`detect_script_segments` for segmenting mixed-script documents.
+Provides :func:`detect_script` for determining the dominant writing script
+(:func:`detect_script_bytes` for encoded input), and
+:func:`detect_script_segments` / :func:`detect_script_spans` for segmenting
+mixed-script documents.
 """
 
 from __future__ import annotations
 
-import unicodedata
-from collections import Counter
+import functools
+from array import array
+from collections.abc import Sequence
 from typing import Optional
 
+import numpy as np
+
 from turkicnlp.scripts import Script, ScriptConfig
+from turkicnlp.scripts._script_tables import SCRIPT_LUT_RUNS
 
 
 # Unicode block ranges for script detection
@@ -39,24 +45,70 @@ SCRIPT_RANGES: dict[Script, list[tuple[int, int]]] = {
 }
 
 
+# Codepoint -> script lookup table covering the BMP and Old Turkic (up to
+# U+10FFF). Entries hold an index into ``_IDX_TO_SCRIPT``, or -1 for
+# characters that are neutral (digits, punctuation, whitespace, symbols,
+# controls) or outside every range in ``SCRIPT_RANGES``. Every range lies
+# below ``_LUT_SIZE``, so codepoints past the table are neutral too. After
+# editing ``SCRIPT_RANGES``, rerun ``scripts/gen_script_tables.py``.
+_LUT_SIZE = 0x11000
+# Hot paths work on these small integer indices; ``Script`` members (str
+# enums, slower to hash and compare) are only produced at the public API.
+_IDX_TO_SCRIPT: tuple[Script, ...] = tuple(SCRIPT_RANGES)
+_SCRIPT_TO_IDX: dict[Script, int] = {script: i for i, script in enumerate(_IDX_TO_SCRIPT)}
+
+
+def _build_script_lut() -> array:
+    # The neutral-category filtering is precomputed by
+    # scripts/gen_script_tables.py; expanding its runs is a few slice copies.
+    lut = array("b", [-1]) * _LUT_SIZE
+    for start, end, code in SCRIPT_LUT_RUNS:
+        lut[start : end + 1] = array("b", [_SCRIPT_TO_IDX[Script(code)]]) * (end - start + 1)
+    return lut
+
+
+_SCRIPT_LUT = _build_script_lut()
+_SCRIPT_LUT_NP = np.frombuffer(_SCRIPT_LUT, dtype=np.int8)
+
+def _text_to_codepoints(text: str) -> np.ndarray:
+    """Return the codepoints of *text* as a ``uint32`` array."""
+    return np.frombuffer(text.encode("utf-32-le", "surrogatepass"), dtype="<u4")
+
+
+def _codepoints_to_script_idx(cps: np.ndarray) -> np.ndarray:
+    """Vectorised ``_char_to_script`` returning ``int8`` script indices (-1 = neutral)."""
+    inside = cps < _LUT_SIZE
+    return np.where(inside, _SCRIPT_LUT_NP[np.where(inside, cps, 0)], np.int8(-1))
+
+
+def _char_to_script_idx(char: str) -> int:
+    """Map a single character to its script index. Returns -1 for neutral chars."""
+    cp = ord(char)
+    return _SCRIPT_LUT[cp] if cp < _LUT_SIZE else -1
+
+
 def _char_to_script(char: str) -> Optional[Script]:
     """Map a single character to its script. Returns ``None`` for neutral chars."""
-    cp = ord(char)
-    cat = unicodedata.category(char)
-    if cat.startswith(("N", "P", "Z", "S", "C")):
-        return None
-    for script, ranges in SCRIPT_RANGES.items():
-        for start, end in ranges:
-            if start <= cp <= end:
-                return script
-    return None
+    idx = _char_to_script_idx(char)
+    return _IDX_TO_SCRIPT[idx] if idx >= 0 else None
+
+
+# str.translate table deleting every ASCII character that is not a letter.
+_ASCII_NEUTRAL_DROP: dict[int, None] = dict.fromkeys(
+    cp for cp in range(0x80) if _SCRIPT_LUT[cp] < 0
+)
+
+# Texts up to this length go through a memoised detector; short snippets
+# (CLI input, titles, test strings) are frequently repeated verbatim.
+_SHORT_TEXT_LEN = 256
 
 
 def detect_script(text: str) -> Script:
     """Detect the dominant script in a text string.
 
     Counts letter characters by script and returns the most common one.
-    Ignores digits, punctuation, and whitespace.
+    Ignores digits, punctuation, and whitespace. Results for short texts
+    are cached.
 
     Args:
         text: Input text.
@@ -67,23 +119,108 @@ def detect_script(text: str) -> Script:
     Raises:
         ValueError: If no script characters are found.
     """
-    counts: Counter[Script] = Counter()
-    for char in text:
-        script = _char_to_script(char)
-        if script is not None:
-            counts[script] += 1
-
-    if not counts:
+    if len(text) <= _SHORT_TEXT_LEN:
+        return _IDX_TO_SCRIPT[_detect_script_idx_short(text)]
+    return _IDX_TO_SCRIPT[_detect_script_idx(text)]
+
+
+def _detect_script_idx(text: str) -> int:
+    if text.isascii():
+        # ASCII text can only contain Latin letters: dropping the neutral
+        # characters with a C-level translate is enough to decide.
+        if not text.translate(_ASCII_NEUTRAL_DROP):
+            raise ValueError("No script characters detected in text.")
+        return _SCRIPT_TO_IDX[Script.LATIN]
+
+    idx = _codepoints_to_script_idx(_text_to_codepoints(text))
+    counts = np.bincount(idx.astype(np.intp) + 1, minlength=len(_IDX_TO_SCRIPT) + 1)[1:]
+    top = counts.max()
+    if top == 0:
         raise ValueError("No script characters detected in text.")
 
-    return counts.most_common(1)[0][0]
+    tied = np.flatnonzero(counts == top)
+    if len(tied) == 1:
+        return int(tied[0])
+    # On a tie, prefer the script that appears first in the text.
+    first_seen = {int(i): int(np.argmax(idx == i)) for i in tied}
+    return min(first_seen, key=first_seen.__getitem__)
+
+
+_detect_script_idx_short = functools.lru_cache(maxsize=4096)(_detect_script_idx)
+
+
+def detect_script_bytes(data: bytes, encoding: str = "utf-8") -> Script:
+    """Detect the dominant script in encoded text, e.g. raw file contents.
+
+    The bytes are decoded with CPython's C codec (malformed sequences are
+    replaced, not raised) and fed straight into the vectorised counter.
+
+    Args:
+        data: Encoded input text.
+        encoding: Codec of *data*.
+
+    Returns:
+        The dominant :class:`Script`.
+
+    Raises:
+        ValueError: If no script characters are found.
+    """
+    return detect_script(data.decode(encoding, "replace"))
+
+
+def _detect_script_spans(text: str) -> list[tuple[int, int, int]]:
+    """Return ``(start, end, script_idx)`` runs; see :func:`detect_script_spans`."""
+    if not text:
+        return []
+
+    idx = _codepoints_to_script_idx(_text_to_codepoints(text))
+    positions = np.flatnonzero(idx >= 0)
+    if len(positions) == 0:
+        return []
+
+    # A new segment starts wherever the script of consecutive non-neutral
+    # characters changes; neutral characters stay with the preceding run.
+    scripts = idx[positions]
+    run_heads = np.concatenate(([0], np.flatnonzero(scripts[1:] != scripts[:-1]) + 1))
+    starts = positions[run_heads].tolist()
+    ends = starts[1:] + [len(text)]
+    return list(zip(starts, ends, scripts[run_heads].tolist()))
+
+
+@functools.lru_cache(maxsize=4096)
+def _detect_script_spans_short(text: str) -> tuple[tuple[int, int, int], ...]:
+    # Cached as a tuple so callers cannot mutate the shared result.
+    return tuple(_detect_script_spans(text))
+
+
+def _script_spans(text: str) -> Sequence[tuple[int, int, int]]:
+    if len(text) <= _SHORT_TEXT_LEN:
+        return _detect_script_spans_short(text)
+    return _detect_script_spans(text)
+
+
+def detect_script_spans(text: str) -> list[tuple[int, int, Script]]:
+    """Locate contiguous runs of the same script without copying text.
+
+    Same segmentation as :func:`detect_script_segments`, but returns
+    character offsets so callers that only process some runs (e.g.
+    transliterating the Cyrillic parts) can slice on demand.
+
+    Args:
+        text: Input text.
+
+    Returns:
+        List of ``(start, end, script)`` tuples; ``text[start:end]`` is the
+        segment.
+    """
+    return [(start, end, _IDX_TO_SCRIPT[i]) for start, end, i in _script_spans(text)]
 
 
 def detect_script_segments(text: str) -> list[tuple[str, Script]]:
     """Segment text into contiguous runs of the same script.
 
     Useful for mixed-script documents (e.g. Uzbek with Cyrillic paragraphs
-    embedded in Latin text).
+    embedded in Latin text). Segment boundaries for short texts are cached.
 
     Args:
         text: Input text.
@@ -91,27 +228,26 @@ def detect_script_segments(text: str) -> list[tuple[str, Script]]:
     Returns:
         List of ``(segment_text, script)`` tuples.
     """
-    if not text:
-        return []
+    return [(text[start:end], _IDX_TO_SCRIPT[i]) for start, end, i in _script_spans(text)]
 
-    segments: list[tuple[str, Script]] = []
-    current_script: Optional[Script] = None
-    current_start = 0
 
-    for i, char in enumerate(text):
-        char_script = _char_to_script(char)
-        if char_script is None:
-            continue
-        if char_script != current_script:
-            if current_script is not None:
-                segments.append((text[current_start:i], current_script))
-            current_start = i
-            current_script = char_script
+# Primary-script sniff for detect_script_for_language: long texts whose
+# first _SNIFF_LETTERS script characters are overwhelmingly in the
+# language's primary script skip the full scan.
+_SNIFF_LETTERS = 64
+_SNIFF_WINDOW = 4 * _SNIFF_LETTERS
+_SNIFF_RATIO = 0.9
 
-    if current_script is not None:
-        segments.append((text[current_start:], current_script))
 
-    return segments
+def _sniff_primary_script(text: str, primary: Script) -> bool:
+    primary_idx = _SCRIPT_TO_IDX.get(primary)
+    if primary_idx is None:
+        return False
+    idx = _codepoints_to_script_idx(_text_to_codepoints(text[:_SNIFF_WINDOW]))
+    letters = idx[idx >= 0][:_SNIFF_LETTERS]
+    if len(letters) < _SNIFF_LETTERS:
+        return False
+    return np.count_nonzero(letters == primary_idx) >= _SNIFF_RATIO * _SNIFF_LETTERS
 
 
 def detect_script_for_language(
@@ -119,6 +255,9 @@ def detect_script_for_language(
 ) -> Script:
     """Detect script with language-aware validation.
 
+    Long texts that open with the language's primary script are accepted
+    after a bounded sniff of their first letters instead of a full scan.
+
     Args:
         text: Input text.
         lang: ISO 639-3 language code.
@@ -130,6 +269,10 @@ def detect_script_for_language(
     Raises:
         ValueError: If detected script is not valid for the language.
     """
+    primary = script_config.primary
+    if len(text) > _SHORT_TEXT_LEN and _sniff_primary_script(text, primary):
+        return primary
+
     detected = detect_script(text)
 
     if detected in script_config.available:
@@ -137,7 +280,7 @@ def detect_script_for_language(
 
     raise ValueError(
         f"Detected script '{detected}' is not a known script for language '{lang}'. "
-        f"Expected one of: {[str(s) for s in script_config.available]}. "
+        f"Expected one of: {[str(s) for s in script_config.available_ordered]}. "
         f"If the text is in a different script, use the `script` parameter to specify it, "
         f"or enable transliteration."
     )
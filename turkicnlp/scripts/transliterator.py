@@ -8,9 +8,194 @@ tables are defined in :data:`TRANSLITERATION_TABLES`.
 
 from __future__ import annotations
 
+import functools
+import itertools
+import re
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from types import MappingProxyType
+
+import regex
+
 from turkicnlp.scripts import Script
 
 
+def _case_variants(key: str) -> list[str]:
+    """Return every spelling of *key* whose ``lower()`` is *key* itself."""
+    options: list[list[str]] = []
+    for ch in key:
+        if ch.lower() != ch:
+            return []
+        opts = [ch]
+        for alt in (ch.upper(), ch.title()):
+            if len(alt) == 1 and alt not in opts and alt.lower() == ch:
+                opts.append(alt)
+        options.append(opts)
+    return ["".join(p) for p in itertools.product(*options)]
+
+
+def _expand_cased(forward: Mapping[str, str]) -> dict[str, str]:
+    """Expand *forward* with the case variants the greedy scanner accepts.
+
+    An exact key always wins. Any other chunk whose lowercase form is a key
+    maps to that key's value, title-cased when the chunk starts uppercase.
+    """
+    cased = dict(forward)
+    for key, value in forward.items():
+        titled = value[0].upper() + value[1:] if len(value) > 1 else value.upper()
+        for variant in _case_variants(key):
+            if variant not in forward:
+                cased[variant] = titled if variant[0].isupper() else value
+    return cased
+
+
+def _compile_alternation(keys: list[str], context: str = "") -> re.Pattern[str] | None:
+    """Compile *keys* into one leftmost-longest alternation.
+
+    Keys are tried longest first, then the optional *context* branch. The
+    whole alternation is captured as group 1 so ``split`` keeps the
+    matched text.
+    """
+    branches = [re.escape(k) for k in sorted(keys, key=len, reverse=True)]
+    if context:
+        branches.append(context)
+    if not branches:
+        return None
+    # The ``regex`` engine is needed for ``\p{L}`` in context branches.
+    return (regex if context else re).compile("(" + "|".join(branches) + ")")
+
+
+# Cyrillic-to-Latin ``е`` rules: the ``y`` prefix and the letters after
+# which ``е`` is read as ``ye``; it is also ``ye`` when not after a letter
+# and plain ``e`` elsewhere. In Turkmen this makes ``ъ`` before ``е`` give
+# ``ýe``, while ``ъ``/``ь`` are otherwise dropped.
+_E_RULES: dict[str, tuple[str, str]] = {
+    "uzb": ("y", "аАеЕёЁиИйЙоОуУўЎыЫэЭюЮяЯьЬъЪ"),
+    "tuk": ("ý", "иИөӨүҮәӘъЪ"),
+}
+_UZB_APOSTROPHES = str.maketrans(dict.fromkeys("\u2018\u2019\u02bb\u02bc\u02b9`", "'"))
+_TUK_YE_TO_CYRL = {"ýe": "е", "ýE": "е", "Ýe": "Е", "ÝE": "Е"}
+# Uyghur CTS pivot rules. A vowel not preceded by a consonant takes a
+# hamza carrier (ئ) in Arabic script; going back, a carrier that does not
+# follow a letter is dropped and one after a vowel is absorbed.
+_UIG_BARE_VOWEL = regex.compile("(?<![bptcçxdrzjsşfñlmhvyqkgnğ])([aeéiouöü])")
+_UIG_LEADING_HAMZA = regex.compile("(?<![aeuoöübptcçxdrzjsşfñlmhvéiyqkgnğ])\u0626")
+_UIG_VOWEL_HAMZA = regex.compile("([aeéiouöü])\u0626")
+_UIG_VOWEL_PAIR = regex.compile(r"(^|-|\s|[اەېىوۇۆۈ])([اەېىوۇۆۈ])")
+# Translate tables whose keys all lie below this code point are stored as
+# a list indexed by code point (Latin, Cyrillic and Arabic tables all are).
+_DENSE_LIMIT = 0x800
+_IDENTITY = [chr(cp) for cp in range(_DENSE_LIMIT)]
+# Directions that need more than the compiled table, by converter method.
+_SPECIAL_METHODS: dict[tuple[str, Script, Script], str] = {
+    ("uzb", Script.LATIN, Script.CYRILLIC): "_transliterate_uzb_latn_to_cyrl",
+    ("uig", Script.LATIN, Script.PERSO_ARABIC): "_transliterate_uig_latn_to_arab",
+    ("uig", Script.PERSO_ARABIC, Script.LATIN): "_transliterate_uig_arab_to_latn",
+    ("uig", Script.PERSO_ARABIC, Script.CYRILLIC): "_transliterate_uig_arab_to_cyrl",
+    ("uig", Script.CYRILLIC, Script.PERSO_ARABIC): "_transliterate_uig_cyrl_to_arab",
+    ("uig", Script.CYRILLIC, Script.LATIN): "_transliterate_uig_cyrl_to_latn",
+    ("uig", Script.LATIN, Script.CYRILLIC): "_transliterate_uig_latn_to_cyrl",
+    ("uig", Script.PERSO_ARABIC, Script.COMMON_TURKIC): "_transliterate_uig_arab_to_cts",
+    ("uig", Script.COMMON_TURKIC, Script.PERSO_ARABIC): "_transliterate_uig_cts_to_arab",
+    ("uig", Script.LATIN, Script.COMMON_TURKIC): "_transliterate_uig_latn_to_cts",
+    ("uig", Script.COMMON_TURKIC, Script.LATIN): "_transliterate_uig_cts_to_latn",
+}
+# Separator for transliterate_batch: in no table, not a letter, and never
+# part of a multi-character key, so it behaves like a text boundary.
+_BATCH_SEP = "\x00"
+
+
+def _dense_translate_table(table: dict[int, str]) -> dict[int, str] | list[str]:
+    """Turn a low code point translate table into a direct-index list.
+
+    ``str.translate`` indexes the list by code point, which is cheaper than
+    hashing into a dict. Code points past the end raise ``IndexError``,
+    which ``str.translate`` treats as "leave unchanged"; tables reaching
+    past :data:`_DENSE_LIMIT` (Old Turkic) stay dicts.
+    """
+    top = max(table, default=-1)
+    if top >= _DENSE_LIMIT:
+        return table
+    dense = _IDENTITY[: top + 1]
+    for cp, value in table.items():
+        dense[cp] = value
+    return dense
+
+
+@dataclass(frozen=True)
+class _CompiledTable:
+    """Everything a :class:`Transliterator` derives from one table."""
+
+    forward: Mapping[str, str]
+    cased: Mapping[str, str]
+    ye_map: Mapping[str, str]
+    translate_table: dict[int, str] | list[str]
+    pattern: re.Pattern[str] | None
+    ascii_passthrough: bool
+
+
+# Used when source and target scripts are the same; nothing is converted.
+_IDENTITY_TABLE = _CompiledTable(
+    MappingProxyType({}), MappingProxyType({}), MappingProxyType({}), {}, None, True
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _load_mapping(lang: str, source: Script, target: Script) -> _CompiledTable:
+    """Load and compile the mapping for a language and script pair.
+
+    The result is cached, so every :class:`Transliterator` for the same
+    triple shares one set of tables and one compiled pattern.
+    """
+    key = f"{lang}_{source.value}_to_{target.value}"
+    if key not in TRANSLITERATION_TABLES:
+        raise ValueError(
+            f"No transliteration table for {lang} {source} -> {target}. "
+            f"Available: {list(TRANSLITERATION_TABLES.keys())}"
+        )
+    forward = TRANSLITERATION_TABLES[key]
+    cased = _expand_cased(forward)
+    ye_map: dict[str, str] = {}
+    context = ""
+    e_rule = _E_RULES.get(lang) if (source, target) == (Script.CYRILLIC, Script.LATIN) else None
+    if e_rule is not None:
+        # ``е`` after a letter outside *ye_after* stays ``e`` and is left to
+        # the translate table; the pattern only matches the ``ye`` context.
+        y, ye_after = e_rule
+        cased.update({"е": "e", "Е": "E"})
+        ye_map = {"е": y + "e", "Е": y.upper() + "e"}
+        after = "".join(sorted(ye_after))
+        context = rf"(?P<ye>(?<!\p{{L}})[еЕ]|(?<=[{after}])[еЕ])"
+    if lang == "tuk" and source == Script.CYRILLIC and target == Script.LATIN:
+        # Hard and soft signs are dropped unless part of a longer key.
+        cased.update(dict.fromkeys("ъЪьЬ", ""))
+    if lang == "tuk" and source == Script.LATIN and target == Script.CYRILLIC:
+        # ``ýe`` is the spelling of Cyrillic ``е`` and beats any other key.
+        cased.update(_TUK_YE_TO_CYRL)
+    translate_table = _dense_translate_table(
+        {ord(k): v for k, v in cased.items() if len(k) == 1}
+    )
+    # Only multi-character keys (and the context branch) go into the
+    # pattern; single characters between matches are a str.translate.
+    # Tables without multi-character keys need no pattern at all.
+    pattern = _compile_alternation([k for k in cased if len(k) > 1], context)
+    # ASCII text cannot match a table whose every key has a non-ASCII
+    # character; only table-driven directions may return it untouched.
+    ascii_passthrough = (
+        not any(k.isascii() for k in cased) and (lang, source, target) not in _SPECIAL_METHODS
+    )
+    # The compiled table is shared by every Transliterator for the triple,
+    # so the lookup maps are handed out read-only.
+    return _CompiledTable(
+        forward,
+        MappingProxyType(cased),
+        MappingProxyType(ye_map),
+        translate_table,
+        pattern,
+        ascii_passthrough,
+    )
+
+
 class Transliterator:
     """Convert text between writing scripts for a given Turkic language.
 
@@ -19,6 +204,8 @@ class Transliterator:
         source: Source :class:`Script`.
         target: Target :class:`Script`.
 
+    A *source* equal to *target* needs no table and converts nothing.
+
     Raises:
         ValueError: If no transliteration table exists for the given combination.
     """
@@ -27,12 +214,41 @@ class Transliterator:
         self.lang = lang
         self.source = source
         self.target = target
-        self._forward_map, self._reverse_map = self._load_mapping(lang, source, target)
+        if source == target:
+            table, special = _IDENTITY_TABLE, "_transliterate_identity"
+        else:
+            table = _load_mapping(lang, source, target)
+            special = _SPECIAL_METHODS.get((lang, source, target))
+        self._forward_map = table.forward
+        self._cased_map = table.cased
+        self._ye_map = table.ye_map
+        self._translate_table = table.translate_table
+        self._pattern = table.pattern
+        self._ascii_passthrough = table.ascii_passthrough
+        # Resolve the direction-specific converter once, not on every call.
+        self._special = getattr(Transliterator, special) if special else None
+
+    @functools.cached_property
+    def reverse_map(self) -> dict[str, list[str]]:
+        """Target -> source map, built on first use.
+
+        Several source sequences can share a target (Kazakh ``һ`` and ``х``
+        both give ``h``), so each target lists every source in table order.
+        Targets that are empty (dropped letters such as ``ъ``) have no
+        source to return to and are left out.
+        """
+        reverse: dict[str, list[str]] = {}
+        for key, value in self._forward_map.items():
+            if value:
+                reverse.setdefault(value, []).append(key)
+        return reverse
 
     def transliterate(self, text: str) -> str:
         """Convert *text* from *source* script to *target* script.
 
-        Uses greedy longest-match on the forward mapping table.
+        Uses greedy longest-match on the forward mapping table: a
+        precompiled alternation finds the multi-character keys and the
+        text between them goes through a single-character translate table.
 
         Args:
             text: Input text in the source script.
@@ -40,258 +256,72 @@ class Transliterator:
         Returns:
             Text converted to the target script.
         """
-        if (
-            self.lang == "tuk"
-            and self.source == Script.CYRILLIC
-            and self.target == Script.LATIN
-        ):
-            return self._transliterate_tuk_cyrl_to_latn(text)
-        if (
-            self.lang == "uzb"
-            and self.source == Script.CYRILLIC
-            and self.target == Script.LATIN
-        ):
-            return self._transliterate_uzb_cyrl_to_latn(text)
-        if (
-            self.lang == "uzb"
-            and self.source == Script.LATIN
-            and self.target == Script.CYRILLIC
-        ):
-            text = self._normalize_uzb_apostrophes(text)
-        if (
-            self.lang == "tuk"
-            and self.source == Script.LATIN
-            and self.target == Script.CYRILLIC
-        ):
-            return self._transliterate_tuk_latn_to_cyrl(text)
-        if (
-            self.lang == "uig"
-            and self.source == Script.LATIN
-            and self.target == Script.PERSO_ARABIC
-        ):
-            return self._transliterate_uig_latn_to_arab(text)
-        if self.lang == "uig":
-            src, tgt = self.source, self.target
-            if src == Script.PERSO_ARABIC and tgt == Script.LATIN:
-                return self._transliterate_uig_arab_to_latn(text)
-            if src == Script.PERSO_ARABIC and tgt == Script.CYRILLIC:
-                return self._transliterate_uig_arab_to_cyrl(text)
-            if src == Script.CYRILLIC and tgt == Script.PERSO_ARABIC:
-                return self._transliterate_uig_cyrl_to_arab(text)
-            if src == Script.CYRILLIC and tgt == Script.LATIN:
-                return self._transliterate_uig_cyrl_to_latn(text)
-            if src == Script.LATIN and tgt == Script.CYRILLIC:
-                return self._transliterate_uig_latn_to_cyrl(text)
-            if src == Script.PERSO_ARABIC and tgt == Script.COMMON_TURKIC:
-                return self._transliterate_uig_arab_to_cts(text)
-            if src == Script.COMMON_TURKIC and tgt == Script.PERSO_ARABIC:
-                return self._transliterate_uig_cts_to_arab(text)
-            if src == Script.LATIN and tgt == Script.COMMON_TURKIC:
-                return self._transliterate_uig_latn_to_cts(text)
-            if src == Script.COMMON_TURKIC and tgt == Script.LATIN:
-                return self._transliterate_uig_cts_to_latn(text)
-
-        result: list[str] = []
-        i = 0
-        while i < len(text):
-            matched = False
-            for length in range(min(4, len(text) - i), 0, -1):
-                chunk = text[i : i + length]
-                if chunk in self._forward_map:
-                    result.append(self._forward_map[chunk])
-                    i += length
-                    matched = True
-                    break
-                if chunk.lower() in self._forward_map:
-                    mapped = self._forward_map[chunk.lower()]
-                    if chunk[0].isupper():
-                        mapped = (
-                            mapped[0].upper() + mapped[1:]
-                            if len(mapped) > 1
-                            else mapped.upper()
-                        )
-                    result.append(mapped)
-                    i += length
-                    matched = True
-                    break
-            if not matched:
-                result.append(text[i])
-                i += 1
-        return "".join(result)
-
-    def _transliterate_uzb_cyrl_to_latn(self, text: str) -> str:
-        """Uzbek Cyrillic -> Latin with context-sensitive ``е`` rules."""
-        result: list[str] = []
-        i = 0
-        prev_vowelish = set("аАеЕёЁиИйЙоОуУўЎыЫэЭюЮяЯьЬъЪ")
-        while i < len(text):
-            matched = False
-            for length in range(min(4, len(text) - i), 1, -1):
-                chunk = text[i : i + length]
-                if chunk in self._forward_map:
-                    result.append(self._forward_map[chunk])
-                    i += length
-                    matched = True
-                    break
-                if chunk.lower() in self._forward_map:
-                    mapped = self._forward_map[chunk.lower()]
-                    if chunk[0].isupper():
-                        mapped = (
-                            mapped[0].upper() + mapped[1:]
-                            if len(mapped) > 1
-                            else mapped.upper()
-                        )
-                    result.append(mapped)
-                    i += length
-                    matched = True
-                    break
-            if matched:
-                continue
-
-            ch = text[i]
-            if ch in {"е", "Е"}:
-                prev = text[i - 1] if i > 0 else ""
-                word_initial = i == 0 or not text[i - 1].isalpha()
-                if word_initial or prev in prev_vowelish:
-                    result.append("ye" if ch == "е" else "Ye")
-                else:
-                    result.append("e" if ch == "е" else "E")
-                i += 1
-                continue
-
-            if ch in self._forward_map:
-                result.append(self._forward_map[ch])
-            elif ch.lower() in self._forward_map:
-                mapped = self._forward_map[ch.lower()]
-                if ch[0].isupper():
-                    mapped = (
-                        mapped[0].upper() + mapped[1:] if len(mapped) > 1 else mapped.upper()
-                    )
-                result.append(mapped)
-            else:
-                result.append(ch)
-            i += 1
-        return "".join(result)
-
-    def _transliterate_tuk_cyrl_to_latn(self, text: str) -> str:
-        """Turkmen Cyrillic -> Latin with context-sensitive ``е`` rules.
-
-        Rules implemented:
-        1. Word-initial ``е`` -> ``ýe``.
-        2. If ``е`` is preceded by ``и/ө/ү/ә`` (or uppercase variants),
-           map ``е`` as ``ýe``.
-        3. ``ъ`` before ``е`` yields ``ýe`` on ``е``; ``ъ`` and ``ь`` are
-           otherwise dropped.
+        if self._ascii_passthrough and text.isascii():
+            return text
+        special = self._special
+        if special is not None:
+            return special(self, text)
+        return self._transliterate_table(text)
+
+    def _transliterate_table(self, text: str) -> str:
+        """Greedy longest-match over the compiled table.
+
+        The pattern finds multi-character keys (and ``ye``-context ``е``);
+        the runs between matches go through the single-character
+        translate table.
         """
-        result: list[str] = []
-        i = 0
-        while i < len(text):
-            # Greedy longest-match for multi-character mappings first.
-            matched = False
-            for length in range(min(4, len(text) - i), 0, -1):
-                chunk = text[i : i + length]
-                if length > 1 and chunk in self._forward_map:
-                    result.append(self._forward_map[chunk])
-                    i += length
-                    matched = True
-                    break
-                if length > 1 and chunk.lower() in self._forward_map:
-                    mapped = self._forward_map[chunk.lower()]
-                    if chunk[0].isupper():
-                        mapped = (
-                            mapped[0].upper() + mapped[1:]
-                            if len(mapped) > 1
-                            else mapped.upper()
-                        )
-                    result.append(mapped)
-                    i += length
-                    matched = True
-                    break
-            if matched:
-                continue
-
-            ch = text[i]
-
-            # Drop hard/soft signs by default.
-            if ch in {"ъ", "Ъ", "ь", "Ь"}:
-                i += 1
-                continue
-
-            # Context-sensitive handling for Cyrillic e.
-            if ch in {"е", "Е"}:
-                prev = text[i - 1] if i > 0 else ""
-                word_initial = i == 0 or not text[i - 1].isalpha()
-                needs_y = (
-                    word_initial
-                    or prev in {"и", "И", "ө", "Ө", "ү", "Ү", "ә", "Ә", "ъ", "Ъ"}
-                )
-                if needs_y:
-                    result.append("ýe" if ch == "е" else "Ýe")
-                else:
-                    result.append("e" if ch == "е" else "E")
-                i += 1
-                continue
-
-            if ch in self._forward_map:
-                result.append(self._forward_map[ch])
-            elif ch.lower() in self._forward_map:
-                mapped = self._forward_map[ch.lower()]
-                if ch[0].isupper():
-                    mapped = (
-                        mapped[0].upper() + mapped[1:] if len(mapped) > 1 else mapped.upper()
-                    )
-                result.append(mapped)
-            else:
-                result.append(ch)
-            i += 1
-
-        return "".join(result)
-
-    def _transliterate_tuk_latn_to_cyrl(self, text: str) -> str:
-        """Turkmen Latin -> Cyrillic with contextual ``ýe`` -> ``е``."""
-        result: list[str] = []
-        i = 0
-        while i < len(text):
-            if i + 1 < len(text) and text[i : i + 2] in {"ýe", "Ýe", "ÝE", "ýE"}:
-                chunk = text[i : i + 2]
-                result.append("е" if chunk in {"ýe", "ýE"} else "Е")
-                i += 2
-                continue
-
-            matched = False
-            for length in range(min(4, len(text) - i), 0, -1):
-                chunk = text[i : i + length]
-                if chunk in self._forward_map:
-                    result.append(self._forward_map[chunk])
-                    i += length
-                    matched = True
-                    break
-                if chunk.lower() in self._forward_map:
-                    mapped = self._forward_map[chunk.lower()]
-                    if chunk[0].isupper():
-                        mapped = (
-                            mapped[0].upper() + mapped[1:] if len(mapped) > 1 else mapped.upper()
-                        )
-                    result.append(mapped)
-                    i += length
-                    matched = True
-                    break
-            if not matched:
-                result.append(text[i])
-                i += 1
-        return "".join(result)
+        table = self._translate_table
+        if self._pattern is None:
+            return text.translate(table)
+        # split() builds the output list in C: [run, match, run, ..., run],
+        # or [run, match, ye, run, ...] when the pattern has an ``е`` branch.
+        parts = self._pattern.split(text)
+        cased = self._cased_map
+        ye_map = self._ye_map
+        if not ye_map:
+            parts[0::2] = [run.translate(table) for run in parts[0::2]]
+            parts[1::2] = [cased[m] for m in parts[1::2]]
+            return "".join(parts)
+        parts[0::3] = [run.translate(table) for run in parts[0::3]]
+        parts[1::3] = [
+            ye_map[m] if ye else cased[m] for m, ye in zip(parts[1::3], parts[2::3])
+        ]
+        parts[2::3] = [""] * (len(parts) // 3)
+        return "".join(parts)
+
+    def transliterate_batch(self, texts: Sequence[str]) -> list[str]:
+        """Convert several texts at once.
+
+        The texts are joined with NUL, converted in one call and split again,
+        which avoids one pattern and translate dispatch per text. Uyghur's
+        anchored pivot rules, and texts that already contain NUL, fall back
+        to one :meth:`transliterate` call per text.
+
+        Args:
+            texts: Input texts in the source script.
+
+        Returns:
+            The converted texts, in the same order.
+        """
+        if not texts:
+            return []
+        joined = _BATCH_SEP.join(texts)
+        if self.lang == "uig" or joined.count(_BATCH_SEP) != len(texts) - 1:
+            return [self.transliterate(text) for text in texts]
+        return self.transliterate(joined).split(_BATCH_SEP)
+
+    def _transliterate_identity(self, text: str) -> str:
+        """Source and target scripts are the same: return *text* unchanged."""
+        return text
+
+    def _transliterate_uzb_latn_to_cyrl(self, text: str) -> str:
+        """Uzbek Latin -> Cyrillic after apostrophe normalization."""
+        return self._transliterate_table(self._normalize_uzb_apostrophes(text))
 
     @staticmethod
     def _normalize_uzb_apostrophes(text: str) -> str:
         """Normalize common Uzbek apostrophe variants to ASCII apostrophe."""
-        return (
-            text.replace("\u2018", "'")
-            .replace("\u2019", "'")
-            .replace("\u02bb", "'")
-            .replace("\u02bc", "'")
-            .replace("\u02b9", "'")
-            .replace("`", "'")
-        )
+        return text.translate(_UZB_APOSTROPHES)
 
     def _transliterate_uig_latn_to_arab(self, text: str) -> str:
         """Uyghur Latin (ULS) → Arabic via CTS pivot with full ئ insertion.
@@ -301,15 +331,9 @@ class Transliterator:
         This handles both word-initial vowels AND vowel-after-vowel sequences
         (e.g. 'radio' → رادىئو) and apostrophe syllable markers (e.g. "inik'ana").
         """
-        import regex as re
         text = text.lower()
         text = self._uig_uls_to_cts(text)
-        consonants = "bptcçxdrzjsşfñlmhvyqkgnğ"
-        text = re.sub(
-            rf"(?<=[^{consonants}]|^)[aeéiouöü]",
-            lambda m: "\u0626" + m.group(),
-            text,
-        )
+        text = _UIG_BARE_VOWEL.sub("\u0626\\1", text)
         text = self._uig_replace(text, self._UIG_CTS, self._UIG_UAS)
         text = text.replace("'", "")
         return self._uig_revise_uas(text)
@@ -339,7 +363,6 @@ class Transliterator:
         "о", "у", "ө", "ү", "в", "е", "и", "й", "қ", "к",
         "г", "н", "ғ",
     ]
-    _UIG_CTS_CONSONANTS: str = "bptcçxdrzjsşfñlmhvyqkgnğ"
 
     @staticmethod
     def _uig_replace(text: str, src: list[str], tgt: list[str]) -> str:
@@ -350,17 +373,15 @@ class Transliterator:
     @staticmethod
     def _uig_revise_cts(text: str) -> str:
         """Remove word-initial ئ; remove post-vowel ئ; replace remaining ئ with apostrophe."""
-        import regex as re
-        text = re.sub(r"(?<=[^aeuoöübptcçxdrzjsşfñlmhvéiyqkgnğ]|^)\u0626", "", text)
-        text = re.sub(r"(([aeéiouöü])\u0626)", lambda m: m.group()[0], text)
+        text = _UIG_LEADING_HAMZA.sub("", text)
+        text = _UIG_VOWEL_HAMZA.sub("\\1", text)
         text = text.replace("\u0626", "'")
         return text
 
     @staticmethod
     def _uig_revise_cts_keep_apos(text: str) -> str:
         """Remove word-initial ئ; keep post-vowel ئ as apostrophe (for Latin/Cyrillic output)."""
-        import regex as re
-        text = re.sub(r"(?<=[^aeuoöübptcçxdrzjsşfñlmhvéiyqkgnğ]|^)\u0626", "", text)
+        text = _UIG_LEADING_HAMZA.sub("", text)
         # Unlike _uig_revise_cts, we do NOT strip vowel+ئ here — it becomes an apostrophe
         text = text.replace("\u0626", "'")
         return text
@@ -368,12 +389,7 @@ class Transliterator:
     @staticmethod
     def _uig_revise_uas(text: str) -> str:
         """Fix consecutive Arabic vowels by inserting ئ between them."""
-        import regex as re
-        return re.sub(
-            r"(^|-|\s|[اەېىوۇۆۈ])([اەېىوۇۆۈ])",
-            lambda m: m.group(1) + "ئ" + m.group(2),
-            text,
-        )
+        return _UIG_VOWEL_PAIR.sub("\\1ئ\\2", text)
 
     @staticmethod
     def _uig_uls_to_cts(text: str) -> str:
@@ -421,13 +437,7 @@ class Transliterator:
         return self._uig_cts_to_uls(text.lower())
 
     def _transliterate_uig_cts_to_arab(self, text: str) -> str:
-        import regex as re
-        vowels = "aeéiouöü"
-        text = re.sub(
-            rf"(?<=[^{self._UIG_CTS_CONSONANTS}]|^)[{vowels}]",
-            lambda m: "\u0626" + m.group(),
-            text,
-        )
+        text = _UIG_BARE_VOWEL.sub("\u0626\\1", text)
         text = self._uig_replace(text, self._UIG_CTS, self._UIG_UAS)
         text = text.replace("'", "")
         return self._uig_revise_uas(text)
@@ -440,15 +450,9 @@ class Transliterator:
         return text
 
     def _transliterate_uig_cyrl_to_arab(self, text: str) -> str:
-        import regex as re
         text = self._uig_replace(text, self._UIG_UCS, self._UIG_CTS)
         text = text.replace("я", "ya").replace("ю", "yu")
-        vowels = "aeéiouöü"
-        text = re.sub(
-            rf"(?<=[^{self._UIG_CTS_CONSONANTS}]|^)[{vowels}]",
-            lambda m: "\u0626" + m.group(),
-            text,
-        )
+        text = _UIG_BARE_VOWEL.sub("\u0626\\1", text)
         text = self._uig_replace(text, self._UIG_CTS, self._UIG_UAS)
         text = text.replace("'", "")
         return self._uig_revise_uas(text)
@@ -471,27 +475,12 @@ class Transliterator:
     def _transliterate_uig_cts_to_latn(self, text: str) -> str:
         return self._uig_cts_to_uls(text.lower())
 
-    @staticmethod
-    def _load_mapping(
-        lang: str, source: Script, target: Script
-    ) -> tuple[dict[str, str], dict[str, str]]:
-        """Load character mapping for a language and script pair."""
-        key = f"{lang}_{source.value}_to_{target.value}"
-        if key not in TRANSLITERATION_TABLES:
-            raise ValueError(
-                f"No transliteration table for {lang} {source} -> {target}. "
-                f"Available: {list(TRANSLITERATION_TABLES.keys())}"
-            )
-        forward = TRANSLITERATION_TABLES[key]
-        reverse = {v: k for k, v in forward.items()}
-        return forward, reverse
-
 
 # ---------------------------------------------------------------------------
 # Transliteration tables
 # ---------------------------------------------------------------------------
 
-TRANSLITERATION_TABLES: dict[str, dict[str, str]] = {
+_TABLES: dict[str, dict[str, str]] = {
     # Kazakh Cyrillic → Latin (2021 official Latin alphabet)
     "kaz_Cyrl_to_Latn": {
         "ә": "ä", "Ә": "Ä", "ғ": "ğ", "Ғ": "Ğ", "қ": "q", "Қ": "Q",
@@ -1525,3 +1514,9 @@ TRANSLITERATION_TABLES: dict[str, dict[str, str]] = {
         "z": "z", "Z": "Z",
     },
 }
+
+# The tables are read-only: compiled forms of them are cached per
+# (lang, source, target), so a mutated table would silently go stale.
+TRANSLITERATION_TABLES: Mapping[str, Mapping[str, str]] = MappingProxyType(
+    {key: MappingProxyType(table) for key, table in _TABLES.items()}
+)
@@ -0,0 +1,70 @@
+"""Shared fixtures for the TurkicNLP test suite."""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from turkicnlp.pipeline import Pipeline
+from turkicnlp.resources.tag_mappings import load_tag_map
+from turkicnlp.resources.tag_mappings.base import TagMapper
+from turkicnlp.scripts import Script
+from turkicnlp.scripts.transliterator import Transliterator
+
+
+@pytest.fixture(scope="session")
+def tag_map_kaz() -> TagMapper:
+    return load_tag_map("kaz")
+
+
+@pytest.fixture(scope="session")
+def tag_map_tur() -> TagMapper:
+    return load_tag_map("tur")
+
+
+@pytest.fixture(scope="session")
+def tag_map_uzb() -> TagMapper:
+    return load_tag_map("uzb")
+
+
+@pytest.fixture(scope="session")
+def kaz_latn_to_cyrl() -> Transliterator:
+    return Transliterator("kaz", Script.LATIN, Script.CYRILLIC)
+
+
+@pytest.fixture(scope="session")
+def kaz_cyrl_to_latn() -> Transliterator:
+    return Transliterator("kaz", Script.CYRILLIC, Script.LATIN)
+
+
+@pytest.fixture(scope="session")
+def kaz_pipeline() -> Pipeline:
+    return Pipeline("kaz", script="Cyrl")
+
+
+class _FakeHfstStream:
+    def __init__(self, path: str) -> None:
+        self.path = path
+
+    def read(self) -> SimpleNamespace:
+        return SimpleNamespace(lookup=lambda surface: [])
+
+
+@pytest.fixture
+def hfst_stub(monkeypatch: pytest.MonkeyPatch) -> SimpleNamespace:
+    """Install a stand-in ``hfst`` module whose transducers find nothing."""
+    stub = SimpleNamespace(HfstInputStream=_FakeHfstStream)
+    monkeypatch.setitem(sys.modules, "hfst", stub)
+    return stub
+
+
+@pytest.fixture(scope="session")
+def fake_morph_model(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """A read-only Apertium model directory holding a stub Kazakh analyzer."""
+    model_dir = tmp_path_factory.mktemp("morph") / "apertium"
+    model_dir.mkdir()
+    (model_dir / "kaz.automorf.hfst").write_text("stub")
+    return model_dir
@@ -2,22 +2,46 @@
 
 from __future__ import annotations
 
+import pytest
+
+from turkicnlp.models.document import Document
 from turkicnlp.utils.conllu import parse_conllu
 
+_BASIC_CONLLU = (
+    "# sent_id = 1\n"
+    "# text = Мен мектепке бардым .\n"
+    "1\tМен\tмен\tPRON\t_\tCase=Nom|Number=Sing\t3\tnsubj\t_\t_\n"
+    "2\tмектепке\tмектеп\tNOUN\t_\tCase=Dat|Number=Sing\t3\tobl\t_\t_\n"
+    "3\tбардым\tбар\tVERB\t_\tTense=Past|Person=1\t0\troot\t_\t_\n"
+    "4\t.\t.\tPUNCT\t_\t_\t3\tpunct\t_\t_\n"
+    "\n"
+)
 
-def test_parse_conllu_basic() -> None:
-    text = (
-        "# sent_id = 1\n"
-        "# text = Мен мектепке бардым .\n"
-        "1\tМен\tмен\tPRON\t_\tCase=Nom|Number=Sing\t3\tnsubj\t_\t_\n"
-        "2\tмектепке\tмектеп\tNOUN\t_\tCase=Dat|Number=Sing\t3\tobl\t_\t_\n"
-        "3\tбардым\tбар\tVERB\t_\tTense=Past|Person=1\t0\troot\t_\t_\n"
-        "4\t.\t.\tPUNCT\t_\t_\t3\tpunct\t_\t_\n"
-        "\n"
-    )
-    doc = parse_conllu(text)
-    assert len(doc.sentences) == 1
-    sent = doc.sentences[0]
+_MWT_CONLLU = (
+    "# lang = tur\n"
+    "# script = Latn\n"
+    "# text = gidiyorum .\n"
+    "1-2\tgidiyorum\t_\t_\t_\t_\t_\t_\t_\t_\n"
+    "1\tgid\tgit\tVERB\t_\tTense=Pres\t0\troot\t_\t_\n"
+    "2\tiyorum\t_\tAUX\t_\t_\t1\taux\t_\t_\n"
+    "3\t.\t.\tPUNCT\t_\t_\t1\tpunct\t_\tScript=Latn\n"
+    "\n"
+)
+
+
+@pytest.fixture(scope="module")
+def basic_doc() -> Document:
+    return parse_conllu(_BASIC_CONLLU)
+
+
+@pytest.fixture(scope="module")
+def mwt_doc() -> Document:
+    return parse_conllu(_MWT_CONLLU)
+
+
+def test_parse_conllu_basic(basic_doc: Document) -> None:
+    assert len(basic_doc.sentences) == 1
+    sent = basic_doc.sentences[0]
     assert sent.text == "Мен мектепке бардым ."
     assert [w.text for w in sent.words] == ["Мен", "мектепке", "бардым", "."]
     assert sent.words[0].lemma == "мен"
@@ -27,24 +51,60 @@ def test_parse_conllu_basic() -> None:
     assert sent.words[2].deprel == "root"
 
 
-def test_parse_conllu_mwt_and_script() -> None:
-    text = (
-        "# lang = tur\n"
-        "# script = Latn\n"
-        "# text = gidiyorum .\n"
-        "1-2\tgidiyorum\t_\t_\t_\t_\t_\t_\t_\t_\n"
-        "1\tgid\tgit\tVERB\t_\tTense=Pres\t0\troot\t_\t_\n"
-        "2\tiyorum\t_\tAUX\t_\t_\t1\taux\t_\t_\n"
-        "3\t.\t.\tPUNCT\t_\t_\t1\tpunct\t_\tScript=Latn\n"
-        "\n"
-    )
-    doc = parse_conllu(text)
-    assert doc.lang == "tur"
-    assert doc.script == "Latn"
-    assert len(doc.sentences) == 1
-    sent = doc.sentences[0]
+def test_parse_conllu_mwt_and_script(mwt_doc: Document) -> None:
+    assert mwt_doc.lang == "tur"
+    assert mwt_doc.script == "Latn"
+    assert len(mwt_doc.sentences) == 1
+    sent = mwt_doc.sentences[0]
     assert len(sent.tokens) == 2
     assert sent.tokens[0].is_mwt
     assert sent.tokens[0].id == (1, 2)
     assert [w.text for w in sent.words] == ["gid", "iyorum", "."]
     assert sent.words[-1].script == "Latn"
+
+
+def test_parse_conllu_skips_empty_nodes_and_keeps_gc_state() -> None:
+    import gc
+
+    text = _BASIC_CONLLU.replace("4\t.", "3.1\tbar\tbar\tVERB\t_\t_\t_\t_\t2:conj\t_\n4\t.")
+    doc = parse_conllu(text)
+    assert [w.id for w in doc.sentences[0].words] == [1, 2, 3, 4]
+    assert doc.sentences[0].words[0].xpos is None
+    assert gc.isenabled()
+
+
+def test_read_conllu_splits_on_newdoc(tmp_path) -> None:
+    from turkicnlp.utils.conllu import iter_conllu, read_conllu
+
+    path = tmp_path / "docs.conllu"
+    path.write_text(
+        "# newdoc id = a\n" + _BASIC_CONLLU + "# newdoc id = b\n" + _MWT_CONLLU,
+        encoding="utf-8",
+    )
+    docs = read_conllu(path)
+    assert [len(d.sentences) for d in docs] == [1, 1]
+    assert docs[1].lang == "tur"
+    assert [d.to_conllu() for d in iter_conllu(path)] == [d.to_conllu() for d in docs]
+
+    single = tmp_path / "single.conllu"
+    single.write_text(_BASIC_CONLLU, encoding="utf-8")
+    assert [len(d.words) for d in read_conllu(single)] == [4]
+
+    empty = tmp_path / "empty.conllu"
+    empty.write_text("", encoding="utf-8")
+    assert [d.sentences for d in read_conllu(empty)] == [[]]
+
+
+def test_parse_conllu_shares_tag_strings() -> None:
+    first, second = (parse_conllu(_BASIC_CONLLU).sentences[0] for _ in range(2))
+    assert first.words[0].upos is second.words[0].upos
+    assert first.words[1].feats is second.words[1].feats
+    assert first.words[2].deprel is second.words[2].deprel
+
+
+def test_write_conllu_matches_to_conllu(mwt_doc: Document, tmp_path) -> None:
+    from turkicnlp.utils.conllu import write_conllu
+
+    path = tmp_path / "out.conllu"
+    write_conllu(mwt_doc, path)
+    assert path.read_text(encoding="utf-8") == mwt_doc.to_conllu()
@@ -0,0 +1,98 @@
+"""Tests for the model download helpers."""
+
+from __future__ import annotations
+
+import json
+import os
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from turkicnlp.resources import downloader
+from turkicnlp.resources.downloader import _dedup_into_blobs, _extract_zip, _sha256
+
+
+class TestBlobDedup:
+    def test_identical_files_share_one_blob(self, tmp_path: Path) -> None:
+        blob_dir = tmp_path / "_blobs"
+        kaz = tmp_path / "kaz" / "Cyrl" / "morph" / "apertium"
+        kir = tmp_path / "kir" / "Cyrl" / "morph" / "apertium"
+        for dest in (kaz, kir):
+            dest.mkdir(parents=True)
+            (dest / "shared.hfst").write_bytes(b"shared-fst")
+        (kir / "kir.automorf.hfst").write_bytes(b"kyrgyz-only")
+
+        _dedup_into_blobs(kaz, blob_dir)
+        _dedup_into_blobs(kir, blob_dir)
+
+        assert os.path.samefile(kaz / "shared.hfst", kir / "shared.hfst")
+        assert (kir / "shared.hfst").read_bytes() == b"shared-fst"
+        digest = _sha256(kaz / "shared.hfst")
+        assert (blob_dir / digest[:2] / digest).exists()
+        assert len([p for p in blob_dir.rglob("*") if p.is_file()]) == 2
+
+    def test_rerun_is_idempotent(self, tmp_path: Path) -> None:
+        blob_dir = tmp_path / "_blobs"
+        dest = tmp_path / "tur" / "Latn" / "morph" / "apertium"
+        dest.mkdir(parents=True)
+        (dest / "tur.automorf.hfst").write_bytes(b"turkish")
+
+        _dedup_into_blobs(dest, blob_dir)
+        _dedup_into_blobs(dest, blob_dir)
+
+        assert [p.name for p in dest.iterdir()] == ["tur.automorf.hfst"]
+        assert (dest / "tur.automorf.hfst").read_bytes() == b"turkish"
+
+    def test_reextract_does_not_write_through_blob(self, tmp_path: Path) -> None:
+        blob_dir = tmp_path / "_blobs"
+        kaz = tmp_path / "kaz" / "Cyrl" / "morph" / "apertium"
+        kir = tmp_path / "kir" / "Cyrl" / "morph" / "apertium"
+        for dest in (kaz, kir):
+            dest.mkdir(parents=True)
+            (dest / "shared.hfst").write_bytes(b"shared-fst")
+            _dedup_into_blobs(dest, blob_dir)
+        digest = _sha256(kir / "shared.hfst")
+        assert os.path.samefile(kaz / "shared.hfst", kir / "shared.hfst")
+
+        archive = tmp_path / "apertium_fst.zip"
+        with zipfile.ZipFile(archive, "w") as zf:
+            zf.writestr("shared.hfst", b"new-kazakh-fst")
+        _extract_zip(archive, kaz)
+        _dedup_into_blobs(kaz, blob_dir)
+
+        assert (kaz / "shared.hfst").read_bytes() == b"new-kazakh-fst"
+        assert (kir / "shared.hfst").read_bytes() == b"shared-fst"
+        assert (blob_dir / digest[:2] / digest).read_bytes() == b"shared-fst"
+
+    def test_forced_redownload_keeps_blobs_intact(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        blob_dir = tmp_path / "_blobs"
+        payload = {"shared.hfst": b"shared-fst"}
+
+        def fake_urlretrieve(url: str, path: Path, reporthook: object = None) -> None:
+            with zipfile.ZipFile(path, "w") as zf:
+                for name, data in payload.items():
+                    zf.writestr(name, data)
+
+        monkeypatch.setattr(downloader.urllib.request, "urlretrieve", fake_urlretrieve)
+        dests = {}
+        for lang in ("kaz", "kir"):
+            dests[lang] = tmp_path / lang / "Cyrl" / "morph" / "apertium"
+            dests[lang].mkdir(parents=True)
+            downloader._download_apertium_fst(
+                lang, "Cyrl", "morph", {"url": "https://example.org/fst.zip"}, dests[lang], blob_dir
+            )
+
+        payload["shared.hfst"] = b"new-kazakh-fst"
+        backend_info = {"url": "https://example.org/fst.zip", "source": "v2"}
+        downloader._download_apertium_fst(
+            "kaz", "Cyrl", "morph", backend_info, dests["kaz"], blob_dir
+        )
+
+        assert (dests["kaz"] / "shared.hfst").read_bytes() == b"new-kazakh-fst"
+        assert (dests["kir"] / "shared.hfst").read_bytes() == b"shared-fst"
+        assert json.loads((dests["kir"] / "metadata.json").read_text())["lang"] == "kir"
+        for blob in (p for p in blob_dir.rglob("*") if p.is_file()):
+            assert _sha256(blob) == blob.name
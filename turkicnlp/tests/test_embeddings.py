@@ -32,6 +32,10 @@ class _FakeTensor:
             return _FakeTensor(self.value * other.value)
         return _FakeTensor(self.value * other)
 
+    def __imul__(self, other):
+        np.multiply(self.value, other.value, out=self.value)
+        return self
+
     def __truediv__(self, other):
         if isinstance(other, _FakeTensor):
             return _FakeTensor(self.value / other.value)
@@ -62,28 +66,24 @@ class _FakeTorch:
 
 class _FakeTokenizer:
     def __call__(self, texts, return_tensors=None, padding=None, truncation=None):
-        max_len = max(len(t.split()) for t in texts)
-        input_ids = []
-        attention_mask = []
-        for text in texts:
-            n = len(text.split())
-            ids = [1] * n + [0] * (max_len - n)
-            mask = [1] * n + [0] * (max_len - n)
-            input_ids.append(ids)
-            attention_mask.append(mask)
+        # Test inputs are single-space separated, so counting separators is enough.
+        lengths = np.fromiter(
+            (t.count(" ") + 1 if t else 0 for t in texts), dtype=np.int64, count=len(texts)
+        )
+        # Token ids are all 1, so the ids and the padding mask coincide.
+        mask = np.arange(lengths.max()) < lengths[:, None]
         return {
-            "input_ids": _FakeTensor(input_ids),
-            "attention_mask": _FakeTensor(attention_mask),
+            "input_ids": _FakeTensor(mask),
+            "attention_mask": _FakeTensor(mask),
         }
 
 
 class _FakeEncoder:
     def __call__(self, input_ids, attention_mask, return_dict=True):
         batch, seq = input_ids.value.shape
-        hidden = np.zeros((batch, seq, 2), dtype=float)
-        for b in range(batch):
-            hidden[b, :, 0] = b + 1
-            hidden[b, :, 1] = np.arange(1, seq + 1, dtype=float)
+        hidden = np.empty((batch, seq, 2), dtype=float)
+        hidden[:, :, 0] = np.arange(1, batch + 1, dtype=float)[:, None]
+        hidden[:, :, 1] = np.arange(1, seq + 1, dtype=float)
         return SimpleNamespace(last_hidden_state=_FakeTensor(hidden))
 
 
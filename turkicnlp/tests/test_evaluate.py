@@ -0,0 +1,80 @@
+"""Tests for the CoNLL-U evaluation helpers."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from turkicnlp.training.evaluate import evaluate_depparse, evaluate_pos
+
+_GOLD = """\
+# sent_id = 1
+# text = Men kitap okudım.
+1	Men	men	PRON	Prn	Case=Nom	3	nsubj	_	_
+2	kitap	kitap	NOUN	N	Case=Nom	3	obj	_	_
+3	okudım	oku	VERB	V	Tense=Past	0	root	_	SpaceAfter=No
+4	.	.	PUNCT	Punct	_	3	punct	_	_
+
+# sent_id = 2
+1-2	Evdeyim	_	_	_	_	_	_	_	_
+1	Evde	ev	NOUN	N	Case=Loc	2	obl	_	_
+2	yim	i	AUX	Aux	Person=1	0	root	_	_
+"""
+
+# UPOS/FEATS wrong on "kitap", XPOS wrong on "yim"; head wrong on "." and
+# label wrong on "Men"; obl:tmod still matches obl.
+_PRED = """\
+# sent_id = 1
+1	Men	men	PRON	Prn	Case=Nom	3	obj	_	_
+2	kitap	kitap	ADJ	A	_	3	obj	_	_
+3	okudım	oku	VERB	V	Tense=Past	0	root	_	_
+4	.	.	PUNCT	Punct	_	1	punct	_	_
+
+1-2	Evdeyim	_	_	_	_	_	_	_	_
+1	Evde	ev	NOUN	N	Case=Loc	2	obl:tmod	_	_
+2	yim	i	AUX	Cop	Person=1	0	root	_	_
+"""
+
+
+def _write(tmp_path: Path, name: str, text: str) -> str:
+    path = tmp_path / name
+    path.write_text(text, encoding="utf-8")
+    return str(path)
+
+
+@pytest.fixture
+def gold(tmp_path: Path) -> str:
+    return _write(tmp_path, "gold.conllu", _GOLD)
+
+
+def test_evaluate_pos(gold: str, tmp_path: Path) -> None:
+    scores = evaluate_pos(gold, _write(tmp_path, "pred.conllu", _PRED))
+    assert scores == {
+        "upos_acc": pytest.approx(5 / 6),
+        "feats_acc": pytest.approx(5 / 6),
+        "all_tags_acc": pytest.approx(4 / 6),
+    }
+
+
+def test_evaluate_depparse(gold: str, tmp_path: Path) -> None:
+    scores = evaluate_depparse(gold, _write(tmp_path, "pred.conllu", _PRED))
+    assert scores["uas"] == pytest.approx(5 / 6)
+    assert scores["las"] == pytest.approx(4 / 6)
+    # Content words: Men, kitap, okudım, Evde, yim in both files; 4 correct.
+    assert scores["clas"] == pytest.approx(4 / 5)
+
+
+def test_identical_files_score_perfectly(gold: str) -> None:
+    assert set(evaluate_pos(gold, gold).values()) == {1.0}
+    assert set(evaluate_depparse(gold, gold).values()) == {1.0}
+
+
+def test_tokenization_mismatch_is_rejected(gold: str, tmp_path: Path) -> None:
+    pred = _write(tmp_path, "pred.conllu", _PRED.replace("\tkitap\t", "\tkitab\t", 1))
+    with pytest.raises(ValueError, match="Tokenization mismatch"):
+        evaluate_pos(gold, pred)
+
+    truncated = _write(tmp_path, "short.conllu", _PRED.rsplit("\n2\t", 1)[0] + "\n")
+    with pytest.raises(ValueError, match="fewer words"):
+        evaluate_depparse(gold, truncated)
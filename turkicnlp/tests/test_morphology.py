@@ -2,36 +2,41 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
 from pathlib import Path
+from types import SimpleNamespace
 
 import pytest
 from turkicnlp.models.document import Document, Sentence, Token, Word
 from turkicnlp.processors.morphology import ApertiumMorphProcessor, NeuralMorphProcessor
-from turkicnlp.resources.tag_mappings import load_tag_map
+from turkicnlp.resources.tag_mappings.base import TagMapper
 from turkicnlp.scripts import Script
 from turkicnlp.scripts.transliterator import Transliterator
 
 
-@dataclass
-class _FakeTransducer:
-    results: list[tuple[str, float]]
+def _fake_transducer(results: list[tuple[str, float]]) -> SimpleNamespace:
+    return SimpleNamespace(lookup=lambda surface: results)
 
-    def lookup(self, surface: str) -> list[tuple[str, float]]:
-        return self.results
 
+def _echo_transducer(expected_surface: str, results: list[tuple[str, float]]) -> SimpleNamespace:
+    """Return *results* only for *expected_surface*, recording the last lookup."""
 
-@dataclass
-class _EchoTransducer:
-    expected_surface: str
-    results: list[tuple[str, float]]
-    last_surface: str | None = None
+    def lookup(surface: str) -> list[tuple[str, float]]:
+        transducer.last_surface = surface
+        return results if surface == expected_surface else []
 
-    def lookup(self, surface: str) -> list[tuple[str, float]]:
-        self.last_surface = surface
-        if surface != self.expected_surface:
-            return []
-        return self.results
+    transducer = SimpleNamespace(lookup=lookup, last_surface=None)
+    return transducer
+
+
+def _single_word_doc(text: str, script: str) -> Document:
+    word = Word(id=1, text=text)
+    return Document(
+        text=text,
+        sentences=[
+            Sentence(text=text, tokens=[Token(id=(1,), text=text, words=[word])], words=[word])
+        ],
+        script=script,
+    )
 
 
 class TestApertiumMorphProcessor:
@@ -40,15 +45,14 @@ class TestApertiumMorphProcessor:
         assert proc.NAME == "morph"
         assert "tokenize" in proc.REQUIRES
 
-    def test_provides(self) -> None:
-        assert "lemma" in ApertiumMorphProcessor.PROVIDES
-        assert "pos" in ApertiumMorphProcessor.PROVIDES
-        assert "feats" in ApertiumMorphProcessor.PROVIDES
+    @pytest.mark.parametrize("field", ["lemma", "pos", "feats"])
+    def test_provides(self, field: str) -> None:
+        assert field in ApertiumMorphProcessor.PROVIDES
 
     def test_analyze_parses_readings(self) -> None:
         proc = ApertiumMorphProcessor(lang="kaz")
-        proc._analyzer = _FakeTransducer(
-            results=[
+        proc._analyzer = _fake_transducer(
+            [
                 ("мектеп<n><dat><sg>", 0.5),
                 ("мектеп/мектеп<n><nom><sg>", 1.0),
             ]
@@ -61,8 +65,8 @@ class TestApertiumMorphProcessor:
 
     def test_analyze_strips_hfst_epsilon_marker(self) -> None:
         proc = ApertiumMorphProcessor(lang="kaz")
-        proc._analyzer = _FakeTransducer(
-            results=[
+        proc._analyzer = _fake_transducer(
+            [
                 ("@_EPSILON_SYMBOL_@бар<v><past><p3><sg>", 0.0),
             ]
         )
@@ -74,8 +78,8 @@ class TestApertiumMorphProcessor:
 
     def test_analyze_strips_generic_internal_markers(self) -> None:
         proc = ApertiumMorphProcessor(lang="kaz")
-        proc._analyzer = _FakeTransducer(
-            results=[
+        proc._analyzer = _fake_transducer(
+            [
                 ("@PMATCH_BACKTRACK@бар<v><past><p3><sg>", 0.0),
             ]
         )
@@ -118,30 +122,24 @@ class TestApertiumMorphProcessor:
         best = proc._disambiguate(readings, sentence_words=words, word_index=0, surface_text="Ali")
         assert best["pos"] == "np"
 
-    def test_process_with_transliteration(self) -> None:
+    def test_process_with_transliteration(
+        self,
+        tag_map_kaz: TagMapper,
+        kaz_latn_to_cyrl: Transliterator,
+        kaz_cyrl_to_latn: Transliterator,
+    ) -> None:
         proc = ApertiumMorphProcessor(lang="kaz", script=Script.LATIN)
-        proc._tag_mapper = load_tag_map("kaz")
+        proc._tag_mapper = tag_map_kaz
         proc._apertium_script = Script.CYRILLIC
         proc._needs_translit = True
-        proc._to_fst_translit = Transliterator("kaz", Script.LATIN, Script.CYRILLIC)
-        proc._from_fst_translit = Transliterator("kaz", Script.CYRILLIC, Script.LATIN)
-        proc._analyzer = _EchoTransducer(
+        proc._to_fst_translit = kaz_latn_to_cyrl
+        proc._from_fst_translit = kaz_cyrl_to_latn
+        proc._analyzer = _echo_transducer(
             expected_surface="мектеп",
             results=[("мектеп<n><nom><sg>", 0.0)],
         )
 
-        word = Word(id=1, text="mektep")
-        doc = Document(
-            text="mektep",
-            sentences=[
-                Sentence(
-                    text="mektep",
-                    tokens=[Token(id=(1,), text="mektep", words=[word])],
-                    words=[word],
-                )
-            ],
-            script="Latn",
-        )
+        doc = _single_word_doc("mektep", "Latn")
 
         proc.process(doc)
         word = doc.sentences[0].words[0]
@@ -150,17 +148,12 @@ class TestApertiumMorphProcessor:
         assert word.feats == "Case=Nom|Number=Sing"
         assert proc._analyzer.last_surface == "мектеп"
 
-    def test_process_forces_punct_without_lookup(self) -> None:
+    def test_process_forces_punct_without_lookup(self, tag_map_kaz: TagMapper) -> None:
         proc = ApertiumMorphProcessor(lang="kaz")
-        proc._tag_mapper = load_tag_map("kaz")
-        proc._analyzer = _FakeTransducer(results=[])
-
-        punct = Word(id=1, text=".")
-        doc = Document(
-            text=".",
-            sentences=[Sentence(text=".", tokens=[Token(id=(1,), text=".", words=[punct])], words=[punct])],
-            script="Cyrl",
-        )
+        proc._tag_mapper = tag_map_kaz
+        proc._analyzer = _fake_transducer([])
+
+        doc = _single_word_doc(".", "Cyrl")
 
         proc.process(doc)
         out = doc.sentences[0].words[0]
@@ -168,46 +161,30 @@ class TestApertiumMorphProcessor:
         assert out.upos == "PUNCT"
         assert out.feats == "_"
 
-    def test_fallback_for_unknown_word_tags_as_x(self) -> None:
+    def test_fallback_for_unknown_word_tags_as_x(self, tag_map_tur: TagMapper) -> None:
         # When the FST returns no analyses and none of the heuristics apply,
         # the word is tagged as X (unknown). Lexicon-based fallback for known
         # closed-class items like postpositions is a planned future feature.
         proc = ApertiumMorphProcessor(lang="tur")
-        proc._tag_mapper = load_tag_map("tur")
-        proc._analyzer = _FakeTransducer(results=[])
-
-        word = Word(id=1, text="ile")
-        doc = Document(
-            text="ile",
-            sentences=[Sentence(text="ile", tokens=[Token(id=(1,), text="ile", words=[word])], words=[word])],
-            script="Latn",
-        )
+        proc._tag_mapper = tag_map_tur
+        proc._analyzer = _fake_transducer([])
+
+        doc = _single_word_doc("ile", "Latn")
 
         proc.process(doc)
         out = doc.sentences[0].words[0]
         assert out.lemma == "ile"
         assert out.upos == "X"
 
-    def test_lookup_normalizes_apostrophe_variants(self) -> None:
+    def test_lookup_normalizes_apostrophe_variants(self, tag_map_uzb: TagMapper) -> None:
         proc = ApertiumMorphProcessor(lang="uzb")
-        proc._tag_mapper = load_tag_map("uzb")
-        proc._analyzer = _EchoTransducer(
+        proc._tag_mapper = tag_map_uzb
+        proc._analyzer = _echo_transducer(
             expected_surface="o'g'il",
             results=[("o'g'il<n><nom><sg>", 0.0)],
         )
 
-        word = Word(id=1, text="o‘g‘il")
-        doc = Document(
-            text="o‘g‘il",
-            sentences=[
-                Sentence(
-                    text="o‘g‘il",
-                    tokens=[Token(id=(1,), text="o‘g‘il", words=[word])],
-                    words=[word],
-                )
-            ],
-            script="Latn",
-        )
+        doc = _single_word_doc("o‘g‘il", "Latn")
 
         proc.process(doc)
         out = doc.sentences[0].words[0]
@@ -215,19 +192,14 @@ class TestApertiumMorphProcessor:
         assert out.lemma == "o'g'il"
         assert out.upos == "NOUN"
 
-    def test_feature_cleanup_drops_verb_feats_on_propn(self) -> None:
+    def test_feature_cleanup_drops_verb_feats_on_propn(self, tag_map_tur: TagMapper) -> None:
         proc = ApertiumMorphProcessor(lang="tur")
-        proc._tag_mapper = load_tag_map("tur")
-        proc._analyzer = _FakeTransducer(
-            results=[("Ali<np><nom><p3><aor>", 0.0)],
+        proc._tag_mapper = tag_map_tur
+        proc._analyzer = _fake_transducer(
+            [("Ali<np><nom><p3><aor>", 0.0)],
         )
 
-        word = Word(id=1, text="Ali")
-        doc = Document(
-            text="Ali",
-            sentences=[Sentence(text="Ali", tokens=[Token(id=(1,), text="Ali", words=[word])], words=[word])],
-            script="Latn",
-        )
+        doc = _single_word_doc("Ali", "Latn")
         proc.process(doc)
         out = doc.sentences[0].words[0]
         assert out.upos == "PROPN"
@@ -240,23 +212,8 @@ class TestNeuralMorphProcessor:
         assert proc.NAME == "morph"
 
 
-def test_load_requires_hfst(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
-    model_dir = tmp_path / "morph" / "apertium"
-    model_dir.mkdir(parents=True)
-    (model_dir / "kaz.automorf.hfst").write_text("stub")
-
-    class _FakeStream:
-        def __init__(self, path: str) -> None:
-            self.path = path
-
-        def read(self) -> _FakeTransducer:
-            return _FakeTransducer(results=[])
-
-    class _FakeHfst:
-        HfstInputStream = _FakeStream
-
-    monkeypatch.setitem(__import__("sys").modules, "hfst", _FakeHfst)
-
+@pytest.mark.usefixtures("hfst_stub")
+def test_load_requires_hfst(fake_morph_model: Path) -> None:
     proc = ApertiumMorphProcessor(lang="kaz")
-    proc.load(model_dir)
+    proc.load(fake_morph_model)
     assert proc._analyzer is not None
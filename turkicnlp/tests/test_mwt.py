@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import functools
+
 import pytest
 
 from turkicnlp.models.document import Document
@@ -11,14 +13,28 @@ from turkicnlp.processors.tokenizer_arabic import ArabicScriptTokenizer
 from turkicnlp.scripts import Script
 
 
-def _tokenize(lang: str, script: Script, text: str) -> Document:
-    doc = Document(text=text, lang=lang, script=script.value)
+# Processors keep no per-document state after load(), so one loaded
+# instance per (lang, script) is shared by every test that needs it.
+@functools.lru_cache(maxsize=None)
+def _tokenizer(lang: str, script: Script) -> RegexTokenizer | ArabicScriptTokenizer:
     if script == Script.PERSO_ARABIC:
         tok = ArabicScriptTokenizer(lang=lang, script=script)
     else:
         tok = RegexTokenizer(lang=lang, script=script)
     tok.load()
-    tok.process(doc)
+    return tok
+
+
+@functools.lru_cache(maxsize=None)
+def _mwt(lang: str, script: Script) -> MWTProcessor:
+    mwt = MWTProcessor(lang=lang, script=script)
+    mwt.load("")
+    return mwt
+
+
+def _tokenize(lang: str, script: Script, text: str) -> Document:
+    doc = Document(text=text, lang=lang, script=script.value)
+    _tokenizer(lang, script).process(doc)
     return doc
 
 
@@ -53,9 +69,7 @@ def test_mwt_expansion_with_default_rules(
     lang: str, script: Script, text: str, surface: str, pieces: list[str]
 ) -> None:
     doc = _tokenize(lang, script, text)
-    mwt = MWTProcessor(lang=lang, script=script)
-    mwt.load("")
-    mwt.process(doc)
+    _mwt(lang, script).process(doc)
 
     assert doc.sentences[0].tokens[0].is_mwt
     assert doc.sentences[0].tokens[0].text == surface
@@ -64,9 +78,7 @@ def test_mwt_expansion_with_default_rules(
 
 def test_mwt_no_rule_no_change() -> None:
     doc = _tokenize("tur", Script.LATIN, "Merhaba dunya.")
-    mwt = MWTProcessor(lang="tur", script=Script.LATIN)
-    mwt.load("")
-    mwt.process(doc)
+    _mwt("tur", Script.LATIN).process(doc)
 
     assert not doc.sentences[0].tokens[0].is_mwt
     assert doc.sentences[0].tokens[0].text == "Merhaba"
@@ -4,14 +4,14 @@ from __future__ import annotations
 
 import pytest
 
-from turkicnlp.pipeline import PROCESSOR_ORDER, Pipeline
+from turkicnlp.pipeline import PROCESSOR_ORDER, PROCESSOR_ORDER_INDEX, Pipeline
 
 
 class TestProcessorOrder:
     def test_canonical_order(self) -> None:
         assert "tokenize" in PROCESSOR_ORDER
-        assert PROCESSOR_ORDER.index("tokenize") < PROCESSOR_ORDER.index("pos")
-        assert PROCESSOR_ORDER.index("pos") < PROCESSOR_ORDER.index("depparse")
+        assert PROCESSOR_ORDER_INDEX["tokenize"] < PROCESSOR_ORDER_INDEX["pos"]
+        assert PROCESSOR_ORDER_INDEX["pos"] < PROCESSOR_ORDER_INDEX["depparse"]
 
     def test_script_steps_in_order(self) -> None:
         assert "script_detect" in PROCESSOR_ORDER
@@ -20,20 +20,62 @@ class TestProcessorOrder:
 
     def test_embeddings_in_order(self) -> None:
         assert "embeddings" in PROCESSOR_ORDER
-        assert PROCESSOR_ORDER.index("embeddings") < PROCESSOR_ORDER.index("sentiment")
+        assert PROCESSOR_ORDER_INDEX["embeddings"] < PROCESSOR_ORDER_INDEX["sentiment"]
 
 
 class TestPipelineInit:
     def test_invalid_script_raises(self) -> None:
         with pytest.raises(ValueError, match="not available"):
-            Pipeline("tur", script="Cyrl")
+            Pipeline._validate_script("tur", "Cyrl")
 
-    def test_valid_script(self) -> None:
-        # Should not raise
-        pipe = Pipeline("kaz", script="Cyrl")
-        assert pipe.lang == "kaz"
+    def test_auto_script_is_not_validated(self) -> None:
+        assert Pipeline._validate_script("tur", "auto") is None
+
+    def test_valid_script(self, kaz_pipeline: Pipeline) -> None:
+        assert kaz_pipeline.lang == "kaz"
+        assert kaz_pipeline._explicit_script
+
+    def test_reverse_transliterator_built_once(self) -> None:
+        pipe = Pipeline("kaz", script="Cyrl", transliterate_to="Latn")
+        assert pipe._transliterate_back_enabled
+        reverse = pipe._reverse_transliterator
+        assert (reverse.source, reverse.target) == (
+            pipe._transliterator.target,
+            pipe._transliterator.source,
+        )
 
     def test_resolve_noncanonical_processor(self) -> None:
         pipe = Pipeline("tur", processors=None)
         resolved = pipe._resolve_dependencies(["translate"])
         assert "translate" in resolved
+
+
+class TestPipelineBatch:
+    def test_batch_matches_single_calls(self) -> None:
+        pipe = Pipeline("kaz", processors=["tokenize"], script="Cyrl", tokenize_backend="rule")
+        texts = ["Мен мектепке бардым. Сен ше?", "Рақмет!"]
+        docs = pipe.batch(texts)
+        assert [d.to_conllu() for d in docs] == [pipe(t).to_conllu() for t in texts]
+
+    def test_batch_uses_tokenizer_process_pool(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        from turkicnlp.processors import tokenizer
+
+        pools = []
+
+        class RecordingPool(tokenizer.ProcessPoolExecutor):
+            def __init__(self, *args, **kwargs) -> None:
+                super().__init__(*args, **kwargs)
+                pools.append(self)
+
+        monkeypatch.setattr(tokenizer, "ProcessPoolExecutor", RecordingPool)
+        pipe = Pipeline(
+            "kaz",
+            processors=["tokenize"],
+            script="Cyrl",
+            tokenize_backend="rule",
+            tokenize_num_workers=2,
+        )
+        docs = pipe.batch(["Мен мектепке бардым.", "Рақмет!"])
+
+        assert len(pools) == 1
+        assert [len(d.words) for d in docs] == [4, 2]
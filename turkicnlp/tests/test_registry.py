@@ -31,3 +31,17 @@ class TestProcessorRegistry:
     def test_get_any(self) -> None:
         cls = ProcessorRegistry.get_any("tokenize")
         assert cls is not None
+
+    def test_lazy_registration(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        from turkicnlp.processors.tokenizer import RegexTokenizer
+
+        monkeypatch.setattr(ProcessorRegistry, "_registry", {"tokenize": {}})
+        ProcessorRegistry.register("tokenize", "missing", "turkicnlp.no_such_module:Tokenizer")
+        ProcessorRegistry.register(
+            "tokenize", "lazy", "turkicnlp.processors.tokenizer:RegexTokenizer"
+        )
+
+        with pytest.raises(ImportError, match="Backend 'missing'"):
+            ProcessorRegistry.get("tokenize", "missing")
+        assert ProcessorRegistry.get_any("tokenize") is RegexTokenizer
+        assert ProcessorRegistry._registry["tokenize"]["lazy"] is RegexTokenizer
@@ -2,10 +2,35 @@
 
 from __future__ import annotations
 
+import unicodedata
+
 import pytest
 
-from turkicnlp.scripts import Script
-from turkicnlp.scripts.detector import detect_script, detect_script_segments
+from turkicnlp.scripts import Script, get_script_config
+from turkicnlp.scripts._script_tables import UNICODE_VERSION
+from turkicnlp.scripts.detector import (
+    SCRIPT_RANGES,
+    _char_to_script,
+    _detect_script_spans_short,
+    detect_script,
+    detect_script_bytes,
+    detect_script_for_language,
+    detect_script_segments,
+    detect_script_spans,
+)
+
+
+@pytest.mark.skipif(
+    unicodedata.unidata_version != UNICODE_VERSION,
+    reason="generated script table targets a different Unicode version",
+)
+def test_generated_table_matches_script_ranges() -> None:
+    for script, ranges in SCRIPT_RANGES.items():
+        for start, end in ranges:
+            for cp in range(start, end + 1):
+                char = chr(cp)
+                neutral = unicodedata.category(char).startswith(("N", "P", "Z", "S", "C"))
+                assert _char_to_script(char) == (None if neutral else script), hex(cp)
 
 
 class TestDetectScript:
@@ -18,11 +43,22 @@ class TestDetectScript:
     def test_arabic(self) -> None:
         assert detect_script("مەن مەكتەپكە باردىم") == Script.PERSO_ARABIC
 
+    def test_old_turkic_runic(self) -> None:
+        assert detect_script("\U00010c34\U00010c07\U00010c3a 😀") == Script.OLD_TURKIC_RUNIC
+
     def test_empty_raises(self) -> None:
         with pytest.raises(ValueError):
             detect_script("123 !?")
 
 
+class TestDetectScriptBytes:
+    def test_utf8(self) -> None:
+        assert detect_script_bytes("Мен мектепке бардым".encode()) == Script.CYRILLIC
+
+    def test_malformed_bytes_are_ignored(self) -> None:
+        assert detect_script_bytes(b"\xffMen mektepke\xc3") == Script.LATIN
+
+
 class TestDetectScriptSegments:
     def test_empty(self) -> None:
         assert detect_script_segments("") == []
@@ -35,3 +71,31 @@ class TestDetectScriptSegments:
     def test_mixed(self) -> None:
         segments = detect_script_segments("Hello мир")
         assert len(segments) == 2
+
+    def test_spans_match_segments(self) -> None:
+        text = "  Salom, дунё! Yana"
+        spans = detect_script_spans(text)
+        assert spans == [(2, 9, Script.LATIN), (9, 15, Script.CYRILLIC), (15, 19, Script.LATIN)]
+        assert [(text[s:e], scr) for s, e, scr in spans] == detect_script_segments(text)
+
+    def test_short_text_segments_are_cached(self) -> None:
+        text = "Salom дунё"
+        first = detect_script_segments(text)
+        hits = _detect_script_spans_short.cache_info().hits
+        first.clear()
+        assert detect_script_segments(text) == [("Salom ", Script.LATIN), ("дунё", Script.CYRILLIC)]
+        assert _detect_script_spans_short.cache_info().hits == hits + 1
+
+
+class TestDetectScriptForLanguage:
+    def test_long_primary_text(self) -> None:
+        text = "Мен мектепке бардым. " * 50
+        assert detect_script_for_language(text, "kaz", get_script_config("kaz")) == Script.CYRILLIC
+
+    def test_secondary_script(self) -> None:
+        text = "Men mektepke bardym. " * 50
+        assert detect_script_for_language(text, "kaz", get_script_config("kaz")) == Script.LATIN
+
+    def test_unavailable_script_raises(self) -> None:
+        with pytest.raises(ValueError, match="not a known script"):
+            detect_script_for_language("Мен мектепке бардым", "tur", get_script_config("tur"))
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import dataclasses
+
 import pytest
 
 from turkicnlp.scripts import (
@@ -20,10 +22,9 @@ class TestScript:
 
 
 class TestLanguageScripts:
-    def test_all_languages_have_config(self) -> None:
-        expected_langs = {"tur", "kaz", "uzb", "aze", "kir", "tat", "uig", "bak"}
-        for lang in expected_langs:
-            assert lang in LANGUAGE_SCRIPTS
+    @pytest.mark.parametrize("lang", ["tur", "kaz", "uzb", "aze", "kir", "tat", "uig", "bak"])
+    def test_language_has_config(self, lang: str) -> None:
+        assert lang in LANGUAGE_SCRIPTS
 
     def test_turkish_latin_only(self) -> None:
         cfg = get_script_config("tur")
@@ -35,6 +36,17 @@ class TestLanguageScripts:
         assert Script.CYRILLIC in cfg.available
         assert Script.LATIN in cfg.available
 
+    def test_available_is_frozenset_with_ordered_view(self) -> None:
+        cfg = get_script_config("uig")
+        assert isinstance(cfg.available, frozenset)
+        assert cfg.available_ordered[0] == Script.PERSO_ARABIC
+        assert set(cfg.available_ordered) == cfg.available
+
+    def test_config_is_frozen(self) -> None:
+        cfg = get_script_config("kaz")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            cfg.primary = Script.LATIN  # type: ignore[misc]
+
     def test_uyghur_rtl(self) -> None:
         cfg = get_script_config("uig")
         assert cfg.direction == "rtl"
@@ -4,11 +4,11 @@ from __future__ import annotations
 
 from pathlib import Path
 from types import SimpleNamespace
-from unittest.mock import MagicMock, patch
 
 import pytest
 
 from turkicnlp.models.document import Document, Sentence, Token, Word
+from turkicnlp.processors import stanza_backend
 from turkicnlp.processors.stanza_backend import (
     STANZA_SUPPORTED_LANGUAGES,
     StanzaDepParser,
@@ -22,12 +22,117 @@ from turkicnlp.processors.stanza_backend import (
     _is_custom_stanza,
     _build_custom_kwargs,
     _get_custom_model_dir,
-    _LANG_MAP,
     _CUSTOM_STANZA_LANGS,
     _CUSTOM_MODEL_PATH_KWARGS,
     _CUSTOM_PRETRAIN_KWARGS,
 )
 
+_EXPECTED_STANZA_LANG = {
+    "tur": "tr", "kaz": "kk", "uig": "ug", "kir": "ky",
+    "ota": "ota", "aze": "az", "uzb": "uz", "tuk": "tk", "tat": "tt", "bak": "ba",
+}
+
+
+def _mock_tokenized(text: str, spans: list[tuple[int, int]]) -> SimpleNamespace:
+    """A one-sentence mock Stanza doc with one single-word token per span."""
+    tokens = [
+        SimpleNamespace(
+            words=[SimpleNamespace(text=text[start:end])], start_char=start, end_char=end
+        )
+        for start, end in spans
+    ]
+    return SimpleNamespace(sentences=[SimpleNamespace(text=text, tokens=tokens)])
+
+
+def _mock_tagged(**columns) -> SimpleNamespace:
+    """A one-sentence mock Stanza doc; each keyword lists one attribute for every word."""
+    words = [SimpleNamespace(**dict(zip(columns, values))) for values in zip(*columns.values())]
+    return SimpleNamespace(sentences=[SimpleNamespace(words=words)])
+
+
+def _pretokenized_doc(lang: str, words: list[Word], tokenizer: str = "stanza") -> Document:
+    """A one-sentence Document whose *words* were already produced by *tokenizer*."""
+    text = " ".join(w.text for w in words)
+    doc = Document(text=text, lang=lang, sentences=[Sentence(text=text, tokens=[], words=words)])
+    doc._processor_log.append(f"tokenize:{tokenizer}")
+    return doc
+
+
+# Mock Stanza outputs are only read by the processors, so one instance of
+# each is shared by every test that needs it.
+@pytest.fixture(scope="session")
+def stanza_mock_sent_tur() -> SimpleNamespace:
+    return _mock_tokenized("Merhaba", [(0, 7)])
+
+
+@pytest.fixture(scope="session")
+def stanza_mock_mwt_tur() -> SimpleNamespace:
+    mwt_token = SimpleNamespace(
+        text="evde",
+        words=[SimpleNamespace(text="ev"), SimpleNamespace(text="de")],
+        start_char=0,
+        end_char=4,
+    )
+    return SimpleNamespace(sentences=[SimpleNamespace(text="evde", tokens=[mwt_token])])
+
+
+@pytest.fixture(scope="session")
+def stanza_mock_pos_tur() -> SimpleNamespace:
+    return _mock_tagged(
+        upos=["INTJ", "NOUN"], xpos=["Interj", "Noun"], feats=["", "Case=Nom|Number=Sing"]
+    )
+
+
+@pytest.fixture(scope="session")
+def stanza_mock_ner_tur() -> SimpleNamespace:
+    tokens = [
+        SimpleNamespace(ner=tag, words=[SimpleNamespace(text=text)])
+        for text, tag in (("Ahmet", "B-PER"), ("Yılmaz", "E-PER"), ("geldi", "O"))
+    ]
+    return SimpleNamespace(sentences=[SimpleNamespace(tokens=tokens)])
+
+
+@pytest.fixture
+def set_stanza_result(monkeypatch):
+    """Make a ``_StanzaManager`` run method return a fixed mock document."""
+
+    def _set(mock_doc, method="run_full"):
+        monkeypatch.setattr(_StanzaManager, method, lambda *_args, **_kwargs: mock_doc)
+
+    return _set
+
+
+def _use_models_root(monkeypatch, root):
+    monkeypatch.setattr(stanza_backend, "ModelRegistry", SimpleNamespace(default_dir=lambda: root))
+    return root
+
+
+@pytest.fixture
+def models_root(monkeypatch, tmp_path):
+    """Point the Stanza backend's model registry at an empty *tmp_path*."""
+    return _use_models_root(monkeypatch, tmp_path)
+
+
+_CUSTOM_MODEL_FILES = ("tokenizer.pt", "tagger.pt", "lemmatizer.pt", "parser.pt", "pretrain.pt")
+
+
+@pytest.fixture(scope="class")
+def seeded_models_dir(tmp_path_factory):
+    """A model root with every fake custom model file for uzb and aze, written once."""
+    root = tmp_path_factory.mktemp("models")
+    for lang in ("uzb", "aze"):
+        model_dir = root / "stanza_custom" / lang
+        model_dir.mkdir(parents=True)
+        for name in _CUSTOM_MODEL_FILES:
+            (model_dir / name).touch()
+    return root
+
+
+@pytest.fixture
+def seeded_models_root(monkeypatch, seeded_models_dir):
+    """Point the Stanza backend's model registry at :func:`seeded_models_dir`."""
+    return _use_models_root(monkeypatch, seeded_models_dir)
+
 
 # ---------------------------------------------------------------------------
 # Unit tests (no Stanza installation required)
@@ -36,31 +141,18 @@ from turkicnlp.processors.stanza_backend import (
 
 class TestLangMapping:
     def test_supported_languages(self):
-        assert "tur" in STANZA_SUPPORTED_LANGUAGES
-        assert "kaz" in STANZA_SUPPORTED_LANGUAGES
-        assert "uig" in STANZA_SUPPORTED_LANGUAGES
-        assert "kir" in STANZA_SUPPORTED_LANGUAGES
-        assert "ota" in STANZA_SUPPORTED_LANGUAGES
-        assert "aze" in STANZA_SUPPORTED_LANGUAGES
-        assert "uzb" in STANZA_SUPPORTED_LANGUAGES
-        assert "tuk" in STANZA_SUPPORTED_LANGUAGES
+        assert _EXPECTED_STANZA_LANG.keys() <= STANZA_SUPPORTED_LANGUAGES
 
     def test_get_stanza_lang(self):
-        assert _get_stanza_lang("tur") == "tr"
-        assert _get_stanza_lang("kaz") == "kk"
-        assert _get_stanza_lang("uig") == "ug"
-        assert _get_stanza_lang("kir") == "ky"
-        assert _get_stanza_lang("ota") == "ota"
-        assert _get_stanza_lang("aze") == "az"
-        assert _get_stanza_lang("uzb") == "uz"
-        assert _get_stanza_lang("tuk") == "tk"
+        for code, expected in _EXPECTED_STANZA_LANG.items():
+            assert _get_stanza_lang(code) == expected
 
     def test_get_stanza_lang_unsupported(self):
         with pytest.raises(ValueError, match="not supported"):
             _get_stanza_lang("eng")
 
     def test_lang_map_consistency(self):
-        assert set(_LANG_MAP.keys()) == STANZA_SUPPORTED_LANGUAGES
+        assert _EXPECTED_STANZA_LANG.keys() == STANZA_SUPPORTED_LANGUAGES
 
 
 class TestCustomStanzaUnit:
@@ -90,36 +182,18 @@ class TestCustomStanzaUnit:
 
     def test_custom_model_path_kwargs_complete(self):
         """All four processor types have model path kwargs."""
-        assert "tokenize" in _CUSTOM_MODEL_PATH_KWARGS
-        assert "pos" in _CUSTOM_MODEL_PATH_KWARGS
-        assert "lemma" in _CUSTOM_MODEL_PATH_KWARGS
-        assert "depparse" in _CUSTOM_MODEL_PATH_KWARGS
+        assert {"tokenize", "pos", "lemma", "depparse"} <= _CUSTOM_MODEL_PATH_KWARGS.keys()
 
     def test_custom_pretrain_kwargs(self):
         """pos and depparse need pretrain paths."""
-        assert "pos" in _CUSTOM_PRETRAIN_KWARGS
-        assert "depparse" in _CUSTOM_PRETRAIN_KWARGS
-        assert "tokenize" not in _CUSTOM_PRETRAIN_KWARGS
-        assert "lemma" not in _CUSTOM_PRETRAIN_KWARGS
+        assert {"pos", "depparse"} <= _CUSTOM_PRETRAIN_KWARGS.keys()
+        assert _CUSTOM_PRETRAIN_KWARGS.keys().isdisjoint({"tokenize", "lemma"})
 
-    def test_build_custom_kwargs_with_files(self, tmp_path):
+    def test_build_custom_kwargs_with_files(self, seeded_models_root):
         """Test _build_custom_kwargs produces correct pipeline kwargs."""
-        # Create fake model files
-        model_dir = tmp_path / "stanza_custom" / "uzb"
-        model_dir.mkdir(parents=True)
-        (model_dir / "tokenizer.pt").write_bytes(b"fake")
-        (model_dir / "tagger.pt").write_bytes(b"fake")
-        (model_dir / "lemmatizer.pt").write_bytes(b"fake")
-        (model_dir / "parser.pt").write_bytes(b"fake")
-        (model_dir / "pretrain.pt").write_bytes(b"fake")
-
-        with patch(
-            "turkicnlp.processors.stanza_backend.ModelRegistry"
-        ) as mock_reg:
-            mock_reg.default_dir.return_value = tmp_path
-            kwargs = _build_custom_kwargs(
-                "uzb", ["tokenize", "pos", "lemma", "depparse"]
-            )
+        model_dir = seeded_models_root / "stanza_custom" / "uzb"
+
+        kwargs = _build_custom_kwargs("uzb", ["tokenize", "pos", "lemma", "depparse"])
 
         assert kwargs["lang"] == "uz"
         assert kwargs["allow_unknown_language"] is True
@@ -131,23 +205,11 @@ class TestCustomStanzaUnit:
         assert kwargs["pos_pretrain_path"] == str(model_dir / "pretrain.pt")
         assert kwargs["depparse_pretrain_path"] == str(model_dir / "pretrain.pt")
 
-    def test_build_custom_kwargs_with_files_aze(self, tmp_path):
+    def test_build_custom_kwargs_with_files_aze(self, seeded_models_root):
         """Test _build_custom_kwargs works for Azerbaijani custom models."""
-        model_dir = tmp_path / "stanza_custom" / "aze"
-        model_dir.mkdir(parents=True)
-        (model_dir / "tokenizer.pt").write_bytes(b"fake")
-        (model_dir / "tagger.pt").write_bytes(b"fake")
-        (model_dir / "lemmatizer.pt").write_bytes(b"fake")
-        (model_dir / "parser.pt").write_bytes(b"fake")
-        (model_dir / "pretrain.pt").write_bytes(b"fake")
-
-        with patch(
-            "turkicnlp.processors.stanza_backend.ModelRegistry"
-        ) as mock_reg:
-            mock_reg.default_dir.return_value = tmp_path
-            kwargs = _build_custom_kwargs(
-                "aze", ["tokenize", "pos", "lemma", "depparse"]
-            )
+        model_dir = seeded_models_root / "stanza_custom" / "aze"
+
+        kwargs = _build_custom_kwargs("aze", ["tokenize", "pos", "lemma", "depparse"])
 
         assert kwargs["lang"] == "az"
         assert kwargs["allow_unknown_language"] is True
@@ -159,44 +221,28 @@ class TestCustomStanzaUnit:
         assert kwargs["pos_pretrain_path"] == str(model_dir / "pretrain.pt")
         assert kwargs["depparse_pretrain_path"] == str(model_dir / "pretrain.pt")
 
-    def test_build_custom_kwargs_missing_model(self, tmp_path):
+    def test_build_custom_kwargs_missing_model(self, models_root):
         """FileNotFoundError when model file is missing."""
-        model_dir = tmp_path / "stanza_custom" / "uzb"
+        model_dir = models_root / "stanza_custom" / "uzb"
         model_dir.mkdir(parents=True)
         # No files created
 
-        with patch(
-            "turkicnlp.processors.stanza_backend.ModelRegistry"
-        ) as mock_reg:
-            mock_reg.default_dir.return_value = tmp_path
-            with pytest.raises(FileNotFoundError, match="tokenizer.pt"):
-                _build_custom_kwargs("uzb", ["tokenize"])
+        with pytest.raises(FileNotFoundError, match="tokenizer.pt"):
+            _build_custom_kwargs("uzb", ["tokenize"])
 
-    def test_build_custom_kwargs_missing_pretrain(self, tmp_path):
+    def test_build_custom_kwargs_missing_pretrain(self, models_root):
         """FileNotFoundError when pretrain file is missing."""
-        model_dir = tmp_path / "stanza_custom" / "uzb"
+        model_dir = models_root / "stanza_custom" / "uzb"
         model_dir.mkdir(parents=True)
-        (model_dir / "tagger.pt").write_bytes(b"fake")
+        (model_dir / "tagger.pt").touch()
         # pretrain.pt not created
 
-        with patch(
-            "turkicnlp.processors.stanza_backend.ModelRegistry"
-        ) as mock_reg:
-            mock_reg.default_dir.return_value = tmp_path
-            with pytest.raises(FileNotFoundError, match="pretrain.pt"):
-                _build_custom_kwargs("uzb", ["pos"])
+        with pytest.raises(FileNotFoundError, match="pretrain.pt"):
+            _build_custom_kwargs("uzb", ["pos"])
 
-    def test_build_custom_kwargs_subset(self, tmp_path):
+    def test_build_custom_kwargs_subset(self, seeded_models_root):
         """Only requested processors appear in the kwargs."""
-        model_dir = tmp_path / "stanza_custom" / "uzb"
-        model_dir.mkdir(parents=True)
-        (model_dir / "tokenizer.pt").write_bytes(b"fake")
-
-        with patch(
-            "turkicnlp.processors.stanza_backend.ModelRegistry"
-        ) as mock_reg:
-            mock_reg.default_dir.return_value = tmp_path
-            kwargs = _build_custom_kwargs("uzb", ["tokenize"])
+        kwargs = _build_custom_kwargs("uzb", ["tokenize"])
 
         assert kwargs["processors"] == "tokenize"
         assert "tokenize_model_path" in kwargs
@@ -218,31 +264,18 @@ class TestStanzaTokenizerUnit:
         assert StanzaTokenizer.PROVIDES == ["tokenize"]
         assert StanzaTokenizer.REQUIRES == []
 
-    def test_process_maps_sentences_and_tokens_turkish(self):
+    def test_process_maps_sentences_and_tokens_turkish(
+        self, set_stanza_result, stanza_mock_sent_tur
+    ):
         """Test that StanzaTokenizer correctly maps Stanza output to Document."""
         tokenizer = StanzaTokenizer(lang="tur")
         tokenizer._use_gpu = False
         tokenizer._loaded = True
 
-        # Build a mock Stanza Document
-        mock_word = SimpleNamespace(text="Merhaba")
-        mock_token = SimpleNamespace(
-            words=[mock_word],
-            start_char=0,
-            end_char=7,
-        )
-        mock_sent = SimpleNamespace(
-            text="Merhaba",
-            tokens=[mock_token],
-        )
-        mock_stanza_doc = SimpleNamespace(sentences=[mock_sent])
-
         doc = Document(text="Merhaba", lang="tur")
 
-        with patch.object(
-            _StanzaManager, "run_full", return_value=mock_stanza_doc
-        ):
-            result = tokenizer.process(doc)
+        set_stanza_result(stanza_mock_sent_tur)
+        result = tokenizer.process(doc)
 
         assert len(result.sentences) == 1
         assert len(result.sentences[0].words) == 1
@@ -254,144 +287,59 @@ class TestStanzaTokenizerUnit:
         assert result.sentences[0].tokens[0].id == (1,)
         assert "tokenize:stanza" in result._processor_log
 
-    def test_process_maps_sentences_kazakh(self):
-        """Test tokenizer with Kazakh Cyrillic text."""
-        tokenizer = StanzaTokenizer(lang="kaz")
-        tokenizer._use_gpu = False
-        tokenizer._loaded = True
-
-        mock_w1 = SimpleNamespace(text="Мен")
-        mock_w2 = SimpleNamespace(text="бардым")
-        mock_t1 = SimpleNamespace(words=[mock_w1], start_char=0, end_char=3)
-        mock_t2 = SimpleNamespace(words=[mock_w2], start_char=4, end_char=10)
-        mock_sent = SimpleNamespace(
-            text="Мен бардым", tokens=[mock_t1, mock_t2]
-        )
-        mock_stanza_doc = SimpleNamespace(sentences=[mock_sent])
-
-        doc = Document(text="Мен бардым", lang="kaz")
-        with patch.object(
-            _StanzaManager, "run_full", return_value=mock_stanza_doc
-        ):
-            result = tokenizer.process(doc)
-
-        assert len(result.sentences) == 1
-        assert len(result.sentences[0].words) == 2
-        assert result.sentences[0].words[0].text == "Мен"
-        assert result.sentences[0].words[1].text == "бардым"
-
-    def test_process_maps_sentences_kyrgyz(self):
-        """Test tokenizer with Kyrgyz Cyrillic text."""
-        tokenizer = StanzaTokenizer(lang="kir")
-        tokenizer._use_gpu = False
-        tokenizer._loaded = True
-
-        mock_w1 = SimpleNamespace(text="Мен")
-        mock_w2 = SimpleNamespace(text="бардым")
-        mock_t1 = SimpleNamespace(words=[mock_w1], start_char=0, end_char=3)
-        mock_t2 = SimpleNamespace(words=[mock_w2], start_char=4, end_char=10)
-        mock_sent = SimpleNamespace(
-            text="Мен бардым", tokens=[mock_t1, mock_t2]
-        )
-        mock_stanza_doc = SimpleNamespace(sentences=[mock_sent])
-
-        doc = Document(text="Мен бардым", lang="kir")
-        with patch.object(
-            _StanzaManager, "run_full", return_value=mock_stanza_doc
-        ):
-            result = tokenizer.process(doc)
-
-        assert len(result.sentences) == 1
-        assert len(result.sentences[0].words) == 2
-        assert result.sentences[0].words[0].text == "Мен"
-        assert result.sentences[0].words[1].text == "бардым"
-
-    def test_process_maps_sentences_uzbek(self):
-        """Test tokenizer with Uzbek Latin text."""
-        tokenizer = StanzaTokenizer(lang="uzb")
+    def test_bulk_process_primes_stanza_cache(self, monkeypatch, stanza_mock_sent_tur):
+        tokenizer = StanzaTokenizer(lang="tur")
         tokenizer._use_gpu = False
         tokenizer._loaded = True
-
-        mock_w1 = SimpleNamespace(text="Men")
-        mock_w2 = SimpleNamespace(text="ketdim")
-        mock_w3 = SimpleNamespace(text=".")
-        mock_t1 = SimpleNamespace(words=[mock_w1], start_char=0, end_char=3)
-        mock_t2 = SimpleNamespace(words=[mock_w2], start_char=4, end_char=10)
-        mock_t3 = SimpleNamespace(words=[mock_w3], start_char=10, end_char=11)
-        mock_sent = SimpleNamespace(
-            text="Men ketdim.",
-            tokens=[mock_t1, mock_t2, mock_t3],
-        )
-        mock_stanza_doc = SimpleNamespace(sentences=[mock_sent])
-
-        doc = Document(text="Men ketdim.", lang="uzb")
-        with patch.object(
-            _StanzaManager, "run_full", return_value=mock_stanza_doc
-        ):
-            result = tokenizer.process(doc)
-
-        assert len(result.sentences) == 1
-        assert len(result.sentences[0].words) == 3
-        assert result.sentences[0].words[0].text == "Men"
-        assert result.sentences[0].words[1].text == "ketdim"
-        assert result.sentences[0].words[2].text == "."
-
-    def test_process_maps_sentences_turkmen(self):
-        """Test tokenizer with Turkmen Latin text."""
-        tokenizer = StanzaTokenizer(lang="tuk")
+        batched = []
+
+        def fake_batch(docs, use_gpu=False):
+            batched.append(docs)
+            for doc in docs:
+                doc._stanza_full_cache = stanza_mock_sent_tur
+            return [stanza_mock_sent_tur] * len(docs)
+
+        monkeypatch.setattr(_StanzaManager, "run_full_batch", fake_batch)
+        docs = [Document(text="Merhaba", lang="tur") for _ in range(3)]
+
+        results = tokenizer.bulk_process(docs)
+
+        assert results == docs
+        assert batched == [docs]
+        assert all(doc.words[0].text == "Merhaba" for doc in results)
+
+    @pytest.mark.parametrize(
+        "lang,text,spans",
+        [
+            ("kaz", "Мен бардым", [(0, 3), (4, 10)]),
+            ("kir", "Мен бардым", [(0, 3), (4, 10)]),
+            ("uzb", "Men ketdim.", [(0, 3), (4, 10), (10, 11)]),
+            ("tuk", "Men gitdim.", [(0, 3), (4, 10), (10, 11)]),
+        ],
+    )
+    def test_process_maps_sentences(self, set_stanza_result, lang, text, spans):
+        """Test tokenizer output mapping for each supported language."""
+        tokenizer = StanzaTokenizer(lang=lang)
         tokenizer._use_gpu = False
         tokenizer._loaded = True
 
-        mock_w1 = SimpleNamespace(text="Men")
-        mock_w2 = SimpleNamespace(text="gitdim")
-        mock_w3 = SimpleNamespace(text=".")
-        mock_t1 = SimpleNamespace(words=[mock_w1], start_char=0, end_char=3)
-        mock_t2 = SimpleNamespace(words=[mock_w2], start_char=4, end_char=10)
-        mock_t3 = SimpleNamespace(words=[mock_w3], start_char=10, end_char=11)
-        mock_sent = SimpleNamespace(
-            text="Men gitdim.",
-            tokens=[mock_t1, mock_t2, mock_t3],
-        )
-        mock_stanza_doc = SimpleNamespace(sentences=[mock_sent])
-
-        doc = Document(text="Men gitdim.", lang="tuk")
-        with patch.object(
-            _StanzaManager, "run_full", return_value=mock_stanza_doc
-        ):
-            result = tokenizer.process(doc)
+        doc = Document(text=text, lang=lang)
+        set_stanza_result(_mock_tokenized(text, spans))
+        result = tokenizer.process(doc)
 
         assert len(result.sentences) == 1
-        assert len(result.sentences[0].words) == 3
-        assert result.sentences[0].words[0].text == "Men"
-        assert result.sentences[0].words[1].text == "gitdim"
-        assert result.sentences[0].words[2].text == "."
+        assert [w.text for w in result.sentences[0].words] == [text[s:e] for s, e in spans]
 
-    def test_process_maps_mwt(self):
+    def test_process_maps_mwt(self, set_stanza_result, stanza_mock_mwt_tur):
         """Test MWT handling: one token with multiple words."""
         tokenizer = StanzaTokenizer(lang="tur")
         tokenizer._use_gpu = False
         tokenizer._loaded = True
 
-        mock_word1 = SimpleNamespace(text="ev")
-        mock_word2 = SimpleNamespace(text="de")
-        mock_mwt_token = SimpleNamespace(
-            text="evde",
-            words=[mock_word1, mock_word2],
-            start_char=0,
-            end_char=4,
-        )
-        mock_sent = SimpleNamespace(
-            text="evde",
-            tokens=[mock_mwt_token],
-        )
-        mock_stanza_doc = SimpleNamespace(sentences=[mock_sent])
-
         doc = Document(text="evde", lang="tur")
 
-        with patch.object(
-            _StanzaManager, "run_full", return_value=mock_stanza_doc
-        ):
-            result = tokenizer.process(doc)
+        set_stanza_result(stanza_mock_mwt_tur)
+        result = tokenizer.process(doc)
 
         assert len(result.sentences[0].tokens) == 1
         token = result.sentences[0].tokens[0]
@@ -412,29 +360,16 @@ class TestStanzaPOSTaggerUnit:
         assert StanzaPOSTagger.PROVIDES == ["pos", "feats"]
         assert StanzaPOSTagger.REQUIRES == ["tokenize"]
 
-    def test_process_full_mode_turkish(self):
+    def test_process_full_mode_turkish(self, set_stanza_result, stanza_mock_pos_tur):
         """Test POS tagger in full Stanza mode (tokenize:stanza in log)."""
         tagger = StanzaPOSTagger(lang="tur")
         tagger._use_gpu = False
         tagger._loaded = True
 
-        # Pre-populate document with tokenization
-        w1 = Word(id=1, text="Merhaba")
-        w2 = Word(id=2, text="dünya")
-        sent = Sentence(text="Merhaba dünya", tokens=[], words=[w1, w2])
-        doc = Document(text="Merhaba dünya", lang="tur", sentences=[sent])
-        doc._processor_log.append("tokenize:stanza")
+        doc = _pretokenized_doc("tur", [Word(id=1, text="Merhaba"), Word(id=2, text="dünya")])
 
-        # Mock Stanza output
-        mock_w1 = SimpleNamespace(upos="INTJ", xpos="Interj", feats="")
-        mock_w2 = SimpleNamespace(upos="NOUN", xpos="Noun", feats="Case=Nom|Number=Sing")
-        mock_sent = SimpleNamespace(words=[mock_w1, mock_w2])
-        mock_stanza_doc = SimpleNamespace(sentences=[mock_sent])
-
-        with patch.object(
-            _StanzaManager, "run_full", return_value=mock_stanza_doc
-        ):
-            result = tagger.process(doc)
+        set_stanza_result(stanza_mock_pos_tur)
+        result = tagger.process(doc)
 
         assert result.sentences[0].words[0].upos == "INTJ"
         assert result.sentences[0].words[0].xpos == "Interj"
@@ -442,108 +377,63 @@ class TestStanzaPOSTaggerUnit:
         assert result.sentences[0].words[1].feats == "Case=Nom|Number=Sing"
         assert "pos:stanza" in result._processor_log
 
-    def test_process_full_mode_kazakh(self):
-        """Test POS tagger with Kazakh text."""
-        tagger = StanzaPOSTagger(lang="kaz")
+    @pytest.mark.parametrize(
+        "lang,words,tags",
+        [
+            (
+                "kaz",
+                ["Мен", "бардым"],
+                [
+                    ("PRON", "Case=Nom|Number=Sing|Person=1|PronType=Prs"),
+                    ("VERB", "Mood=Ind|Number=Sing|Person=1|Tense=Past|VerbForm=Fin"),
+                ],
+            ),
+            (
+                "uzb",
+                ["Men", "maktabga", "ketdim"],
+                [
+                    ("PRON", "Case=Nom|Number=Sing|Person=1|PronType=Prs"),
+                    ("NOUN", "Case=Dat|Number=Sing"),
+                    ("VERB", "Mood=Ind|Number=Sing|Person=1|Tense=Past|VerbForm=Fin"),
+                ],
+            ),
+            (
+                "tuk",
+                ["Men", "mekdebe", "gitdim"],
+                [
+                    ("PRON", "Case=Nom|Number=Sing|Person=1|PronType=Prs"),
+                    ("NOUN", "Case=Dat|Number=Sing"),
+                    ("VERB", "Mood=Ind|Number=Sing|Person=1|Tense=Past|VerbForm=Fin"),
+                ],
+            ),
+        ],
+    )
+    def test_process_full_mode(self, set_stanza_result, lang, words, tags):
+        """Test POS tagger in full Stanza mode for each supported language."""
+        tagger = StanzaPOSTagger(lang=lang)
         tagger._use_gpu = False
         tagger._loaded = True
 
-        w1 = Word(id=1, text="Мен")
-        w2 = Word(id=2, text="бардым")
-        sent = Sentence(text="Мен бардым", tokens=[], words=[w1, w2])
-        doc = Document(text="Мен бардым", lang="kaz", sentences=[sent])
-        doc._processor_log.append("tokenize:stanza")
-
-        mock_w1 = SimpleNamespace(upos="PRON", xpos=None, feats="Case=Nom|Number=Sing|Person=1|PronType=Prs")
-        mock_w2 = SimpleNamespace(upos="VERB", xpos=None, feats="Mood=Ind|Number=Sing|Person=1|Tense=Past|VerbForm=Fin")
-        mock_sent = SimpleNamespace(words=[mock_w1, mock_w2])
-        mock_stanza_doc = SimpleNamespace(sentences=[mock_sent])
-
-        with patch.object(
-            _StanzaManager, "run_full", return_value=mock_stanza_doc
-        ):
-            result = tagger.process(doc)
+        doc = _pretokenized_doc(lang, [Word(id=i, text=w) for i, w in enumerate(words, 1)])
 
-        assert result.sentences[0].words[0].upos == "PRON"
-        assert result.sentences[0].words[1].upos == "VERB"
+        upos, feats = zip(*tags)
+        set_stanza_result(_mock_tagged(upos=upos, xpos=[None] * len(tags), feats=feats))
+        result = tagger.process(doc)
 
-    def test_process_full_mode_uzbek(self):
-        """Test POS tagger with Uzbek text (custom stanza model)."""
-        tagger = StanzaPOSTagger(lang="uzb")
-        tagger._use_gpu = False
-        tagger._loaded = True
-
-        w1 = Word(id=1, text="Men")
-        w2 = Word(id=2, text="maktabga")
-        w3 = Word(id=3, text="ketdim")
-        sent = Sentence(text="Men maktabga ketdim", tokens=[], words=[w1, w2, w3])
-        doc = Document(text="Men maktabga ketdim", lang="uzb", sentences=[sent])
-        doc._processor_log.append("tokenize:stanza")
-
-        mock_w1 = SimpleNamespace(upos="PRON", xpos=None, feats="Case=Nom|Number=Sing|Person=1|PronType=Prs")
-        mock_w2 = SimpleNamespace(upos="NOUN", xpos=None, feats="Case=Dat|Number=Sing")
-        mock_w3 = SimpleNamespace(upos="VERB", xpos=None, feats="Mood=Ind|Number=Sing|Person=1|Tense=Past|VerbForm=Fin")
-        mock_sent = SimpleNamespace(words=[mock_w1, mock_w2, mock_w3])
-        mock_stanza_doc = SimpleNamespace(sentences=[mock_sent])
-
-        with patch.object(
-            _StanzaManager, "run_full", return_value=mock_stanza_doc
-        ):
-            result = tagger.process(doc)
-
-        assert result.sentences[0].words[0].upos == "PRON"
-        assert result.sentences[0].words[1].upos == "NOUN"
-        assert result.sentences[0].words[2].upos == "VERB"
+        assert [w.upos for w in result.sentences[0].words] == [upos for upos, _ in tags]
         assert "pos:stanza" in result._processor_log
 
-    def test_process_full_mode_turkmen(self):
-        """Test POS tagger with Turkmen text (custom stanza model)."""
-        tagger = StanzaPOSTagger(lang="tuk")
-        tagger._use_gpu = False
-        tagger._loaded = True
-
-        w1 = Word(id=1, text="Men")
-        w2 = Word(id=2, text="mekdebe")
-        w3 = Word(id=3, text="gitdim")
-        sent = Sentence(text="Men mekdebe gitdim", tokens=[], words=[w1, w2, w3])
-        doc = Document(text="Men mekdebe gitdim", lang="tuk", sentences=[sent])
-        doc._processor_log.append("tokenize:stanza")
-
-        mock_w1 = SimpleNamespace(upos="PRON", xpos=None, feats="Case=Nom|Number=Sing|Person=1|PronType=Prs")
-        mock_w2 = SimpleNamespace(upos="NOUN", xpos=None, feats="Case=Dat|Number=Sing")
-        mock_w3 = SimpleNamespace(upos="VERB", xpos=None, feats="Mood=Ind|Number=Sing|Person=1|Tense=Past|VerbForm=Fin")
-        mock_sent = SimpleNamespace(words=[mock_w1, mock_w2, mock_w3])
-        mock_stanza_doc = SimpleNamespace(sentences=[mock_sent])
-
-        with patch.object(
-            _StanzaManager, "run_full", return_value=mock_stanza_doc
-        ):
-            result = tagger.process(doc)
-
-        assert result.sentences[0].words[0].upos == "PRON"
-        assert result.sentences[0].words[1].upos == "NOUN"
-        assert result.sentences[0].words[2].upos == "VERB"
-        assert "pos:stanza" in result._processor_log
-
-    def test_process_pretokenized_mode(self):
+    def test_process_pretokenized_mode(self, set_stanza_result):
         """Test POS tagger in pretokenized mode (non-Stanza tokenizer)."""
         tagger = StanzaPOSTagger(lang="tur")
         tagger._use_gpu = False
         tagger._loaded = True
 
-        w1 = Word(id=1, text="Merhaba", upos=None)
-        sent = Sentence(text="Merhaba", tokens=[], words=[w1])
-        doc = Document(text="Merhaba", lang="tur", sentences=[sent])
-        doc._processor_log.append("tokenize:regex")
+        doc = _pretokenized_doc("tur", [Word(id=1, text="Merhaba", upos=None)], tokenizer="regex")
 
-        mock_w1 = SimpleNamespace(upos="INTJ", xpos=None, feats="")
-        mock_sent = SimpleNamespace(words=[mock_w1])
-        mock_stanza_doc = SimpleNamespace(sentences=[mock_sent])
-
-        with patch.object(
-            _StanzaManager, "run_pretokenized", return_value=mock_stanza_doc
-        ):
-            result = tagger.process(doc)
+        mock_stanza_doc = _mock_tagged(upos=["INTJ"], xpos=[None], feats=[""])
+        set_stanza_result(mock_stanza_doc, method="run_pretokenized")
+        result = tagger.process(doc)
 
         assert result.sentences[0].words[0].upos == "INTJ"
 
@@ -553,237 +443,74 @@ class TestStanzaLemmatizerUnit:
         assert StanzaLemmatizer.NAME == "lemma"
         assert StanzaLemmatizer.PROVIDES == ["lemma"]
 
-    def test_process_turkish(self):
-        lemmatizer = StanzaLemmatizer(lang="tur")
+    @pytest.mark.parametrize(
+        "lang,text,lemma",
+        [
+            ("tur", "evleri", "ev"),
+            ("kaz", "мектепке", "мектеп"),
+            ("kir", "мектепке", "мектеп"),
+            ("uzb", "maktabga", "maktab"),
+            ("tuk", "mekdebe", "mekdep"),
+        ],
+    )
+    def test_process(self, set_stanza_result, lang, text, lemma):
+        lemmatizer = StanzaLemmatizer(lang=lang)
         lemmatizer._use_gpu = False
         lemmatizer._loaded = True
 
-        w1 = Word(id=1, text="evleri", upos="NOUN")
-        sent = Sentence(text="evleri", tokens=[], words=[w1])
-        doc = Document(text="evleri", lang="tur", sentences=[sent])
-        doc._processor_log.append("tokenize:stanza")
-
-        mock_w1 = SimpleNamespace(lemma="ev")
-        mock_sent = SimpleNamespace(words=[mock_w1])
-        mock_stanza_doc = SimpleNamespace(sentences=[mock_sent])
+        doc = _pretokenized_doc(lang, [Word(id=1, text=text, upos="NOUN")])
 
-        with patch.object(
-            _StanzaManager, "run_full", return_value=mock_stanza_doc
-        ):
-            result = lemmatizer.process(doc)
+        set_stanza_result(_mock_tagged(lemma=[lemma]))
+        result = lemmatizer.process(doc)
 
-        assert result.sentences[0].words[0].lemma == "ev"
+        assert result.sentences[0].words[0].lemma == lemma
         assert "lemma:stanza" in result._processor_log
 
-    def test_process_kazakh(self):
-        lemmatizer = StanzaLemmatizer(lang="kaz")
-        lemmatizer._use_gpu = False
-        lemmatizer._loaded = True
-
-        w1 = Word(id=1, text="мектепке", upos="NOUN")
-        sent = Sentence(text="мектепке", tokens=[], words=[w1])
-        doc = Document(text="мектепке", lang="kaz", sentences=[sent])
-        doc._processor_log.append("tokenize:stanza")
-
-        mock_w1 = SimpleNamespace(lemma="мектеп")
-        mock_sent = SimpleNamespace(words=[mock_w1])
-        mock_stanza_doc = SimpleNamespace(sentences=[mock_sent])
-
-        with patch.object(
-            _StanzaManager, "run_full", return_value=mock_stanza_doc
-        ):
-            result = lemmatizer.process(doc)
-
-        assert result.sentences[0].words[0].lemma == "мектеп"
-
-    def test_process_kyrgyz(self):
-        lemmatizer = StanzaLemmatizer(lang="kir")
-        lemmatizer._use_gpu = False
-        lemmatizer._loaded = True
-
-        w1 = Word(id=1, text="мектепке", upos="NOUN")
-        sent = Sentence(text="мектепке", tokens=[], words=[w1])
-        doc = Document(text="мектепке", lang="kir", sentences=[sent])
-        doc._processor_log.append("tokenize:stanza")
-
-        mock_w1 = SimpleNamespace(lemma="мектеп")
-        mock_sent = SimpleNamespace(words=[mock_w1])
-        mock_stanza_doc = SimpleNamespace(sentences=[mock_sent])
-
-        with patch.object(
-            _StanzaManager, "run_full", return_value=mock_stanza_doc
-        ):
-            result = lemmatizer.process(doc)
-
-        assert result.sentences[0].words[0].lemma == "мектеп"
-
-    def test_process_uzbek(self):
-        lemmatizer = StanzaLemmatizer(lang="uzb")
-        lemmatizer._use_gpu = False
-        lemmatizer._loaded = True
-
-        w1 = Word(id=1, text="maktabga", upos="NOUN")
-        sent = Sentence(text="maktabga", tokens=[], words=[w1])
-        doc = Document(text="maktabga", lang="uzb", sentences=[sent])
-        doc._processor_log.append("tokenize:stanza")
-
-        mock_w1 = SimpleNamespace(lemma="maktab")
-        mock_sent = SimpleNamespace(words=[mock_w1])
-        mock_stanza_doc = SimpleNamespace(sentences=[mock_sent])
-
-        with patch.object(
-            _StanzaManager, "run_full", return_value=mock_stanza_doc
-        ):
-            result = lemmatizer.process(doc)
-
-        assert result.sentences[0].words[0].lemma == "maktab"
-
-    def test_process_turkmen(self):
-        lemmatizer = StanzaLemmatizer(lang="tuk")
-        lemmatizer._use_gpu = False
-        lemmatizer._loaded = True
-
-        w1 = Word(id=1, text="mekdebe", upos="NOUN")
-        sent = Sentence(text="mekdebe", tokens=[], words=[w1])
-        doc = Document(text="mekdebe", lang="tuk", sentences=[sent])
-        doc._processor_log.append("tokenize:stanza")
-
-        mock_w1 = SimpleNamespace(lemma="mekdep")
-        mock_sent = SimpleNamespace(words=[mock_w1])
-        mock_stanza_doc = SimpleNamespace(sentences=[mock_sent])
-
-        with patch.object(
-            _StanzaManager, "run_full", return_value=mock_stanza_doc
-        ):
-            result = lemmatizer.process(doc)
-
-        assert result.sentences[0].words[0].lemma == "mekdep"
-
 
 class TestStanzaDepParserUnit:
     def test_class_attributes(self):
         assert StanzaDepParser.NAME == "depparse"
         assert StanzaDepParser.PROVIDES == ["depparse"]
 
-    def test_process_turkish(self):
-        parser = StanzaDepParser(lang="tur")
-        parser._use_gpu = False
-        parser._loaded = True
-
-        w1 = Word(id=1, text="Merhaba", upos="INTJ")
-        w2 = Word(id=2, text="dünya", upos="NOUN")
-        sent = Sentence(text="Merhaba dünya", tokens=[], words=[w1, w2])
-        doc = Document(text="Merhaba dünya", lang="tur", sentences=[sent])
-        doc._processor_log.append("tokenize:stanza")
-
-        mock_w1 = SimpleNamespace(head=0, deprel="root")
-        mock_w2 = SimpleNamespace(head=1, deprel="vocative")
-        mock_sent = SimpleNamespace(words=[mock_w1, mock_w2])
-        mock_stanza_doc = SimpleNamespace(sentences=[mock_sent])
-
-        with patch.object(
-            _StanzaManager, "run_full", return_value=mock_stanza_doc
-        ):
-            result = parser.process(doc)
-
-        assert result.sentences[0].words[0].head == 0
-        assert result.sentences[0].words[0].deprel == "root"
-        assert result.sentences[0].words[1].head == 1
-        assert result.sentences[0].words[1].deprel == "vocative"
-        assert "depparse:stanza" in result._processor_log
-
-    def test_process_kazakh(self):
-        parser = StanzaDepParser(lang="kaz")
-        parser._use_gpu = False
-        parser._loaded = True
-
-        w1 = Word(id=1, text="Мен", upos="PRON")
-        w2 = Word(id=2, text="бардым", upos="VERB")
-        sent = Sentence(text="Мен бардым", tokens=[], words=[w1, w2])
-        doc = Document(text="Мен бардым", lang="kaz", sentences=[sent])
-        doc._processor_log.append("tokenize:stanza")
-
-        mock_w1 = SimpleNamespace(head=2, deprel="nsubj")
-        mock_w2 = SimpleNamespace(head=0, deprel="root")
-        mock_sent = SimpleNamespace(words=[mock_w1, mock_w2])
-        mock_stanza_doc = SimpleNamespace(sentences=[mock_sent])
-
-        with patch.object(
-            _StanzaManager, "run_full", return_value=mock_stanza_doc
-        ):
-            result = parser.process(doc)
-
-        assert result.sentences[0].words[0].head == 2
-        assert result.sentences[0].words[0].deprel == "nsubj"
-        assert result.sentences[0].words[1].head == 0
-        assert result.sentences[0].words[1].deprel == "root"
-
-    def test_process_uzbek(self):
-        """Test depparse with Uzbek (custom stanza model)."""
-        parser = StanzaDepParser(lang="uzb")
+    @pytest.mark.parametrize(
+        "lang,words,arcs",
+        [
+            (
+                "tur",
+                [("Merhaba", "INTJ"), ("dünya", "NOUN")],
+                [(0, "root"), (1, "vocative")],
+            ),
+            (
+                "kaz",
+                [("Мен", "PRON"), ("бардым", "VERB")],
+                [(2, "nsubj"), (0, "root")],
+            ),
+            (
+                "uzb",
+                [("Men", "PRON"), ("maktabga", "NOUN"), ("ketdim", "VERB")],
+                [(3, "nsubj"), (3, "obl"), (0, "root")],
+            ),
+            (
+                "tuk",
+                [("Men", "PRON"), ("mekdebe", "NOUN"), ("gitdim", "VERB")],
+                [(3, "nsubj"), (3, "obl"), (0, "root")],
+            ),
+        ],
+    )
+    def test_process(self, set_stanza_result, lang, words, arcs):
+        parser = StanzaDepParser(lang=lang)
         parser._use_gpu = False
         parser._loaded = True
 
-        w1 = Word(id=1, text="Men", upos="PRON")
-        w2 = Word(id=2, text="maktabga", upos="NOUN")
-        w3 = Word(id=3, text="ketdim", upos="VERB")
-        sent = Sentence(
-            text="Men maktabga ketdim", tokens=[], words=[w1, w2, w3]
+        doc = _pretokenized_doc(
+            lang, [Word(id=i, text=w, upos=upos) for i, (w, upos) in enumerate(words, 1)]
         )
-        doc = Document(
-            text="Men maktabga ketdim", lang="uzb", sentences=[sent]
-        )
-        doc._processor_log.append("tokenize:stanza")
-
-        mock_w1 = SimpleNamespace(head=3, deprel="nsubj")
-        mock_w2 = SimpleNamespace(head=3, deprel="obl")
-        mock_w3 = SimpleNamespace(head=0, deprel="root")
-        mock_sent = SimpleNamespace(words=[mock_w1, mock_w2, mock_w3])
-        mock_stanza_doc = SimpleNamespace(sentences=[mock_sent])
-
-        with patch.object(
-            _StanzaManager, "run_full", return_value=mock_stanza_doc
-        ):
-            result = parser.process(doc)
-
-        assert result.sentences[0].words[0].deprel == "nsubj"
-        assert result.sentences[0].words[1].deprel == "obl"
-        assert result.sentences[0].words[2].deprel == "root"
-        assert result.sentences[0].words[2].head == 0
-        assert "depparse:stanza" in result._processor_log
 
-    def test_process_turkmen(self):
-        """Test depparse with Turkmen (custom stanza model)."""
-        parser = StanzaDepParser(lang="tuk")
-        parser._use_gpu = False
-        parser._loaded = True
+        heads, deprels = zip(*arcs)
+        set_stanza_result(_mock_tagged(head=heads, deprel=deprels))
+        result = parser.process(doc)
 
-        w1 = Word(id=1, text="Men", upos="PRON")
-        w2 = Word(id=2, text="mekdebe", upos="NOUN")
-        w3 = Word(id=3, text="gitdim", upos="VERB")
-        sent = Sentence(
-            text="Men mekdebe gitdim", tokens=[], words=[w1, w2, w3]
-        )
-        doc = Document(
-            text="Men mekdebe gitdim", lang="tuk", sentences=[sent]
-        )
-        doc._processor_log.append("tokenize:stanza")
-
-        mock_w1 = SimpleNamespace(head=3, deprel="nsubj")
-        mock_w2 = SimpleNamespace(head=3, deprel="obl")
-        mock_w3 = SimpleNamespace(head=0, deprel="root")
-        mock_sent = SimpleNamespace(words=[mock_w1, mock_w2, mock_w3])
-        mock_stanza_doc = SimpleNamespace(sentences=[mock_sent])
-
-        with patch.object(
-            _StanzaManager, "run_full", return_value=mock_stanza_doc
-        ):
-            result = parser.process(doc)
-
-        assert result.sentences[0].words[0].deprel == "nsubj"
-        assert result.sentences[0].words[1].deprel == "obl"
-        assert result.sentences[0].words[2].deprel == "root"
-        assert result.sentences[0].words[2].head == 0
+        assert [(w.head, w.deprel) for w in result.sentences[0].words] == arcs
         assert "depparse:stanza" in result._processor_log
 
 
@@ -793,7 +520,7 @@ class TestStanzaNERUnit:
         assert StanzaNERProcessor.PROVIDES == ["ner"]
         assert StanzaNERProcessor.REQUIRES == ["tokenize"]
 
-    def test_process_maps_bio_and_entities(self):
+    def test_process_maps_bio_and_entities(self, set_stanza_result, stanza_mock_ner_tur):
         ner = StanzaNERProcessor(lang="tur")
         ner._use_gpu = False
         ner._loaded = True
@@ -801,18 +528,10 @@ class TestStanzaNERUnit:
         w1 = Word(id=1, text="Ahmet", start_char=0, end_char=5)
         w2 = Word(id=2, text="Yılmaz", start_char=6, end_char=12)
         w3 = Word(id=3, text="geldi", start_char=13, end_char=18)
-        sent = Sentence(text="Ahmet Yılmaz geldi", tokens=[], words=[w1, w2, w3])
-        doc = Document(text=sent.text, lang="tur", sentences=[sent])
-        doc._processor_log.append("tokenize:stanza")
+        doc = _pretokenized_doc("tur", [w1, w2, w3])
 
-        tok1 = SimpleNamespace(ner="B-PER", words=[SimpleNamespace(text="Ahmet")])
-        tok2 = SimpleNamespace(ner="E-PER", words=[SimpleNamespace(text="Yılmaz")])
-        tok3 = SimpleNamespace(ner="O", words=[SimpleNamespace(text="geldi")])
-        mock_sent = SimpleNamespace(tokens=[tok1, tok2, tok3])
-        mock_stanza_doc = SimpleNamespace(sentences=[mock_sent])
-
-        with patch.object(_StanzaManager, "run_full_ner", return_value=mock_stanza_doc):
-            result = ner.process(doc)
+        set_stanza_result(stanza_mock_ner_tur, method="run_full_ner")
+        result = ner.process(doc)
 
         assert result.sentences[0].words[0].ner == "B-PER"
         assert result.sentences[0].words[1].ner == "I-PER"
@@ -833,13 +552,26 @@ class TestStanzaMWTExpanderUnit:
         assert "mwt:stanza" in result._processor_log
 
 
+@pytest.fixture
+def isolated_manager(monkeypatch):
+    """Give ``_StanzaManager`` empty pipeline caches for one test."""
+    for name in (
+        "_full_pipelines",
+        "_pretok_pipelines",
+        "_full_ner_pipelines",
+        "_pretok_ner_pipelines",
+    ):
+        monkeypatch.setattr(_StanzaManager, name, {})
+    return _StanzaManager
+
+
 class TestStanzaManagerUnit:
-    def test_clear(self):
-        _StanzaManager._full_pipelines[("test", False)] = "pipeline"
-        _StanzaManager._pretok_pipelines[("test", False)] = "pipeline"
-        _StanzaManager.clear()
-        assert len(_StanzaManager._full_pipelines) == 0
-        assert len(_StanzaManager._pretok_pipelines) == 0
+    def test_clear(self, isolated_manager):
+        isolated_manager._full_pipelines[("test", False)] = "pipeline"
+        isolated_manager._pretok_pipelines[("test", False)] = "pipeline"
+        isolated_manager.clear()
+        assert len(isolated_manager._full_pipelines) == 0
+        assert len(isolated_manager._pretok_pipelines) == 0
 
     def test_run_full_uses_cache(self):
         """Test that repeated calls reuse the cached Stanza result."""
@@ -858,126 +590,70 @@ class TestStanzaManagerUnit:
         result = _StanzaManager.run_pretokenized(doc)
         assert result is mock_result
 
+    def test_run_full_batch_one_call_per_language(self, isolated_manager, monkeypatch):
+        calls = []
 
-class TestCatalogIntegration:
-    """Test that the catalog lists Stanza backends for all supported languages."""
+        def fake_pipeline(in_docs):
+            calls.append(in_docs)
+            return [SimpleNamespace(text=text) for text in in_docs]
 
-    def test_uzbek_stanza_in_catalog(self):
-        from turkicnlp.resources.downloader import list_processors
+        monkeypatch.setattr(
+            stanza_backend,
+            "_require_stanza",
+            lambda: SimpleNamespace(Document=lambda sentences, text: text),
+        )
+        isolated_manager._full_pipelines[("tur", False)] = fake_pipeline
+        isolated_manager._full_pipelines[("kaz", False)] = fake_pipeline
+        cached = Document(text="önbellek", lang="tur")
+        cached._stanza_full_cache = SimpleNamespace(text="cached")  # type: ignore[attr-defined]
+        docs = [
+            Document(text="bir", lang="tur"),
+            Document(text="бір", lang="kaz"),
+            cached,
+            Document(text="iki", lang="tur"),
+        ]
 
-        procs = list_processors("uzb")
-        assert "tokenize" in procs
-        assert "stanza" in procs["tokenize"]
-        assert "pos" in procs
-        assert "stanza" in procs["pos"]
-        assert "lemma" in procs
-        assert "stanza" in procs["lemma"]
-        assert "depparse" in procs
-        assert "stanza" in procs["depparse"]
-
-    def test_uzbek_stanza_custom_type_in_catalog(self):
-        from turkicnlp.resources.registry import ModelRegistry
-
-        catalog = ModelRegistry.load_catalog()
-        uzb_procs = catalog["uzb"]["processors"]["Latn"]
-        for proc_name in ("tokenize", "pos", "lemma", "depparse"):
-            backend_info = uzb_procs[proc_name]["backends"]["stanza"]
-            assert backend_info["type"] == "stanza_custom"
-            assert "url" in backend_info
-            assert "sha256" in backend_info
+        results = isolated_manager.run_full_batch(docs)
 
-    def test_turkmen_stanza_in_catalog(self):
-        from turkicnlp.resources.downloader import list_processors
+        assert calls == [["bir", "iki"], ["бір"]]
+        assert [r.text for r in results] == ["bir", "бір", "cached", "iki"]
+        assert all(doc._stanza_full_cache is r for doc, r in zip(docs, results))
 
-        procs = list_processors("tuk")
-        assert "tokenize" in procs
-        assert "stanza" in procs["tokenize"]
-        assert "pos" in procs
-        assert "stanza" in procs["pos"]
-        assert "lemma" in procs
-        assert "stanza" in procs["lemma"]
-        assert "depparse" in procs
-        assert "stanza" in procs["depparse"]
-
-    def test_turkmen_stanza_custom_type_in_catalog(self):
-        from turkicnlp.resources.registry import ModelRegistry
-
-        catalog = ModelRegistry.load_catalog()
-        tuk_procs = catalog["tuk"]["processors"]["Latn"]
-        for proc_name in ("tokenize", "pos", "lemma", "depparse"):
-            backend_info = tuk_procs[proc_name]["backends"]["stanza"]
-            assert backend_info["type"] == "stanza_custom"
-            assert "url" in backend_info
-            assert "sha256" in backend_info
 
-    def test_tatar_stanza_in_catalog(self):
-        from turkicnlp.resources.downloader import list_processors
+@pytest.fixture(scope="session")
+def catalog():
+    from turkicnlp.resources.registry import ModelRegistry
+
+    return ModelRegistry.load_catalog()
 
-        procs = list_processors("tat")
-        assert "tokenize" in procs
-        assert "stanza" in procs["tokenize"]
-        assert "pos" in procs
-        assert "stanza" in procs["pos"]
-        assert "lemma" in procs
-        assert "stanza" in procs["lemma"]
-        assert "depparse" in procs
-        assert "stanza" in procs["depparse"]
-
-    def test_tatar_stanza_custom_type_in_catalog(self):
-        from turkicnlp.resources.registry import ModelRegistry
-
-        catalog = ModelRegistry.load_catalog()
-        tat_procs = catalog["tat"]["processors"]["Cyrl"]
-        for proc_name in ("tokenize", "pos", "lemma", "depparse"):
-            backend_info = tat_procs[proc_name]["backends"]["stanza"]
-            assert backend_info["type"] == "stanza_custom"
-            assert "url" in backend_info
-            assert "sha256" in backend_info
 
-    def test_bashkir_stanza_in_catalog(self):
+class TestCatalogIntegration:
+    """Test that the catalog lists Stanza backends for all supported languages."""
+
+    @pytest.mark.parametrize("lang", ["uzb", "tuk", "tat", "bak"])
+    def test_stanza_in_catalog(self, lang):
         from turkicnlp.resources.downloader import list_processors
 
-        procs = list_processors("bak")
-        assert "tokenize" in procs
-        assert "stanza" in procs["tokenize"]
-        assert "pos" in procs
-        assert "stanza" in procs["pos"]
-        assert "lemma" in procs
-        assert "stanza" in procs["lemma"]
-        assert "depparse" in procs
-        assert "stanza" in procs["depparse"]
-
-    def test_bashkir_stanza_custom_type_in_catalog(self):
-        from turkicnlp.resources.registry import ModelRegistry
-
-        catalog = ModelRegistry.load_catalog()
-        bak_procs = catalog["bak"]["processors"]["Cyrl"]
+        procs = list_processors(lang)
+        for proc_name in ("tokenize", "pos", "lemma", "depparse"):
+            assert proc_name in procs
+            assert "stanza" in procs[proc_name]
+
+    @pytest.mark.parametrize(
+        "lang,script", [("uzb", "Latn"), ("tuk", "Latn"), ("tat", "Cyrl"), ("bak", "Cyrl")]
+    )
+    def test_stanza_custom_type_in_catalog(self, catalog, lang, script):
+        lang_procs = catalog[lang]["processors"][script]
         for proc_name in ("tokenize", "pos", "lemma", "depparse"):
-            backend_info = bak_procs[proc_name]["backends"]["stanza"]
+            backend_info = lang_procs[proc_name]["backends"]["stanza"]
             assert backend_info["type"] == "stanza_custom"
             assert "url" in backend_info
             assert "sha256" in backend_info
 
-    def test_turkish_stanza_standard_type(self):
-        from turkicnlp.resources.registry import ModelRegistry
-
-        catalog = ModelRegistry.load_catalog()
-        tur_procs = catalog["tur"]["processors"]["Latn"]
-        assert tur_procs["tokenize"]["backends"]["stanza"]["type"] == "stanza"
-
-    def test_kazakh_stanza_standard_type(self):
-        from turkicnlp.resources.registry import ModelRegistry
-
-        catalog = ModelRegistry.load_catalog()
-        kaz_procs = catalog["kaz"]["processors"]["Cyrl"]
-        assert kaz_procs["tokenize"]["backends"]["stanza"]["type"] == "stanza"
-
-    def test_kyrgyz_stanza_standard_type(self):
-        from turkicnlp.resources.registry import ModelRegistry
-
-        catalog = ModelRegistry.load_catalog()
-        kir_procs = catalog["kir"]["processors"]["Cyrl"]
-        assert kir_procs["tokenize"]["backends"]["stanza"]["type"] == "stanza"
+    @pytest.mark.parametrize("lang,script", [("tur", "Latn"), ("kaz", "Cyrl"), ("kir", "Cyrl")])
+    def test_stanza_standard_type(self, catalog, lang, script):
+        lang_procs = catalog[lang]["processors"][script]
+        assert lang_procs["tokenize"]["backends"]["stanza"]["type"] == "stanza"
 
 
 class TestRegistryIntegration:
@@ -997,126 +673,120 @@ class TestRegistryIntegration:
 # ---------------------------------------------------------------------------
 
 
-@pytest.mark.slow
-class TestStanzaIntegration:
-    """Integration tests that require Stanza and model downloads.
-
-    Run with: pytest -m slow
-    """
-
-    @pytest.fixture(autouse=True)
-    def clear_manager(self):
-        _StanzaManager.clear()
-        yield
-        _StanzaManager.clear()
-
-    def test_full_pipeline_turkish(self):
-        """End-to-end test with Turkish text."""
-        stanza = pytest.importorskip("stanza")
-
-        doc = Document(text="Merhaba dünya.", lang="tur")
-
-        tokenizer = StanzaTokenizer(lang="tur")
-        tokenizer.load()
-
-        pos_tagger = StanzaPOSTagger(lang="tur")
-        pos_tagger.load()
+_FULL_STACK = (StanzaTokenizer, StanzaPOSTagger, StanzaLemmatizer, StanzaDepParser)
 
-        lemmatizer = StanzaLemmatizer(lang="tur")
-        lemmatizer.load()
 
-        dep_parser = StanzaDepParser(lang="tur")
-        dep_parser.load()
+@pytest.fixture(scope="session")
+def stanza_processors():
+    """Load each (language, processor stack) once and share it across the session.
 
-        doc = tokenizer.process(doc)
-        assert len(doc.sentences) >= 1
-        assert len(doc.words) >= 2
+    Custom-trained models are downloaded the first time their language is requested.
+    A language whose download hits a network error (e.g. offline) skips its tests
+    instead of failing them, and is not retried; load errors fail the test. Cached Stanza pipelines are released when
+    the session ends.
+    """
+    pytest.importorskip("stanza")
+    import urllib.error
 
-        doc = pos_tagger.process(doc)
-        assert all(w.upos is not None for w in doc.words)
+    import requests
 
-        doc = lemmatizer.process(doc)
-        assert all(w.lemma is not None for w in doc.words)
+    from turkicnlp.resources.downloader import download
 
-        doc = dep_parser.process(doc)
-        assert all(w.head is not None for w in doc.words)
-        assert all(w.deprel is not None for w in doc.words)
+    network_errors = (urllib.error.URLError, requests.ConnectionError, requests.Timeout)
 
-    def test_full_pipeline_kazakh(self):
-        """End-to-end test with Kazakh Cyrillic text."""
-        stanza = pytest.importorskip("stanza")
+    loaded: dict[tuple[str, tuple[type, ...]], list] = {}
+    downloaded: set[str] = set()
+    unavailable: dict[str, str] = {}
 
-        doc = Document(text="Мен мектепке бардым.", lang="kaz")
+    def get(lang: str, classes: tuple[type, ...] = _FULL_STACK) -> list:
+        if lang in unavailable:
+            pytest.skip(unavailable[lang])
+        key = (lang, classes)
+        if key not in loaded:
+            if _is_custom_stanza(lang) and lang not in downloaded:
+                try:
+                    download(lang, processors=["tokenize", "pos", "lemma", "depparse"])
+                except network_errors as exc:
+                    unavailable[lang] = f"Stanza models for '{lang}' unavailable: {exc}"
+                    pytest.skip(unavailable[lang])
+                downloaded.add(lang)
+            procs = [cls(lang=lang) for cls in classes]
+            for proc in procs:
+                proc.load()
+            loaded[key] = procs
+        return loaded[key]
 
-        for ProcessorClass in [
-            StanzaTokenizer,
-            StanzaPOSTagger,
-            StanzaLemmatizer,
-            StanzaDepParser,
-        ]:
-            proc = ProcessorClass(lang="kaz")
-            proc.load()
-            doc = proc.process(doc)
+    yield get
+    _StanzaManager.clear()
 
-        assert len(doc.sentences) >= 1
-        assert len(doc.words) >= 3
-        assert all(w.upos is not None for w in doc.words)
-        assert all(w.lemma is not None for w in doc.words)
-        assert all(w.head is not None for w in doc.words)
-
-    def test_full_pipeline_kyrgyz(self):
-        """End-to-end test with Kyrgyz Cyrillic text."""
-        stanza = pytest.importorskip("stanza")
-
-        doc = Document(text="Мен мектепке бардым.", lang="kir")
-
-        for ProcessorClass in [
-            StanzaTokenizer,
-            StanzaPOSTagger,
-            StanzaLemmatizer,
-            StanzaDepParser,
-        ]:
-            proc = ProcessorClass(lang="kir")
-            proc.load()
-            doc = proc.process(doc)
 
-        assert len(doc.sentences) >= 1
-        assert len(doc.words) >= 3
-        assert all(w.upos is not None for w in doc.words)
-        assert all(w.lemma is not None for w in doc.words)
-        assert all(w.head is not None for w in doc.words)
+def _conllu_upos(conllu: str) -> set[str]:
+    """The UPOS column values of every word line in a CoNLL-U string."""
+    return {
+        line.split("\t", 4)[3]
+        for line in conllu.splitlines()
+        if line and not line.startswith("#")
+    }
 
-    def test_full_pipeline_uzbek(self):
-        """End-to-end test with Uzbek Latin text (custom Stanza model)."""
-        stanza = pytest.importorskip("stanza")
 
-        # Ensure custom models are downloaded
-        from turkicnlp.resources.downloader import download
+def _run(procs: list, doc: Document) -> Document:
+    for proc in procs:
+        doc = proc.process(doc)
+    return doc
 
-        download("uzb", processors=["tokenize", "pos", "lemma", "depparse"])
 
-        doc = Document(text="Men maktabga ketdim.", lang="uzb")
+@pytest.mark.slow
+class TestStanzaIntegration:
+    """Integration tests that require Stanza and model downloads.
 
-        for ProcessorClass in [
-            StanzaTokenizer,
-            StanzaPOSTagger,
-            StanzaLemmatizer,
-            StanzaDepParser,
-        ]:
-            proc = ProcessorClass(lang="uzb")
-            proc.load()
-            doc = proc.process(doc)
+    Run with: pytest -m slow
+    """
 
+    @pytest.mark.parametrize(
+        "lang,text,min_words",
+        [
+            ("tur", "Merhaba dünya.", 2),
+            ("kaz", "Мен мектепке бардым.", 3),
+            ("kir", "Мен мектепке бардым.", 3),
+            ("uzb", "Men maktabga ketdim.", 3),
+            ("tuk", "Men mekdebe gitdim.", 3),
+        ],
+    )
+    def test_full_pipeline(self, stanza_processors, lang, text, min_words):
+        """End-to-end test for the official and custom-trained Stanza models."""
+        doc = _run(stanza_processors(lang), Document(text=text, lang=lang))
+
+        words = doc.words
         assert len(doc.sentences) >= 1
-        assert len(doc.words) >= 3
-        assert all(w.upos is not None for w in doc.words)
-        assert all(w.lemma is not None for w in doc.words)
-        assert all(w.head is not None for w in doc.words)
-        assert all(w.deprel is not None for w in doc.words)
-
-    def test_pretokenized_mode_turkish(self):
+        assert len(words) >= min_words
+        assert all(w.upos is not None for w in words)
+        assert all(w.lemma is not None for w in words)
+        assert all(w.head is not None for w in words)
+        assert all(w.deprel is not None for w in words)
+
+    @pytest.mark.parametrize(
+        "lang,texts",
+        [
+            ("tur", ["Merhaba dünya.", "Okula gittim.", "Kitap okuyorum."]),
+            ("uzb", ["Men maktabga ketdim.", "Kitob o'qiyapman."]),
+        ],
+    )
+    def test_bulk_pipeline(self, stanza_processors, lang, texts):
+        """Documents tokenized in one Stanza bulk call annotate like single ones."""
+        docs = [Document(text=text, lang=lang) for text in texts]
+        for proc in stanza_processors(lang):
+            docs = proc.bulk_process(docs)
+
+        assert len(docs) == len(texts)
+        for doc in docs:
+            assert len(doc.sentences) >= 1
+            words = doc.words
+            assert all(w.upos is not None for w in words)
+            assert all(w.lemma is not None for w in words)
+            assert all(w.head is not None for w in words)
+
+    def test_pretokenized_mode_turkish(self, stanza_processors):
         """Test Stanza POS/lemma/depparse with rule-based tokenizer."""
-        stanza = pytest.importorskip("stanza")
         from turkicnlp.processors.tokenizer import RegexTokenizer
 
         doc = Document(text="Merhaba dünya.", lang="tur")
@@ -1128,113 +798,30 @@ class TestStanzaIntegration:
         assert "tokenize:regex" in doc._processor_log
 
         # POS tag with Stanza (pretokenized mode)
-        pos_tagger = StanzaPOSTagger(lang="tur")
-        pos_tagger.load()
+        (pos_tagger,) = stanza_processors("tur", (StanzaPOSTagger,))
         doc = pos_tagger.process(doc)
         assert all(w.upos is not None for w in doc.words if w.upos != "PUNCT")
 
-    def test_conllu_export_after_stanza_turkish(self):
+    @pytest.mark.parametrize(
+        "lang,text,expected_upos",
+        [
+            ("tur", "Merhaba dünya.", {"NOUN", "INTJ"}),
+            ("uzb", "Men maktabga ketdim.", {"VERB", "NOUN"}),
+            ("tuk", "Men mekdebe gitdim.", {"VERB", "NOUN"}),
+        ],
+    )
+    def test_conllu_export_after_stanza(self, stanza_processors, lang, text, expected_upos):
         """Test that CoNLL-U export works after Stanza processing."""
-        stanza = pytest.importorskip("stanza")
-
-        doc = Document(text="Merhaba dünya.", lang="tur")
-
-        for ProcessorClass in [
-            StanzaTokenizer,
-            StanzaPOSTagger,
-            StanzaLemmatizer,
-            StanzaDepParser,
-        ]:
-            proc = ProcessorClass(lang="tur")
-            proc.load()
-            doc = proc.process(doc)
+        doc = _run(stanza_processors(lang), Document(text=text, lang=lang))
 
         conllu = doc.to_conllu()
         assert "# text = " in conllu
-        assert "NOUN" in conllu or "INTJ" in conllu
-
-    def test_conllu_export_after_stanza_uzbek(self):
-        """Test CoNLL-U export after custom Stanza processing for Uzbek."""
-        stanza = pytest.importorskip("stanza")
-        from turkicnlp.resources.downloader import download
-
-        download("uzb", processors=["tokenize", "pos", "lemma", "depparse"])
-
-        doc = Document(text="Men maktabga ketdim.", lang="uzb")
-
-        for ProcessorClass in [
-            StanzaTokenizer,
-            StanzaPOSTagger,
-            StanzaLemmatizer,
-            StanzaDepParser,
-        ]:
-            proc = ProcessorClass(lang="uzb")
-            proc.load()
-            doc = proc.process(doc)
-
-        conllu = doc.to_conllu()
-        assert "# text = " in conllu
-        assert "VERB" in conllu or "NOUN" in conllu
-
-    def test_full_pipeline_turkmen(self):
-        """End-to-end test with Turkmen Latin text (custom Stanza model)."""
-        stanza = pytest.importorskip("stanza")
+        assert not expected_upos.isdisjoint(_conllu_upos(conllu))
 
-        # Ensure custom models are downloaded
-        from turkicnlp.resources.downloader import download
-
-        download("tuk", processors=["tokenize", "pos", "lemma", "depparse"])
-
-        doc = Document(text="Men mekdebe gitdim.", lang="tuk")
-
-        for ProcessorClass in [
-            StanzaTokenizer,
-            StanzaPOSTagger,
-            StanzaLemmatizer,
-            StanzaDepParser,
-        ]:
-            proc = ProcessorClass(lang="tuk")
-            proc.load()
-            doc = proc.process(doc)
-
-        assert len(doc.sentences) >= 1
-        assert len(doc.words) >= 3
-        assert all(w.upos is not None for w in doc.words)
-        assert all(w.lemma is not None for w in doc.words)
-        assert all(w.head is not None for w in doc.words)
-        assert all(w.deprel is not None for w in doc.words)
-
-    def test_conllu_export_after_stanza_turkmen(self):
-        """Test CoNLL-U export after custom Stanza processing for Turkmen."""
-        stanza = pytest.importorskip("stanza")
-        from turkicnlp.resources.downloader import download
-
-        download("tuk", processors=["tokenize", "pos", "lemma", "depparse"])
-
-        doc = Document(text="Men mekdebe gitdim.", lang="tuk")
-
-        for ProcessorClass in [
-            StanzaTokenizer,
-            StanzaPOSTagger,
-            StanzaLemmatizer,
-            StanzaDepParser,
-        ]:
-            proc = ProcessorClass(lang="tuk")
-            proc.load()
-            doc = proc.process(doc)
-
-        conllu = doc.to_conllu()
-        assert "# text = " in conllu
-        assert "VERB" in conllu or "NOUN" in conllu
-
-    def test_kazakh_pipeline(self):
+    def test_kazakh_pipeline(self, stanza_processors):
         """Test Stanza with Kazakh text."""
-        stanza = pytest.importorskip("stanza")
+        (tokenizer,) = stanza_processors("kaz", (StanzaTokenizer,))
 
-        doc = Document(text="Сәлем әлем.", lang="kaz")
-
-        tokenizer = StanzaTokenizer(lang="kaz")
-        tokenizer.load()
-        doc = tokenizer.process(doc)
+        doc = tokenizer.process(Document(text="Сәлем әлем.", lang="kaz"))
         assert len(doc.sentences) >= 1
         assert len(doc.words) >= 1
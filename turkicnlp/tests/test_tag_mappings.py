@@ -6,6 +6,7 @@ import pytest
 
 from turkicnlp.resources.tag_mappings import load_tag_map
 from turkicnlp.resources.tag_mappings.base import TagMapper
+from turkicnlp.resources.tag_mappings.turkic_common import CommonTurkicTagMapper
 
 
 class TestTagMapper:
@@ -26,6 +27,14 @@ class TestTagMapper:
         assert unknown == ["dat", "sg", "mystery"]
 
 
+class TestCommonTurkicMapper:
+    def test_feature_coverage(self) -> None:
+        feat_map = CommonTurkicTagMapper.FEAT_MAP
+        for tag in ("du", "excl", "incl", "prog", "perf", "comp", "sup", "f", "refl"):
+            assert tag in feat_map
+        assert feat_map["ind"] == "PronType=Ind"
+
+
 class TestKazakhMapper:
     def test_load(self) -> None:
         mapper = load_tag_map("kaz")
@@ -33,6 +42,16 @@ class TestKazakhMapper:
         assert "Case=Dat" in mapper.to_ud_feats(["dat"])
 
 
+    def test_mapper_is_cached(self) -> None:
+        assert load_tag_map("kaz") is load_tag_map("kaz")
+        assert load_tag_map("kaz") is not load_tag_map("tur")
+
+    def test_cached_feat_map_is_read_only(self) -> None:
+        with pytest.raises(TypeError):
+            load_tag_map("kaz").FEAT_MAP["dat"] = "Case=Acc"  # type: ignore[index]
+        assert "Case=Dat" in load_tag_map("kaz").to_ud_feats(["dat"])
+
+
 class TestTurkishMapper:
     def test_load(self) -> None:
         mapper = load_tag_map("tur")
@@ -60,12 +79,21 @@ class TestTurkmenMapper:
         assert unknown == ["unknown_tag"]
 
 
+@pytest.fixture
+def mapper(request: pytest.FixtureRequest) -> TagMapper:
+    """The (cached) tag mapper for the language passed by indirect parametrization."""
+    return load_tag_map(request.param)
+
+
 @pytest.mark.parametrize(
-    "lang",
-    ["aze", "uzb", "uig", "kir", "bak", "crh", "kaa", "nog", "kum", "krc", "alt", "tyv", "kjh", "chv", "gag", "sah"],
+    "mapper",
+    [
+        "aze", "uzb", "uig", "kir", "bak", "crh", "kaa", "nog",
+        "kum", "krc", "alt", "tyv", "kjh", "chv", "gag", "sah",
+    ],
+    indirect=True,
 )
-def test_common_turkic_mappers(lang: str) -> None:
-    mapper = load_tag_map(lang)
+def test_common_turkic_mappers(mapper: TagMapper) -> None:
     # Should use a non-empty mapper (not bare default fallback) for Apertium languages.
     assert mapper.__class__.__name__ != "TagMapper"
     assert "Case=Dat" in mapper.to_ud_feats(["dat"])
@@ -73,7 +101,7 @@ def test_common_turkic_mappers(lang: str) -> None:
 
 
 @pytest.mark.parametrize(
-    ("lang", "feat", "expected"),
+    ("mapper", "feat", "expected"),
     [
         ("tur", "ifi", "Evident=Nfh"),
         ("tuk", "qst", "PartType=Int"),
@@ -83,7 +111,7 @@ def test_common_turkic_mappers(lang: str) -> None:
         ("tyv", "cvb", "VerbForm=Conv"),
         ("uzb", "prog", "Aspect=Prog"),
     ],
+    indirect=["mapper"],
 )
-def test_language_specific_feat_overrides(lang: str, feat: str, expected: str) -> None:
-    mapper = load_tag_map(lang)
+def test_language_specific_feat_overrides(mapper: TagMapper, feat: str, expected: str) -> None:
     assert expected in mapper.to_ud_feats([feat])
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import functools
+
 import pytest
 
 from turkicnlp.models.document import Document
@@ -10,6 +12,17 @@ from turkicnlp.processors.tokenizer_arabic import ArabicScriptTokenizer
 from turkicnlp.scripts import Script
 
 
+@functools.lru_cache(maxsize=None)
+def _tokenizer(lang: str, script: Script) -> RegexTokenizer | ArabicScriptTokenizer:
+    """A loaded tokenizer for *lang*/*script*, shared by every test that asks for it."""
+    if script == Script.PERSO_ARABIC:
+        tok = ArabicScriptTokenizer(lang=lang, script=script)
+    else:
+        tok = RegexTokenizer(lang=lang, script=script)
+    tok.load()
+    return tok
+
+
 class TestRegexTokenizer:
     def test_instantiation(self) -> None:
         tok = RegexTokenizer(lang="kaz")
@@ -47,6 +60,40 @@ class TestRegexTokenizer:
         ]
         assert words2[1].upos == "PUNCT"
 
+    def test_only_trailing_punct_is_detached(self) -> None:
+        tok = RegexTokenizer(lang="kaz")
+        tok.load()
+        doc = tok.process(Document(text="a" + "." * 5000 + "b ...?! ok\")."))
+
+        assert [w.text for w in doc.words] == [
+            "a" + "." * 5000 + "b", "...?!", "ok", '"', ")", ".",
+        ]
+
+    def test_tokenize_batch_matches_process(self) -> None:
+        tok = RegexTokenizer(lang="kaz")
+        tok.load()
+        texts = ["Мен мектепке бардым. Сен ше?", "", "Ол (үйде) отыр..."]
+        batch = tok.tokenize_batch(texts)
+
+        expected = []
+        sent_id = 0
+        for doc_id, text in enumerate(texts):
+            for sentence in tok.process(Document(text=text)).sentences:
+                expected += [(doc_id, sent_id, w.start_char, w.end_char) for w in sentence.words]
+                sent_id += 1
+        columns = ("doc_id", "sent_id", "starts", "ends")
+        assert list(zip(*(batch[c].tolist() for c in columns))) == expected
+
+    def test_bulk_process_with_workers_matches_process(self) -> None:
+        texts = ["Мен мектепке бардым. Сен ше?", "Ол (үйде) отыр...", "Рақмет!"]
+        tok = RegexTokenizer(lang="kaz", config={"num_workers": 2})
+        tok.load()
+        docs = tok.bulk_process([Document(text=t) for t in texts])
+
+        expected = [_tokenizer("kaz", Script.CYRILLIC).process(Document(text=t)) for t in texts]
+        assert [d.to_conllu() for d in docs] == [d.to_conllu() for d in expected]
+        assert docs[0]._processor_log == ["tokenize:regex"]
+
 
 class TestArabicScriptTokenizer:
     def test_instantiation(self) -> None:
@@ -79,6 +126,19 @@ class TestArabicScriptTokenizer:
         ]
         assert words2[1].upos == "PUNCT"
 
+    def test_unicode_punct_detached_but_word_internal_marks_kept(self) -> None:
+        tok = ArabicScriptTokenizer(lang="uig")
+        tok.load()
+        doc = tok.process(Document(text="مەن, ئۇيغۇر-تۈرك: 3٫5"))
+
+        assert [(w.text, w.upos) for w in doc.words] == [
+            ("مەن", None),
+            (",", "PUNCT"),
+            ("ئۇيغۇر-تۈرك", None),
+            (":", "PUNCT"),
+            ("3٫5", None),
+        ]
+
 
 @pytest.mark.parametrize(
     "lang,script,text,expected",
@@ -109,13 +169,8 @@ class TestArabicScriptTokenizer:
     ],
 )
 def test_tokenization_examples(lang: str, script: Script, text: str, expected: list[str]) -> None:
-    if script == Script.PERSO_ARABIC:
-        tok = ArabicScriptTokenizer(lang=lang, script=script)
-    else:
-        tok = RegexTokenizer(lang=lang, script=script)
-    tok.load()
     doc = Document(text=text, script=script.value, lang=lang)
-    tok.process(doc)
+    _tokenizer(lang, script).process(doc)
     tokens = [w.text for s in doc.sentences for w in s.words]
     assert tokens == expected
 
@@ -148,13 +203,10 @@ def test_tokenization_examples(lang: str, script: Script, text: str, expected: l
         ("otk", Script.LATIN, "Korkut ata geldi.", ["Korkut", "ata", "geldi", "."]),
     ],
 )
-def test_tokenization_historic_names(lang: str, script: Script, text: str, expected: list[str]) -> None:
-    if script == Script.PERSO_ARABIC:
-        tok = ArabicScriptTokenizer(lang=lang, script=script)
-    else:
-        tok = RegexTokenizer(lang=lang, script=script)
-    tok.load()
+def test_tokenization_historic_names(
+    lang: str, script: Script, text: str, expected: list[str]
+) -> None:
     doc = Document(text=text, script=script.value, lang=lang)
-    tok.process(doc)
+    _tokenizer(lang, script).process(doc)
     tokens = [w.text for s in doc.sentences for w in s.words]
     assert tokens == expected
@@ -6,7 +6,7 @@ import sys
 from types import SimpleNamespace
 
 from turkicnlp.models.document import Document, Sentence
-from turkicnlp.processors.translate import NLLBTranslateProcessor
+from turkicnlp.processors.translate import NLLBCTranslate2Processor, NLLBTranslateProcessor
 
 
 class _FakeTensor:
@@ -135,3 +135,164 @@ def test_translate_processor_unsupported_target(monkeypatch):
         assert "Unsupported translate_tgt_lang='zzz'" in str(exc)
     else:
         raise AssertionError("Expected ValueError for unsupported target language")
+
+
+def test_translate_processor_bulk_batches_across_documents(monkeypatch):
+    monkeypatch.setitem(sys.modules, "torch", _FakeTorch())
+    monkeypatch.setitem(
+        sys.modules,
+        "transformers",
+        SimpleNamespace(
+            AutoTokenizer=_FakeAutoTokenizer,
+            AutoModelForSeq2SeqLM=_FakeAutoModelForSeq2SeqLM,
+        ),
+    )
+
+    proc = NLLBTranslateProcessor(lang="tur", config={"tgt_lang": "eng", "batch_size": 2})
+    proc.load("/tmp/fake-models")
+
+    first = Document(
+        text="Merhaba dünya.",
+        lang="tur",
+        sentences=[Sentence(text="Merhaba"), Sentence(text="dünya")],
+    )
+    second = Document(text="Nasılsın?", lang="tur")
+    out = proc.bulk_process([first, second])
+
+    # The fake decoder numbers outputs per generate() call. Batches are
+    # grouped by length, so the two shortest sentences ("dünya", "Merhaba")
+    # share the first batch and the longest restarts at 1 in a second one.
+    assert out == [first, second]
+    assert first.translation == "translated-2\ntranslated-1"
+    assert second.sentences[0].translation == "translated-1"
+    assert second.translation == "translated-1"
+    assert second._processor_log == ["translate:nllb"]
+
+
+def test_translate_processor_bulk_empty_skips_model(monkeypatch):
+    monkeypatch.setitem(sys.modules, "torch", _FakeTorch())
+    monkeypatch.setitem(
+        sys.modules,
+        "transformers",
+        SimpleNamespace(
+            AutoTokenizer=_FakeAutoTokenizer,
+            AutoModelForSeq2SeqLM=_FakeAutoModelForSeq2SeqLM,
+        ),
+    )
+
+    proc = NLLBTranslateProcessor(lang="tur", config={"tgt_lang": "eng"})
+    proc.load("/tmp/fake-models")
+
+    def fail(texts):
+        raise AssertionError("model called on an empty batch")
+
+    monkeypatch.setattr(proc, "_generate", fail)
+    assert proc.bulk_process([]) == []
+
+
+def test_translate_processor_dtype_and_inference_mode(monkeypatch):
+    load_kwargs = []
+    modes = []
+
+    class _RecordingAutoModel:
+        @staticmethod
+        def from_pretrained(*args, **kwargs):
+            load_kwargs.append(kwargs)
+            return _FakeModel()
+
+    def inference_mode():
+        modes.append("inference_mode")
+        return _NoGrad()
+
+    fake_torch = SimpleNamespace(float16="fp16", no_grad=_NoGrad, inference_mode=inference_mode)
+    monkeypatch.setitem(sys.modules, "torch", fake_torch)
+    monkeypatch.setitem(
+        sys.modules,
+        "transformers",
+        SimpleNamespace(
+            AutoTokenizer=_FakeAutoTokenizer,
+            AutoModelForSeq2SeqLM=_RecordingAutoModel,
+        ),
+    )
+
+    proc = NLLBTranslateProcessor(lang="tur", config={"tgt_lang": "eng", "dtype": "float16"})
+    proc.load("/tmp/fake-models")
+    proc.process(Document(text="Merhaba", lang="tur"))
+
+    assert load_kwargs == [{"torch_dtype": "fp16"}]
+    assert modes == ["inference_mode"]
+
+
+def test_translate_processor_ctranslate2_backend(monkeypatch, tmp_path):
+    calls = {}
+
+    class _Converter:
+        def __init__(self, load_from):
+            calls["convert_from"] = load_from
+
+        def convert(self, output_dir, quantization=None):
+            calls["convert"] = (output_dir, quantization)
+
+    class _Translator:
+        def __init__(self, model_dir, device=None, compute_type=None):
+            calls["translator"] = (model_dir, device, compute_type)
+
+        def translate_batch(
+            self, source, target_prefix=None, beam_size=None, max_decoding_length=None
+        ):
+            calls["batch"] = (source, target_prefix, beam_size)
+            return [
+                SimpleNamespace(hypotheses=[["eng_Latn", "▁Hi", str(i)]])
+                for i, _ in enumerate(source)
+            ]
+
+    class _Ct2Tokenizer(_FakeTokenizer):
+        def encode(self, text, truncation=None):
+            return [len(text)]
+
+        def convert_ids_to_tokens(self, ids):
+            return [f"tok{i}" for i in ids]
+
+        def convert_tokens_to_ids(self, tokens):
+            if isinstance(tokens, str):
+                return super().convert_tokens_to_ids(tokens)
+            return list(tokens)
+
+        def decode(self, ids, skip_special_tokens=True):
+            return " ".join(ids)
+
+    class _Ct2AutoTokenizer:
+        @staticmethod
+        def from_pretrained(*args, **kwargs):
+            return _Ct2Tokenizer()
+
+    monkeypatch.setitem(sys.modules, "torch", _FakeTorch())
+    monkeypatch.setitem(
+        sys.modules,
+        "transformers",
+        SimpleNamespace(
+            AutoTokenizer=_Ct2AutoTokenizer,
+            AutoModelForSeq2SeqLM=_FakeAutoModelForSeq2SeqLM,
+        ),
+    )
+    monkeypatch.setitem(
+        sys.modules,
+        "ctranslate2",
+        SimpleNamespace(
+            converters=SimpleNamespace(TransformersConverter=_Converter),
+            Translator=_Translator,
+            get_cuda_device_count=lambda: 0,
+        ),
+    )
+
+    ct2_dir = tmp_path / "ct2"
+    proc = NLLBCTranslate2Processor(
+        lang="tur", config={"tgt_lang": "eng", "ct2_model_dir": str(ct2_dir)}
+    )
+    proc.load(str(tmp_path))
+    out = proc.process(Document(text="Merhaba", lang="tur"))
+
+    assert calls["convert"] == (str(ct2_dir), "int8")
+    assert calls["translator"] == (str(ct2_dir), "cpu", "int8")
+    assert calls["batch"] == ([["tok7"]], [["eng_Latn"]], 4)
+    assert out.translation == "▁Hi 0"
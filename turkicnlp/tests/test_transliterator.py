@@ -5,7 +5,7 @@ from __future__ import annotations
 import pytest
 
 from turkicnlp.scripts import Script
-from turkicnlp.scripts.transliterator import Transliterator, TRANSLITERATION_TABLES
+from turkicnlp.scripts.transliterator import Transliterator, TRANSLITERATION_TABLES, _expand_cased
 
 
 class TestKazakhTransliteration:
@@ -27,6 +27,38 @@ class TestKazakhTransliteration:
         with pytest.raises(ValueError, match="No transliteration table"):
             Transliterator("kaz", Script.PERSO_ARABIC, Script.LATIN)
 
+    def test_same_script_is_identity(self) -> None:
+        t = Transliterator("kaz", Script.CYRILLIC, Script.CYRILLIC)
+        text = "Қазақстан"
+        assert t.transliterate(text) is text
+        assert t.transliterate_batch(["бір", "екі"]) == ["бір", "екі"]
+
+    def test_ascii_text_passes_through_cyrillic_source(self) -> None:
+        t = Transliterator("kaz", Script.CYRILLIC, Script.LATIN)
+        text = "https://example.org/?q=1"
+        assert t.transliterate(text) is text
+        u = Transliterator("uig", Script.PERSO_ARABIC, Script.LATIN)
+        assert u.transliterate("ABC") == "abj"
+
+    def test_characters_outside_table_are_kept(self) -> None:
+        t = Transliterator("kaz", Script.CYRILLIC, Script.LATIN)
+        assert t.transliterate("қ€ԱӁ\U00010C00") == "q€ԱӁ\U00010C00"
+
+    def test_reverse_map_skips_dropped_letters(self) -> None:
+        t = Transliterator("kaz", Script.CYRILLIC, Script.LATIN)
+        assert "" not in t.reverse_map
+        assert t.reverse_map["q"] == ["қ"]
+
+    def test_reverse_map_keeps_every_source(self) -> None:
+        t = Transliterator("kaz", Script.CYRILLIC, Script.LATIN)
+        assert t.reverse_map["h"] == ["һ", "х"]
+
+    def test_instances_share_compiled_table(self) -> None:
+        a = Transliterator("kaz", Script.LATIN, Script.CYRILLIC)
+        b = Transliterator("kaz", Script.LATIN, Script.CYRILLIC)
+        assert a._pattern is b._pattern
+        assert a._forward_map is b._forward_map
+
 
 class TestUzbekTransliteration:
     def test_cyrl_to_latn(self) -> None:
@@ -57,6 +89,13 @@ class TestUzbekTransliteration:
         assert t.transliterate("Океан") == "Okean"
         assert t.transliterate("ае") == "aye"
 
+    def test_cyrl_to_latn_e_after_non_letter(self) -> None:
+        t = Transliterator("uzb", Script.CYRILLIC, Script.LATIN)
+        assert t.transliterate("(ер)") == "(yer)"
+        assert t.transliterate("2ел") == "2yel"
+        assert t.transliterate("Ер ер") == "Yer yer"
+        assert t.transliterate("сЕн") == "sEn"
+
     def test_latn_to_cyrl_apostrophe_variants(self) -> None:
         t = Transliterator("uzb", Script.LATIN, Script.CYRILLIC)
         assert t.transliterate("O‘zbekiston") == "Ўзбекистон"
@@ -368,15 +407,56 @@ class TestAllTablesPresent:
     def test_all_transliterate_pairs_have_tables(self) -> None:
         from turkicnlp.scripts import LANGUAGE_SCRIPTS
 
-        missing = []
-        for lang, config in LANGUAGE_SCRIPTS.items():
-            if config.can_transliterate:
-                for src, tgt in config.can_transliterate:
-                    key = f"{lang}_{src.value}_to_{tgt.value}"
-                    if key not in TRANSLITERATION_TABLES:
-                        missing.append(key)
+        expected = {
+            f"{lang}_{src.value}_to_{tgt.value}"
+            for lang, config in LANGUAGE_SCRIPTS.items()
+            for src, tgt in config.can_transliterate
+        }
+        missing = sorted(expected - TRANSLITERATION_TABLES.keys())
         assert missing == [], f"Missing transliteration tables: {missing}"
 
+    def test_tables_are_read_only(self) -> None:
+        with pytest.raises(TypeError):
+            TRANSLITERATION_TABLES["kaz_Cyrl_to_Latn"]["а"] = "x"  # type: ignore[index]
+        with pytest.raises(TypeError):
+            TRANSLITERATION_TABLES["xxx_Latn_to_Cyrl"] = {}  # type: ignore[index]
+
+
+class TestCaseExpansion:
+    def test_exact_key_wins_over_case_variant(self) -> None:
+        cased = _expand_cased({"sh": "ш", "Sh": "X"})
+        assert cased["Sh"] == "X"
+        assert cased["SH"] == "Ш"
+        assert cased["sH"] == "ш"
+
+    def test_dotless_i_has_no_ascii_variant(self) -> None:
+        assert _expand_cased({"ı": "і"}) == {"ı": "і"}
+
+    def test_mixed_case_digraphs(self) -> None:
+        t = Transliterator("kaz", Script.LATIN, Script.CYRILLIC)
+        assert t.transliterate("SHCH sHch sH tS") == "Щ щ ш ц"
+
+
+class TestTransliterateBatch:
+    def test_matches_per_text_calls(self) -> None:
+        t = Transliterator("uzb", Script.CYRILLIC, Script.LATIN)
+        texts = ["ел", "", "Ўзбекистон", "ае", "Европа"]
+        assert t.transliterate_batch(texts) == [t.transliterate(x) for x in texts]
+
+    def test_each_text_starts_at_a_boundary(self) -> None:
+        t = Transliterator("tuk", Script.CYRILLIC, Script.LATIN)
+        assert t.transliterate_batch(["мен", "ел"]) == ["men", "ýel"]
+
+    def test_empty_and_fallbacks(self) -> None:
+        t = Transliterator("uig", Script.LATIN, Script.PERSO_ARABIC)
+        assert t.transliterate_batch([]) == []
+        assert t.transliterate_batch(["alma", "ata"]) == [
+            t.transliterate("alma"),
+            t.transliterate("ata"),
+        ]
+        k = Transliterator("kaz", Script.CYRILLIC, Script.LATIN)
+        assert k.transliterate_batch(["а\x00б", "в"]) == ["a\x00b", "v"]
+
 
 class TestUyghurMultiScript:
     """Uyghur multi-script transliteration tests.
@@ -2,7 +2,81 @@
 
 from __future__ import annotations
 
-from typing import Optional
+from array import array
+from typing import BinaryIO, Iterator, Optional
+
+import numpy as np
+
+# CoNLL-U column indices.
+_UPOS, _XPOS, _FEATS, _HEAD, _DEPREL = 3, 4, 5, 6, 7
+
+# Universal relations counted by CLAS (CoNLL 2018 shared task definition).
+_CONTENT_DEPRELS = frozenset(
+    b"nsubj obj iobj csubj ccomp xcomp obl vocative expl dislocated advcl advmod "
+    b"discourse nmod appos nummod acl amod conj fixed flat compound list parataxis "
+    b"orphan goeswith reparandum root dep".split()
+)
+
+
+def _word_lines(f: BinaryIO) -> Iterator[list[bytes]]:
+    """Yield the tab-split columns of each syntactic word line in a CoNLL-U file.
+
+    Comments, blank lines, multiword token ranges (``1-2``) and empty nodes
+    (``1.1``) are skipped. Lines stay as bytes: the compared columns are ASCII.
+    """
+    for line in f:
+        if line[:1] in b"#\r\n":
+            continue
+        fields = line.rstrip(b"\r\n").split(b"\t")
+        if b"-" in fields[0] or b"." in fields[0]:
+            continue
+        yield fields
+
+
+def _aligned_words(gold: BinaryIO, pred: BinaryIO) -> Iterator[tuple[list[bytes], list[bytes]]]:
+    """Pair gold and predicted word lines, requiring identical tokenization."""
+    gold_words = _word_lines(gold)
+    pred_words = _word_lines(pred)
+    for g in gold_words:
+        p = next(pred_words, None)
+        if p is None:
+            raise ValueError("Predicted file has fewer words than the gold file.")
+        if g[1] != p[1]:
+            raise ValueError(
+                f"Tokenization mismatch: gold {g[1].decode('utf-8', 'replace')!r} "
+                f"vs predicted {p[1].decode('utf-8', 'replace')!r}."
+            )
+        yield g, p
+    if next(pred_words, None) is not None:
+        raise ValueError("Predicted file has more words than the gold file.")
+
+
+def _encode_columns(
+    gold_path: str, pred_path: str, columns: tuple[int, ...]
+) -> tuple[np.ndarray, np.ndarray, dict[bytes, int]]:
+    """Scan both files once and intern the requested columns as integer codes.
+
+    Gold and predicted values share one code table, so equal strings get equal
+    codes and the metrics reduce to array comparisons.
+
+    Returns:
+        ``(gold, pred, codes)`` where ``gold`` and ``pred`` have shape
+        ``(n_words, len(columns))``.
+    """
+    codes: dict[bytes, int] = {}
+    gold_codes = array("i")
+    pred_codes = array("i")
+    with open(gold_path, "rb") as gold, open(pred_path, "rb") as pred:
+        for g, p in _aligned_words(gold, pred):
+            for column in columns:
+                gold_codes.append(codes.setdefault(g[column], len(codes)))
+                pred_codes.append(codes.setdefault(p[column], len(codes)))
+    width = len(columns)
+    return (
+        np.frombuffer(gold_codes, dtype=np.intc).reshape(-1, width),
+        np.frombuffer(pred_codes, dtype=np.intc).reshape(-1, width),
+        codes,
+    )
 
 
 def evaluate_pos(
@@ -10,6 +84,9 @@ def evaluate_pos(
 ) -> dict[str, float]:
     """Evaluate POS tagging accuracy.
 
+    Both files are streamed line by line and must share the same
+    tokenization.
+
     Args:
         gold_path: Path to gold-standard CoNLL-U file.
         pred_path: Path to predicted CoNLL-U file.
@@ -17,8 +94,19 @@ def evaluate_pos(
 
     Returns:
         Dict with ``upos_acc``, ``feats_acc``, ``all_tags_acc``.
+
+    Raises:
+        ValueError: If the two files are not tokenized identically.
     """
-    raise NotImplementedError("evaluate_pos() not yet implemented.")
+    gold, pred, _ = _encode_columns(gold_path, pred_path, (_UPOS, _XPOS, _FEATS))
+    match = gold == pred
+    total = len(match) or 1
+    upos_ok, feats_ok = match[:, 0], match[:, 2]
+    return {
+        "upos_acc": int(upos_ok.sum()) / total,
+        "feats_acc": int(feats_ok.sum()) / total,
+        "all_tags_acc": int(match.all(axis=1).sum()) / total,
+    }
 
 
 def evaluate_depparse(
@@ -26,6 +114,10 @@ def evaluate_depparse(
 ) -> dict[str, float]:
     """Evaluate dependency parsing.
 
+    Both files are streamed line by line and must share the same
+    tokenization. Relation subtypes (``obl:tmod``) are ignored, as in the
+    CoNLL 2018 shared task.
+
     Args:
         gold_path: Path to gold-standard CoNLL-U file.
         pred_path: Path to predicted CoNLL-U file.
@@ -33,8 +125,31 @@ def evaluate_depparse(
 
     Returns:
         Dict with ``uas``, ``las``, ``clas``.
+
+    Raises:
+        ValueError: If the two files are not tokenized identically.
     """
-    raise NotImplementedError("evaluate_depparse() not yet implemented.")
+    gold, pred, codes = _encode_columns(gold_path, pred_path, (_HEAD, _DEPREL))
+    # Per-code lookup tables, so subtype stripping runs once per distinct label.
+    universal = np.zeros(len(codes), dtype=np.intc)
+    content = np.zeros(len(codes), dtype=bool)
+    base_codes: dict[bytes, int] = {}
+    for value, code in codes.items():
+        base = value.split(b":", 1)[0]
+        universal[code] = base_codes.setdefault(base, len(base_codes))
+        content[code] = base in _CONTENT_DEPRELS
+
+    gold_rel, pred_rel = gold[:, 1], pred[:, 1]
+    head_ok = gold[:, 0] == pred[:, 0]
+    label_ok = head_ok & (universal[gold_rel] == universal[pred_rel])
+    gold_content = content[gold_rel]
+    content_words = int(gold_content.sum()) + int(content[pred_rel].sum())
+    total = len(head_ok) or 1
+    return {
+        "uas": int(head_ok.sum()) / total,
+        "las": int(label_ok.sum()) / total,
+        "clas": 2 * int((label_ok & gold_content).sum()) / (content_words or 1),
+    }
 
 
 def evaluate_ner(
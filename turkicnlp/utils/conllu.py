@@ -7,11 +7,20 @@ and write annotated documents back to CoNLL-U format.
 
 from __future__ import annotations
 
+import gc
+import mmap
+import os
+import sys
 from pathlib import Path
-from typing import Optional, Union
+from typing import Iterator, Optional, Union
 
 from turkicnlp.models.document import Document, Sentence, Token, Word
 
+# Comment keys read by the parser: ``# text = ...``, ``# lang = ...`` and
+# ``# script = ...``; any other comment is skipped.
+_COMMENT_KEYS = frozenset({"text", "lang", "script"})
+_NEWDOC = b"# newdoc"
+
 
 def parse_conllu(text: str) -> Document:
     """Parse a CoNLL-U formatted string into a :class:`Document`.
@@ -41,17 +50,19 @@ def parse_conllu(text: str) -> Document:
         current_text = None
 
     for line in text.splitlines():
-        line = line.rstrip("\n")
         if not line:
             _flush_sentence()
             continue
-        if line.startswith("#"):
-            if line.startswith("# text = "):
-                current_text = line.split("=", 1)[1].strip()
-            elif line.startswith("# lang = "):
-                doc.lang = line.split("=", 1)[1].strip()
-            elif line.startswith("# script = "):
-                doc.script = line.split("=", 1)[1].strip()
+        if line[0] == "#":
+            # One partition per comment, then dispatch on the key.
+            key, sep, value = line[2:].partition(" = ")
+            if sep and line[1] == " " and key in _COMMENT_KEYS:
+                if key == "text":
+                    current_text = value.strip()
+                elif key == "lang":
+                    doc.lang = value.strip()
+                else:
+                    doc.script = value.strip()
             continue
 
         fields = line.split("\t")
@@ -59,39 +70,48 @@ def parse_conllu(text: str) -> Document:
             continue
 
         tok_id = fields[0]
-        if "-" in tok_id:
-            try:
-                start, end = tok_id.split("-", 1)
-                pending_mwt = Token(id=(int(start), int(end)), text=fields[1])
-            except ValueError:
-                continue
-            continue
-        if "." in tok_id:
+        if not tok_id.isdecimal():
+            if "-" in tok_id:
+                try:
+                    start, end = tok_id.split("-", 1)
+                    pending_mwt = Token(id=(int(start), int(end)), text=fields[1])
+                except ValueError:
+                    continue
+            # Empty nodes (``1.1``) and malformed IDs are skipped.
             continue
-
-        try:
-            wid = int(tok_id)
-        except ValueError:
-            continue
-
-        misc = fields[9] if fields[9] != "_" else None
+        wid = int(tok_id)
+
+        # One pass maps every "_" column to None.
+        lemma, upos, xpos, feats, head, deprel, deps, misc = [
+            None if f == "_" else f for f in fields[2:]
+        ]
+        # Tag columns come from small vocabularies; interning keeps one
+        # string per distinct value instead of one per word.
+        if upos:
+            upos = sys.intern(upos)
+        if xpos:
+            xpos = sys.intern(xpos)
+        if feats:
+            feats = sys.intern(feats)
+        if deprel:
+            deprel = sys.intern(deprel)
         script = None
-        if misc:
+        if misc and "Script=" in misc:
             for part in misc.split("|"):
                 if part.startswith("Script="):
-                    script = part.split("=", 1)[1]
+                    script = sys.intern(part.split("=", 1)[1])
                     break
 
         word = Word(
             id=wid,
             text=fields[1],
-            lemma=None if fields[2] == "_" else fields[2],
-            upos=None if fields[3] == "_" else fields[3],
-            xpos=None if fields[4] == "_" else fields[4],
-            feats=None if fields[5] == "_" else fields[5],
-            head=None if fields[6] == "_" else int(fields[6]),
-            deprel=None if fields[7] == "_" else fields[7],
-            deps=None if fields[8] == "_" else fields[8],
+            lemma=lemma,
+            upos=upos,
+            xpos=xpos,
+            feats=feats,
+            head=None if head is None else int(head),
+            deprel=deprel,
+            deps=deps,
             misc=misc,
             script=script,
         )
@@ -113,6 +133,55 @@ def parse_conllu(text: str) -> Document:
     return doc
 
 
+def _parse_bulk(text: str) -> Document:
+    """:func:`parse_conllu` with the cyclic GC paused, for file readers.
+
+    Parsing allocates several container objects per word and no cycles;
+    with the GC running, most of the time goes to rescanning the growing
+    document. The pause covers one parse only and never spans a ``yield``.
+    """
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        return parse_conllu(text)
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+
+def iter_conllu(path: Union[str, Path]) -> Iterator[Document]:
+    """Lazily read a CoNLL-U file, one document at a time.
+
+    The file is memory-mapped and split on ``# newdoc`` markers, so only the
+    document being parsed is decoded; a file without markers is one document.
+
+    Args:
+        path: Path to a ``.conllu`` file.
+
+    Yields:
+        One :class:`Document` per ``# newdoc`` section.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield _parse_bulk("")
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            start = mm.find(_NEWDOC)
+            if start == -1:
+                yield _parse_bulk(mm[:].decode("utf-8"))
+                return
+            # Text before the first marker is a document of its own.
+            bounds = [(0, start)]
+            while start != -1:
+                end = mm.find(_NEWDOC, start + len(_NEWDOC))
+                bounds.append((start + len(_NEWDOC), len(mm) if end == -1 else end))
+                start = end
+            for begin, end in bounds:
+                part = mm[begin:end].decode("utf-8")
+                if part.strip():
+                    yield _parse_bulk(part)
+
+
 def read_conllu(path: Union[str, Path]) -> list[Document]:
     """Read a CoNLL-U file and return a list of documents.
 
@@ -122,18 +191,7 @@ def read_conllu(path: Union[str, Path]) -> list[Document]:
     Returns:
         List of :class:`Document` objects.
     """
-    with open(path, "r", encoding="utf-8") as f:
-        data = f.read()
-
-    docs: list[Document] = []
-    if "# newdoc" in data:
-        parts = data.split("# newdoc")
-        for part in parts:
-            if part.strip():
-                docs.append(parse_conllu(part))
-    else:
-        docs.append(parse_conllu(data))
-    return docs
+    return list(iter_conllu(path))
 
 
 def write_conllu(doc: Document, path: Union[str, Path]) -> None:
@@ -143,5 +201,7 @@ def write_conllu(doc: Document, path: Union[str, Path]) -> None:
         doc: The document to export.
         path: Output file path.
     """
-    with open(path, "w", encoding="utf-8") as f:
-        f.write(doc.to_conllu())
+    # Sentences are written as they are serialized; the large buffer keeps
+    # the number of write calls low.
+    with open(path, "w", encoding="utf-8", buffering=1 << 20) as f:
+        f.writelines(doc.iter_conllu_blocks())
@@ -7,8 +7,36 @@ NFC/NFD normalization, and character confusables.
 
 from __future__ import annotations
 
+import functools
+import re
+import sys
 import unicodedata
 
+_TURKISH_I = str.maketrans({"I": "ı", "İ": "i"})
+
+
+@functools.lru_cache(maxsize=None)
+def _combining_pattern() -> re.Pattern[str]:
+    """Match runs of characters for which ``unicodedata.combining()`` is true.
+
+    The class is built from Python's own Unicode database, the one NFKD
+    uses, rather than a regex-engine property with its own Unicode version.
+    Built on first use, since scanning every codepoint takes ~0.1 s.
+    """
+    ranges: list[str] = []
+    start = prev = -1
+    for cp in range(sys.maxunicode + 1):
+        if not unicodedata.combining(chr(cp)):
+            continue
+        if cp != prev + 1:
+            if start >= 0:
+                ranges.append(f"{re.escape(chr(start))}-{re.escape(chr(prev))}")
+            start = cp
+        prev = cp
+    if start >= 0:
+        ranges.append(f"{re.escape(chr(start))}-{re.escape(chr(prev))}")
+    return re.compile(f"[{''.join(ranges)}]+")
+
 
 def normalize_nfc(text: str) -> str:
     """Apply NFC Unicode normalization.
@@ -34,14 +62,15 @@ def normalize_turkish_i(text: str) -> str:
     Returns:
         Text with Turkish-correct lowercase mapping.
     """
-    result = text.replace("I", "ı").replace("İ", "i")
-    return result
+    return text.translate(_TURKISH_I)
 
 
+@functools.lru_cache(maxsize=1 << 16)
 def strip_diacritics(text: str) -> str:
     """Remove combining diacritical marks from text.
 
-    Useful for approximate matching and search.
+    Useful for approximate matching and search. Results are cached, since
+    the typical input is a word form and word forms repeat heavily.
 
     Args:
         text: Input text.
@@ -49,5 +78,4 @@ def strip_diacritics(text: str) -> str:
     Returns:
         Text with diacritics removed.
     """
-    nfkd = unicodedata.normalize("NFKD", text)
-    return "".join(c for c in nfkd if not unicodedata.combining(c))
+    return _combining_pattern().sub("", unicodedata.normalize("NFKD", text))